@@ -1,14 +1,14 @@
 import { DocsSidebar } from "@/components/docs/docs-sidebar";
 import { MobileDocsNav } from "@/components/docs/mobile-docs-nav";
 import { ThemeToggle } from "@/components/theme-toggle";
-import { buildDocsSearchIndex } from "@/lib/docs-search";
+import { getDocsSearchIndex } from "@/lib/docs-search";
 
 export default async function DocsLayout({
   children,
 }: {
   children: React.ReactNode;
 }) {
-  const searchIndex = await buildDocsSearchIndex();
+  const searchIndex = await getDocsSearchIndex();
   return (
     <div className="flex min-h-screen">
       {/* Sidebar Navigation - Desktop */}
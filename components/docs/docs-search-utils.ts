@@ -1,4 +1,4 @@
-import type { DocsSearchEntry } from "@/lib/docs-search";
+import type { DocsSearchIndex } from "@/lib/docs-search";
 
 export type DocsSearchHit = {
   /** Slug of the matched section; empty for the page-top chunk. */
@@ -35,28 +35,68 @@ export function buildHitHref(
   return `${pageHref}${q}${frag}`;
 }
 
+/** Lower-cased words of a query: runs of letters and digits. */
+function queryWords(query: string): string[] {
+  return query.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? [];
+}
+
+// First index of the sorted `terms` that is >= `key`.
+function lowerBound(terms: string[], key: string, lo = 0): number {
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (terms[mid] < key) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/** Entries with a term starting with `word`. */
+function entriesWithPrefix(index: DocsSearchIndex, word: string): Set<number> {
+  const lo = lowerBound(index.terms, word);
+  const hi = lowerBound(index.terms, word + "\uffff", lo);
+  const ids = new Set<number>();
+  for (let i = lo; i < hi; i++) {
+    for (const id of index.postings[i]) ids.add(id);
+  }
+  return ids;
+}
+
 /**
- * Substring search across heading + content, returning one or more hits per
- * page (grouped so the UI can show "Page Title › Section heading" entries).
- * Sections within a page keep their original order; pages keep their
- * docs-config order.
+ * Search the prebuilt index: a chunk matches when every query word starts
+ * one of its terms (words, and the parts of camel-case words like
+ * `IfcWallType`), looked up by binary search rather than by scanning the
+ * content. Results come back grouped per page (so the UI can show "Page
+ * Title › Section heading" entries); sections within a page keep their
+ * original order, pages keep their docs-config order.
  */
 export function searchDocs(
   query: string,
-  index: DocsSearchEntry[],
+  index: DocsSearchIndex,
 ): DocsSearchPageResult[] {
   const q = query.trim().toLowerCase();
-  if (!q) return [];
+  const words = queryWords(q);
+  if (!q || words.length === 0) return [];
+
+  let matched: Set<number> | null = null;
+  for (const word of words) {
+    const ids = entriesWithPrefix(index, word);
+    matched = matched ? new Set([...matched].filter((id) => ids.has(id))) : ids;
+  }
+  for (const id of index.unindexed) {
+    const entry = index.entries[id];
+    const text = `${entry.heading} ${entry.content}`.toLowerCase();
+    if (words.every((word) => text.includes(word))) matched!.add(id);
+  }
 
   const pageOrder: string[] = [];
   const byHref = new Map<string, DocsSearchPageResult>();
 
-  for (const entry of index) {
-    const inHeading = entry.heading.toLowerCase().includes(q);
-    const inContent = entry.content.toLowerCase().includes(q);
+  index.entries.forEach((entry, id) => {
+    const inChunk = matched!.has(id);
     const inSection = entry.section.toLowerCase().includes(q);
     const inPageTitle = entry.pageTitle.toLowerCase().includes(q);
-    if (!inHeading && !inContent && !inSection && !inPageTitle) continue;
+    if (!inChunk && !inSection && !inPageTitle) return;
 
     if (!byHref.has(entry.href)) {
       byHref.set(entry.href, {
@@ -69,13 +109,17 @@ export function searchDocs(
     }
 
     const page = byHref.get(entry.href)!;
-    if (inHeading || inContent) {
+    if (inChunk) {
       // Real chunk-level hit: link straight to the heading.
+      const heading = entry.heading.toLowerCase();
+      const content = entry.content.toLowerCase();
       page.hits.push({
         slug: entry.slug,
         heading: entry.heading,
-        snippet: inContent ? makeSnippet(entry.content, q) : undefined,
-        headingMatch: inHeading,
+        snippet: words.every((word) => content.includes(word))
+          ? makeSnippet(entry.content, content, q, words)
+          : undefined,
+        headingMatch: words.every((word) => heading.includes(word)),
       });
     } else if (page.hits.length === 0) {
       // Section name or page title matched, but this chunk's body didn't.
@@ -83,16 +127,19 @@ export function searchDocs(
       // — without duplicating it for every chunk on the page.
       page.hits.push({ slug: "", heading: "", headingMatch: false });
     }
-  }
+  });
 
   return pageOrder.map((href) => byHref.get(href)!);
 }
 
 const SNIPPET_LENGTH = 140;
 
-function makeSnippet(content: string, lowerQuery: string): string {
-  const lower = content.toLowerCase();
-  const idx = lower.indexOf(lowerQuery);
+function makeSnippet(content: string, lower: string, lowerQuery: string, words: string[]): string {
+  let idx = lower.indexOf(lowerQuery);
+  for (const word of words) {
+    if (idx !== -1) break;
+    idx = lower.indexOf(word);
+  }
   if (idx === -1) {
     return content.slice(0, SNIPPET_LENGTH) + (content.length > SNIPPET_LENGTH ? "…" : "");
   }
@@ -4,7 +4,7 @@ import { useMemo, useState } from "react";
 import Link from "next/link";
 import { usePathname } from "next/navigation";
 import { docsConfig } from "@/lib/docs-config";
-import type { DocsSearchEntry } from "@/lib/docs-search";
+import type { DocsSearchIndex } from "@/lib/docs-search";
 import { buildHitHref, searchDocs } from "@/components/docs/docs-search-utils";
 import { cn } from "@/lib/utils";
 import { ScrollArea } from "@/components/ui/scroll-area";
@@ -14,7 +14,7 @@ import { Input } from "@/components/ui/input";
 
 interface DocsSidebarProps {
   /** Server-built full-text search index passed down from the docs layout. */
-  searchIndex: DocsSearchEntry[];
+  searchIndex: DocsSearchIndex;
 }
 
 export function DocsSidebar({ searchIndex }: DocsSidebarProps) {
@@ -5,7 +5,7 @@ import { createPortal } from "react-dom";
 import Link from "next/link";
 import { usePathname } from "next/navigation";
 import { docsConfig } from "@/lib/docs-config";
-import type { DocsSearchEntry } from "@/lib/docs-search";
+import type { DocsSearchIndex } from "@/lib/docs-search";
 import { buildHitHref, searchDocs } from "@/components/docs/docs-search-utils";
 import { cn } from "@/lib/utils";
 import { Menu, X, Search } from "lucide-react";
@@ -13,7 +13,7 @@ import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 
 interface MobileDocsNavProps {
-  searchIndex: DocsSearchEntry[];
+  searchIndex: DocsSearchIndex;
 }
 
 export function MobileDocsNav({ searchIndex }: MobileDocsNavProps) {
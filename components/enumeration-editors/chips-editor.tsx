@@ -10,10 +10,15 @@ import { X, Plus } from "lucide-react"
 interface EnumerationChipsEditorProps {
     values: string[]
     onChange: (values: string[]) => void
+    /** Values the standard enumeration of `standardProperty` doesn't list. */
+    nonStandard?: string[]
+    /** "Pset.Property" whose standard enumeration `nonStandard` was checked against. */
+    standardProperty?: string
 }
 
-export function EnumerationChipsEditor({ values, onChange }: EnumerationChipsEditorProps) {
+export function EnumerationChipsEditor({ values, onChange, nonStandard = [], standardProperty }: EnumerationChipsEditorProps) {
     const [newValue, setNewValue] = useState("")
+    const nonStandardSet = useMemo(() => new Set(nonStandard), [nonStandard])
     const [containerWidth, setContainerWidth] = useState(0)
     const containerRef = useRef<HTMLDivElement>(null)
 
@@ -92,13 +97,14 @@ export function EnumerationChipsEditor({ values, onChange }: EnumerationChipsEdi
                             const maxLength = getTruncationLength
                             const isLong = value.length > maxLength
                             const displayText = truncateText(value)
+                            const isNonStandard = nonStandardSet.has(value)
 
                             return (
                                 <Tooltip key={index}>
                                     <TooltipTrigger asChild>
                                         <Badge
-                                            variant="secondary"
-                                            className="flex items-center gap-1 px-2 py-1 text-xs max-w-[200px] min-w-0"
+                                            variant={isNonStandard ? "outline" : "secondary"}
+                                            className={`flex items-center gap-1 px-2 py-1 text-xs max-w-[200px] min-w-0${isNonStandard ? " border-amber-500 text-amber-600 dark:text-amber-400" : ""}`}
                                         >
                                             <span className="truncate flex-1 min-w-0">{displayText}</span>
                                             <Button
@@ -111,9 +117,10 @@ export function EnumerationChipsEditor({ values, onChange }: EnumerationChipsEdi
                                             </Button>
                                         </Badge>
                                     </TooltipTrigger>
-                                    {isLong && (
+                                    {(isLong || isNonStandard) && (
                                         <TooltipContent side="top" className="max-w-md">
-                                            <p className="font-mono text-sm break-words whitespace-pre-wrap">{value}</p>
+                                            {isLong && <p className="font-mono text-sm break-words whitespace-pre-wrap">{value}</p>}
+                                            {isNonStandard && <p className="text-xs">Not in the standard enumeration</p>}
                                         </TooltipContent>
                                     )}
                                 </Tooltip>
@@ -122,6 +129,14 @@ export function EnumerationChipsEditor({ values, onChange }: EnumerationChipsEdi
                     </div>
                 )}
 
+                {/* Values the standard enumeration doesn't list */}
+                {nonStandard.length > 0 && standardProperty && (
+                    <p className="text-xs text-amber-600 dark:text-amber-400">
+                        {nonStandard.length === 1 ? "1 value isn't" : `${nonStandard.length} values aren't`} in
+                        the standard enumeration of <span className="font-mono">{standardProperty}</span>
+                    </p>
+                )}
+
                 {/* Add new value input */}
                 <div className="flex gap-2 w-full">
                     <Input
@@ -11,10 +11,15 @@ import { X, Plus, Search, Trash2 } from "lucide-react"
 interface EnumerationListEditorProps {
     values: string[]
     onChange: (values: string[]) => void
+    /** Values the standard enumeration of `standardProperty` doesn't list. */
+    nonStandard?: string[]
+    /** "Pset.Property" whose standard enumeration `nonStandard` was checked against. */
+    standardProperty?: string
 }
 
-export function EnumerationListEditor({ values, onChange }: EnumerationListEditorProps) {
+export function EnumerationListEditor({ values, onChange, nonStandard = [], standardProperty }: EnumerationListEditorProps) {
     const [searchTerm, setSearchTerm] = useState("")
+    const nonStandardSet = useMemo(() => new Set(nonStandard), [nonStandard])
     const [newValue, setNewValue] = useState("")
     const [selectedItems, setSelectedItems] = useState<Set<number>>(new Set())
     const [containerWidth, setContainerWidth] = useState(0)
@@ -168,6 +173,7 @@ export function EnumerationListEditor({ values, onChange }: EnumerationListEdito
                                 const maxLength = getTruncationLength
                                 const isLong = value.length > maxLength
                                 const displayText = truncateText(value)
+                                const isNonStandard = nonStandardSet.has(value)
 
                                 return (
                                     <Tooltip key={originalIndex}>
@@ -178,7 +184,7 @@ export function EnumerationListEditor({ values, onChange }: EnumerationListEdito
                                                     onCheckedChange={() => handleItemSelect(originalIndex)}
                                                     className="flex-shrink-0"
                                                 />
-                                                <span className="flex-1 text-sm font-mono whitespace-nowrap overflow-hidden pr-2 min-w-0">{displayText}</span>
+                                                <span className={`flex-1 text-sm font-mono whitespace-nowrap overflow-hidden pr-2 min-w-0${isNonStandard ? " text-amber-600 dark:text-amber-400" : ""}`}>{displayText}</span>
                                                 <Button
                                                     variant="ghost"
                                                     size="sm"
@@ -189,9 +195,10 @@ export function EnumerationListEditor({ values, onChange }: EnumerationListEdito
                                                 </Button>
                                             </div>
                                         </TooltipTrigger>
-                                        {isLong && (
+                                        {(isLong || isNonStandard) && (
                                             <TooltipContent side="top" className="max-w-md">
-                                                <p className="font-mono text-sm break-words whitespace-pre-wrap">{value}</p>
+                                                {isLong && <p className="font-mono text-sm break-words whitespace-pre-wrap">{value}</p>}
+                                                {isNonStandard && <p className="text-xs">Not in the standard enumeration</p>}
                                             </TooltipContent>
                                         )}
                                     </Tooltip>
@@ -201,6 +208,14 @@ export function EnumerationListEditor({ values, onChange }: EnumerationListEdito
                     </div>
                 </ScrollArea>
 
+                {/* Values the standard enumeration doesn't list */}
+                {nonStandard.length > 0 && standardProperty && (
+                    <p className="text-xs text-amber-600 dark:text-amber-400">
+                        {nonStandard.length === 1 ? "1 value isn't" : `${nonStandard.length} values aren't`} in
+                        the standard enumeration of <span className="font-mono">{standardProperty}</span>
+                    </p>
+                )}
+
                 {/* Add new value input */}
                 <div className="flex gap-2 w-full">
                     <Input
@@ -30,7 +30,14 @@ import {
   getAllEntities,
   getPropertySetsForEntityAsync,
   getAttributesForEntity,
+  getPropertySetDocumentation,
+  hasPropertySetDocumentation,
+  getSchemaCompleter,
+  findNonStandardEnumerationValues,
+  type CompletionKind,
   type IFCVersion,
+  type SchemaCompleter,
+  type SchemaDocumentation,
 } from "@/lib/ifc-schema"
 import { getEntityContext } from "@/lib/graph-utils"
 import {
@@ -161,6 +168,26 @@ async function cachedLoad<T>(key: string, loader: () => Promise<T>): Promise<T>
   return promise
 }
 
+// Prefix completer for the `kind` names of `ifcVersion` (see
+// getSchemaCompleter); undefined while loading or without a completion index,
+// in which case SearchableSelect falls back to Fuse.
+function useSchemaCompleter(ifcVersion: IFCVersion, kind: CompletionKind): SchemaCompleter | undefined {
+  const [complete, setComplete] = useState<SchemaCompleter>()
+  useEffect(() => {
+    let cancelled = false
+    setComplete(undefined)
+    cachedLoad(`completer:${ifcVersion}:${kind}`, () => getSchemaCompleter(ifcVersion, kind))
+      .then((completer) => {
+        if (!cancelled && completer) setComplete(() => completer)
+      })
+      .catch((error) => console.warn('Failed to load completion index:', error))
+    return () => {
+      cancelled = true
+    }
+  }, [ifcVersion, kind])
+  return complete
+}
+
 // Parse a bracketed list like "[R60, R90, R120]" into ["R60", "R90", "R120"].
 // Returns null when the input is not in bracketed form, so callers can keep
 // treating it as a single value.
@@ -207,6 +234,53 @@ function ConvertToRestrictionHint({
   )
 }
 
+// Template definitions of the selected standard pset / property, in the
+// browser's language when the PSD has a translation. The locale pack is only
+// fetched once a property set is selected, and nothing is shown until the
+// packs have been generated.
+function PropertySetDocs({ propertySet, baseName }: { propertySet?: string; baseName?: string }) {
+  const [docs, setDocs] = useState<{ pset?: SchemaDocumentation; prop?: SchemaDocumentation }>({})
+
+  useEffect(() => {
+    setDocs({})
+    if (!propertySet || typeof propertySet !== 'string') return
+    let cancelled = false
+    const locale = typeof navigator !== 'undefined' ? navigator.language : 'en'
+    const load = async () => {
+      if (!(await cachedLoad('psetDocsAvailable', hasPropertySetDocumentation))) return
+      const [pset, prop] = await Promise.all([
+        cachedLoad(`psetDocs:${locale}:${propertySet}`, () => getPropertySetDocumentation(propertySet, locale)),
+        baseName
+          ? cachedLoad(`propDocs:${locale}:${propertySet}:${baseName}`, () =>
+              getPropertySetDocumentation(propertySet, locale, baseName),
+            )
+          : Promise.resolve(undefined),
+      ])
+      if (!cancelled) setDocs({ pset, prop })
+    }
+    load().catch(() => {})
+    return () => {
+      cancelled = true
+    }
+  }, [propertySet, baseName])
+
+  if (!docs.pset?.definition && !docs.prop?.definition) return null
+  return (
+    <div className="flex gap-2 rounded-md bg-muted/40 p-2 text-xs text-muted-foreground">
+      <BookOpen className="h-3.5 w-3.5 mt-0.5 shrink-0" />
+      <div className="space-y-1">
+        {docs.pset?.definition && <p>{docs.pset.definition}</p>}
+        {docs.prop?.definition && (
+          <p>
+            <span className="font-medium text-foreground">{docs.prop.name || baseName}:</span>{" "}
+            {docs.prop.definition}
+          </p>
+        )}
+      </div>
+    </div>
+  )
+}
+
 // Helper function to check if a facet node is in the requirements section
 function isInRequirementsSection(nodeId: string, edges: GraphEdge[]): boolean {
   // Check if this node (or a restriction node it's connected to) targets a spec's requirements handle
@@ -506,7 +580,7 @@ export function InspectorPanel({
             {selectedNode.type === "classification" && <ClassificationFields node={selectedNode} onChange={handleChange} ifcVersion={ifcVersion} nodes={nodes} edges={edges} onConvertValueToRestriction={onConvertValueToRestriction} />}
             {selectedNode.type === "material" && <MaterialFields node={selectedNode} onChange={handleChange} ifcVersion={ifcVersion} nodes={nodes} edges={edges} onConvertValueToRestriction={onConvertValueToRestriction} />}
             {selectedNode.type === "partOf" && <PartOfFields node={selectedNode} onChange={handleChange} ifcVersion={ifcVersion} nodes={nodes} edges={edges} />}
-            {selectedNode.type === "restriction" && <RestrictionFields node={selectedNode} onChange={handleChange} ifcVersion={ifcVersion} />}
+            {selectedNode.type === "restriction" && <RestrictionFields node={selectedNode} onChange={handleChange} ifcVersion={ifcVersion} nodes={nodes} edges={edges} />}
           </FieldIssueContext.Provider>
         </div>
       </ScrollArea>
@@ -676,6 +750,7 @@ function EntityFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node
 
   // Load comprehensive entities from schema
   const [allEntities, setAllEntities] = useState<SearchableSelectOption[]>([])
+  const completeEntity = useSchemaCompleter(ifcVersion, 'entity')
   const [loading, setLoading] = useState(true)
   const [predefinedTypes, setPredefinedTypes] = useState<string[]>([])
 
@@ -730,6 +805,7 @@ function EntityFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node
         </Label>
         <SearchableSelect
           options={allEntities}
+          complete={completeEntity}
           value={data.name}
           onValueChange={(value) => {
             onChange("name", value)
@@ -809,6 +885,9 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
   const [allDataTypes, setAllDataTypes] = useState<any[]>([])
   const [loadedPropertySets, setLoadedPropertySets] = useState<any[]>([])
   const [loading, setLoading] = useState(true)
+  const completePset = useSchemaCompleter(ifcVersion, 'pset')
+  const completeProperty = useSchemaCompleter(ifcVersion, 'property')
+  const completeDataType = useSchemaCompleter(ifcVersion, 'datatype')
 
   // Get entity context from graph connections
   const entityContext = React.useMemo(() => {
@@ -827,8 +906,8 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
           getAllSimpleTypes(ifcVersion),
         )
         const psetsPromise = entityContext.entityName
-          ? cachedLoad(`psetsFor:${ifcVersion}:${entityContext.entityName}`, () =>
-              getPropertySetsForEntityAsync(entityContext.entityName, ifcVersion),
+          ? cachedLoad(`psetsFor:${ifcVersion}:${entityContext.entityName}:${entityContext.predefinedType ?? ''}`, () =>
+              getPropertySetsForEntityAsync(entityContext.entityName, ifcVersion, entityContext.predefinedType ?? undefined),
             )
           : cachedLoad(`allPsets:${ifcVersion}`, () => getAllPropertySets(ifcVersion))
         // Warm the property data type cache once per ifcVersion (any property name).
@@ -880,7 +959,7 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
     return () => {
       cancelled = true
     }
-  }, [entityContext.entityName, ifcVersion])
+  }, [entityContext.entityName, entityContext.predefinedType, ifcVersion])
 
   // Get properties for the selected property set
   const properties = React.useMemo(() => {
@@ -902,6 +981,28 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
     return getPropertiesForPropertySet(data.propertySet)
   }, [data.propertySet, loadedPropertySets])
 
+  // Memoised so SearchableSelect only re-indexes them when they change
+  const propertyOptions = React.useMemo<SearchableSelectOption[]>(() => properties.map((prop: string) => {
+    const expectedTypes = getExpectedDataTypesForProperty(prop)
+    const isCustom = isCustomPropertySet(data.propertySet || '') && getCustomProperties(data.propertySet || '').includes(prop)
+    return {
+      value: prop,
+      label: prop,
+      description: expectedTypes ? `Recommended: ${expectedTypes.join(' or ')}` : (isCustom ? 'Custom Property' : 'Property'),
+      category: isCustom ? 'Custom Properties' : (expectedTypes ? 'Recommended Type' : 'All Properties')
+    }
+  }), [properties, data.propertySet])
+
+  const dataTypeOptions = React.useMemo<SearchableSelectOption[]>(() => {
+    const expectedTypes = data.baseName ? getExpectedDataTypesForProperty(data.baseName) : null
+    return allDataTypes.map((dt) => ({
+      value: dt.name,
+      label: dt.name,
+      description: dt.description,
+      category: expectedTypes?.includes(dt.name) ? 'Recommended' : 'All Types'
+    }))
+  }, [allDataTypes, data.baseName])
+
   const handleBaseNameChange = (newBaseName: string) => {
     // Update the base name
     onChange("baseName", newBaseName)
@@ -929,6 +1030,7 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
         </Label>
         <SearchableSelect
           options={propertySetOptions}
+          complete={completePset}
           value={data.propertySet}
           onValueChange={(value) => {
             onChange("propertySet", value)
@@ -978,6 +1080,7 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
         />
       </div>
       </FieldIssueWrap>
+      <PropertySetDocs propertySet={data.propertySet} baseName={data.baseName} />
       <FieldIssueWrap field="baseName">
       <div className="space-y-2">
         <Label htmlFor="baseName" className="text-sidebar-foreground">
@@ -989,16 +1092,8 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
           )}
         </Label>
         <SearchableSelect
-          options={properties.map((prop: string) => {
-            const expectedTypes = getExpectedDataTypesForProperty(prop)
-            const isCustom = isCustomPropertySet(data.propertySet || '') && getCustomProperties(data.propertySet || '').includes(prop)
-            return {
-              value: prop,
-              label: prop,
-              description: expectedTypes ? `Recommended: ${expectedTypes.join(' or ')}` : (isCustom ? 'Custom Property' : 'Property'),
-              category: isCustom ? 'Custom Properties' : (expectedTypes ? 'Recommended Type' : 'All Properties')
-            }
-          })}
+          options={propertyOptions}
+          complete={completeProperty}
           value={data.baseName || ""}
           onValueChange={handleBaseNameChange}
           placeholder="Search properties..."
@@ -1038,17 +1133,8 @@ function PropertyFields({ node, onChange, ifcVersion, nodes, edges, onConvertVal
           )}
         </Label>
         <SearchableSelect
-          options={allDataTypes.map((dt) => {
-            const expectedTypes = data.baseName ? getExpectedDataTypesForProperty(data.baseName) : null
-            const isRecommended = expectedTypes?.includes(dt.name)
-
-            return {
-              value: dt.name,
-              label: dt.name,
-              description: dt.description,
-              category: isRecommended ? 'Recommended' : 'All Types'
-            }
-          })}
+          options={dataTypeOptions}
+          complete={completeDataType}
           value={data.dataType || ""}
           onValueChange={(value) => onChange("dataType", value === "" ? undefined : value)}
           placeholder="Search data types... (optional)"
@@ -1429,6 +1515,7 @@ function PartOfFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node
 
   // Load all entities dynamically (like EntityFields does)
   const [allEntities, setAllEntities] = useState<SearchableSelectOption[]>([])
+  const completeEntity = useSchemaCompleter(ifcVersion, 'entity')
   const [entitiesLoading, setEntitiesLoading] = useState(true)
 
   useEffect(() => {
@@ -1500,6 +1587,7 @@ function PartOfFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node
         </Label>
         <SearchableSelect
           options={allEntities}
+          complete={completeEntity}
           value={data.entity || ""}
           onValueChange={(value) => onChange("entity", value)}
           placeholder="Search entities..."
@@ -1572,11 +1660,41 @@ function PartOfFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node
   )
 }
 
-function RestrictionFields({ node, onChange, ifcVersion }: { node: Node<any>; onChange: (field: string, value: any) => void; ifcVersion: IFCVersion }) {
+function RestrictionFields({ node, onChange, ifcVersion, nodes, edges }: { node: Node<any>; onChange: (field: string, value: any) => void; ifcVersion: IFCVersion; nodes: GraphNode[]; edges: GraphEdge[] }) {
   const data = node.data as any // Type assertion for now
   const [enumerationMode, setEnumerationMode] = useState<"chips" | "list">("chips")
   const [showImportDialog, setShowImportDialog] = useState(false)
   const [showBulkModal, setShowBulkModal] = useState(false)
+  const [nonStandardValues, setNonStandardValues] = useState<string[]>([])
+
+  // The property facet this restriction constrains (facet -> restriction edge)
+  const property = React.useMemo(() => {
+    const facetEdge = edges.find((e) => e.target === node.id)
+    const facet = facetEdge && nodes.find((n) => n.id === facetEdge.source)
+    if (facet?.type !== "property") return null
+    const { propertySet, baseName } = facet.data as any
+    return propertySet && baseName ? { propertySet: propertySet as string, baseName: baseName as string } : null
+  }, [node.id, nodes, edges])
+
+  // Check enumeration values against the standard pset template locally
+  useEffect(() => {
+    if (data.restrictionType !== "enumeration" || !property || !data.values?.length) {
+      setNonStandardValues([])
+      return
+    }
+    let cancelled = false
+    findNonStandardEnumerationValues(property.propertySet, property.baseName, data.values, ifcVersion)
+      .then((values) => {
+        if (!cancelled) setNonStandardValues(values)
+      })
+      .catch(() => {
+        if (!cancelled) setNonStandardValues([])
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [data.restrictionType, data.values, property, ifcVersion])
+  const standardProperty = property ? `${property.propertySet}.${property.baseName}` : undefined
 
   return (
     <>
@@ -1617,6 +1735,8 @@ function RestrictionFields({ node, onChange, ifcVersion }: { node: Node<any>; on
               <EnumerationChipsEditor
                 values={data.values || []}
                 onChange={(values) => onChange("values", values)}
+                nonStandard={nonStandardValues}
+                standardProperty={standardProperty}
               />
             </TabsContent>
 
@@ -1624,6 +1744,8 @@ function RestrictionFields({ node, onChange, ifcVersion }: { node: Node<any>; on
               <EnumerationListEditor
                 values={data.values || []}
                 onChange={(values) => onChange("values", values)}
+                nonStandard={nonStandardValues}
+                standardProperty={standardProperty}
               />
             </TabsContent>
           </Tabs>
@@ -40,6 +40,9 @@ interface SearchableSelectProps {
     maxHeight?: number
     allowCustom?: boolean
     onCreateOption?: (value: string) => void
+    // Prefix completer over the option values (e.g. getSchemaCompleter()):
+    // matches are listed in its order, Fuse only runs when it finds nothing.
+    complete?: (query: string) => string[]
 }
 
 export function SearchableSelect({
@@ -55,6 +58,7 @@ export function SearchableSelect({
     maxHeight = 300,
     allowCustom = false,
     onCreateOption,
+    complete,
 }: SearchableSelectProps) {
     const [open, setOpen] = React.useState(false)
     const [searchQuery, setSearchQuery] = React.useState("")
@@ -71,13 +75,35 @@ export function SearchableSelect({
         })
     }, [options])
 
+    // Options by value, plus the ones the completer doesn't know (custom
+    // entries), which are prefix-matched separately
+    const { byValue, unknown } = React.useMemo(() => {
+        const byValue = new Map(options.map(option => [option.value, option]))
+        if (!complete) return { byValue, unknown: [] }
+        const known = new Set(complete(""))
+        return { byValue, unknown: options.filter(option => !known.has(option.value)) }
+    }, [options, complete])
+
     // Filter options based on search query
     const filteredOptions = React.useMemo(() => {
-        if (!searchQuery.trim()) return options
+        const query = searchQuery.trim()
+        if (!query) return options
+
+        if (complete) {
+            const lower = query.toLowerCase()
+            const completed = complete(query)
+                .map(name => byValue.get(name))
+                .filter((option): option is SearchableSelectOption => !!option)
+            const custom = unknown.filter(option =>
+                option.value.toLowerCase().startsWith(lower) ||
+                option.label.toLowerCase().startsWith(lower)
+            )
+            if (completed.length || custom.length) return [...completed, ...custom]
+        }
 
         const results = fuse.search(searchQuery)
         return results.map(result => result.item)
-    }, [options, searchQuery, fuse])
+    }, [options, searchQuery, fuse, complete, byValue, unknown])
 
     // Group options by category if enabled
     const groupedOptions = React.useMemo(() => {
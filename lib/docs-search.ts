@@ -1,10 +1,10 @@
 import "server-only";
-import GithubSlugger from "github-slugger";
-import { loadMarkdownFile } from "./docs-loader";
+import { promises as fs } from "fs";
+import path from "path";
 import { docsConfig } from "./docs-config";
 
 /**
- * One indexable chunk of a documentation page. We split each page into chunks
+ * One indexable chunk of a documentation page. Each page is split into chunks
  * at `##` / `###` / … headings so a search hit can deep-link to the exact
  * section instead of dumping the user at the top of the page. The slug
  * matches what `rehype-slug` (and our `<h2 id="…">` rendering) emits, so the
@@ -22,100 +22,96 @@ export type DocsSearchEntry = {
   content: string;
 };
 
-/** Markdown → plain text. */
-function stripMarkdown(md: string): string {
-  return md
-    // Fenced code: keep the inner content (drop fence + optional lang). IFC
-    // identifiers and XML snippets in the docs commonly live in fenced blocks,
-    // so this preserves them in the search index.
-    .replace(/```\w*\n?([\s\S]*?)```/g, "$1")
-    // Inline code: keep the text. Terms like `Pset_WallCommon` or `IfcBoolean`
-    // appear almost exclusively in inline code spans in the IDS docs.
-    .replace(/`([^`]*)`/g, "$1")
-    .replace(/!\[([^\]]*)\]\([^)]*\)/g, "$1")
-    .replace(/\[([^\]]+)\]\([^)]*\)/g, "$1")
-    .replace(/^#{1,6}\s+/gm, "")
-    .replace(/\*\*([^*]+)\*\*/g, "$1")
-    .replace(/\*([^*]+)\*/g, "$1")
-    .replace(/__([^_]+)__/g, "$1")
-    .replace(/_([^_]+)_/g, "$1")
-    .replace(/<[^>]+>/g, " ")
-    .replace(/\s+/g, " ")
-    .trim();
-}
+/**
+ * The docs search index handed to the sidebar. `terms` is sorted and
+ * `postings[i]` lists (ascending) the entries containing `terms[i]`, so a
+ * query word is a binary search for the terms it prefixes. Entries of pages
+ * without a markdown file (`searchableText`) aren't in `terms`; they're
+ * listed in `unindexed` and matched by substring.
+ */
+export type DocsSearchIndex = {
+  entries: DocsSearchEntry[];
+  terms: string[];
+  postings: number[][];
+  unindexed: number[];
+};
 
 /**
- * Split a markdown document into one chunk per heading.
- *
- * The pre-heading prose (if any) becomes the first chunk with no heading and
- * no slug — clicking it just lands on the page top. Slugs are generated with
- * GithubSlugger (the same library rehype-slug uses), and each slugger
- * instance handles its own duplicate-suffix accounting so two `## Setup`
- * headings on the same page get `setup` and `setup-1` to match the rendered
- * DOM.
- *
- * Fenced code blocks are skipped while looking for heading lines so we don't
- * mistake a `#` inside a code sample for a section break.
+ * Written by scripts/ifc_schema/docs_index.py (`npm run generate-schema`):
+ * the `ids-docs/` pages already chunked, stripped and tokenized, with chunk
+ * ids in the postings.
  */
-function splitMarkdownIntoChunks(md: string): Array<{ heading: string; slug: string; body: string }> {
-  const lines = md.split(/\r?\n/);
-  const slugger = new GithubSlugger();
-  const chunks: Array<{ heading: string; slug: string; body: string[] }> = [
-    { heading: "", slug: "", body: [] },
-  ];
-  let inFence = false;
+type DocsIndexFile = {
+  files: string[];
+  chunks: Array<{ file: number; heading: string; slug: string; content: string }>;
+  terms: string[];
+  postings: number[][];
+};
 
-  for (const line of lines) {
-    if (line.startsWith("```")) {
-      inFence = !inFence;
-      chunks[chunks.length - 1].body.push(line);
-      continue;
-    }
-    if (!inFence) {
-      const match = /^(#{1,6})\s+(.+?)\s*$/.exec(line);
-      if (match) {
-        const heading = match[2].trim();
-        chunks.push({ heading, slug: slugger.slug(heading), body: [] });
-        continue;
-      }
-    }
-    chunks[chunks.length - 1].body.push(line);
-  }
+const INDEX_FILE = path.join(process.cwd(), "lib", "generated", "ifc-schema", "docs-search-index.json");
 
-  return chunks
-    .map((c) => ({ heading: c.heading, slug: c.slug, body: stripMarkdown(c.body.join("\n")) }))
-    .filter((c) => c.heading || c.body.length > 0);
+async function loadDocsIndexFile(): Promise<DocsIndexFile> {
+  try {
+    return JSON.parse(await fs.readFile(INDEX_FILE, "utf-8"));
+  } catch (error) {
+    console.error("Error loading the docs search index:", error);
+    return { files: [], chunks: [], terms: [], postings: [] };
+  }
 }
 
 /**
- * Build the full-text index. Called from the docs layout (Server Component)
- * so the result is computed at request time and serialised into the client
- * sidebar as a prop.
+ * Lay the prebuilt chunks out in docs-config order (so results list pages
+ * the way the sidebar does) and point the postings at those entries.
  */
-export async function buildDocsSearchIndex(): Promise<DocsSearchEntry[]> {
+async function loadDocsSearchIndex(): Promise<DocsSearchIndex> {
+  const file = await loadDocsIndexFile();
+  const chunksByFile = new Map<string, number[]>();
+  file.chunks.forEach((chunk, id) => {
+    const name = file.files[chunk.file];
+    const ids = chunksByFile.get(name);
+    if (ids) ids.push(id);
+    else chunksByFile.set(name, [id]);
+  });
+
   const entries: DocsSearchEntry[] = [];
+  const unindexed: number[] = [];
+  // Chunk id -> entry id; -1 for files no page shows.
+  const entryOf = new Array<number>(file.chunks.length).fill(-1);
   for (const section of docsConfig) {
     for (const item of section.items) {
-      let raw = "";
+      const page = { href: item.href, pageTitle: item.title, section: section.title };
       if (item.mdFile) {
-        raw = (await loadMarkdownFile(item.mdFile)) || "";
+        for (const id of chunksByFile.get(item.mdFile) ?? []) {
+          const { heading, slug, content } = file.chunks[id];
+          entryOf[id] = entries.length;
+          entries.push({ ...page, heading, slug, content });
+        }
       } else if (item.searchableText) {
-        raw = item.searchableText;
-      }
-      if (!raw) continue;
-
-      const chunks = splitMarkdownIntoChunks(raw);
-      for (const chunk of chunks) {
-        entries.push({
-          href: item.href,
-          pageTitle: item.title,
-          section: section.title,
-          heading: chunk.heading,
-          slug: chunk.slug,
-          content: chunk.body,
-        });
+        unindexed.push(entries.length);
+        entries.push({ ...page, heading: "", slug: "", content: item.searchableText.replace(/\s+/g, " ").trim() });
       }
     }
   }
-  return entries;
+
+  const terms: string[] = [];
+  const postings: number[][] = [];
+  file.terms.forEach((term, i) => {
+    const ids = file.postings[i].map((id) => entryOf[id]).filter((id) => id >= 0);
+    if (ids.length === 0) return;
+    terms.push(term);
+    postings.push(ids.sort((a, b) => a - b));
+  });
+  return { entries, terms, postings, unindexed };
+}
+
+let indexPromise: Promise<DocsSearchIndex> | null = null;
+
+/**
+ * The docs search index, loaded once per server process. Called from the
+ * docs layout (Server Component) and serialised into the client sidebar as
+ * a prop.
+ */
+export function getDocsSearchIndex(): Promise<DocsSearchIndex> {
+  if (!indexPromise) indexPromise = loadDocsSearchIndex();
+  return indexPromise;
 }
@@ -15,13 +15,13 @@ export function getConnectedSpec(
 }
 
 /**
- * Find the entity node connected to the same specification as the given facet node
+ * Find the entity node data connected to the same specification as the given facet node
  */
-export function getConnectedEntity(
+export function getConnectedEntityData(
   facetNodeId: string,
   nodes: GraphNode[],
   edges: GraphEdge[]
-): string | null {
+): EntityNodeData | null {
   // 1. Find the spec node this facet is connected to
   const specNodeId = getConnectedSpec(facetNodeId, edges)
   if (!specNodeId) return null
@@ -37,7 +37,18 @@ export function getConnectedEntity(
 
   // 3. Get entity node data
   const entityNode = nodes.find(n => n.id === entityEdge.source)
-  return (entityNode?.data as EntityNodeData)?.name || null
+  return (entityNode?.data as EntityNodeData) || null
+}
+
+/**
+ * Find the entity connected to the same specification as the given facet node
+ */
+export function getConnectedEntity(
+  facetNodeId: string,
+  nodes: GraphNode[],
+  edges: GraphEdge[]
+): string | null {
+  return getConnectedEntityData(facetNodeId, nodes, edges)?.name || null
 }
 
 /**
@@ -71,17 +82,18 @@ export function hasConnectedEntity(
 }
 
 /**
- * Get the entity context for a facet node (entity name or null)
+ * Get the entity context for a facet node (entity name and predefined type, or null)
  */
 export function getEntityContext(
   facetNodeId: string,
   nodes: GraphNode[],
   edges: GraphEdge[]
-): { entityName: string | null; specNodeId: string | null } {
+): { entityName: string | null; predefinedType: string | null; specNodeId: string | null } {
   const specNodeId = getConnectedSpec(facetNodeId, edges)
-  const entityName = specNodeId ? getConnectedEntity(facetNodeId, nodes, edges) : null
+  const entity = specNodeId ? getConnectedEntityData(facetNodeId, nodes, edges) : null
+  const predefinedType = typeof entity?.predefinedType === 'string' ? entity.predefinedType : null
 
-  return { entityName, specNodeId }
+  return { entityName: entity?.name || null, predefinedType: predefinedType || null, specNodeId }
 }
 
 /**
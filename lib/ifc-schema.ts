@@ -51,10 +51,95 @@ interface IFCSimpleType {
   category?: string
 }
 
+// Value metadata kept from the PSD templates (scripts/psd/fetch-and-parse-psd.py,
+// parse_property_type); single values carry no valueKind.
+interface IFCPropertyDefinition {
+  name: string
+  dataType: string
+  valueKind?: 'enumerated' | 'bounded' | 'reference' | 'list' | 'table'
+  enumeration?: string[]
+  enumerationName?: string
+  bounds?: { lower?: number | string; upper?: number | string }
+  unit?: string
+  referenceType?: string
+  definedDataType?: string
+  expression?: string
+}
+
 interface IFCPropertySetDefinition {
   name: string
   applicableEntities: string[]
-  properties: { name: string; dataType: string }[]
+  // Entities the template only scopes to some predefined types ("IfcWall/STANDARD")
+  applicablePredefinedTypes?: Record<string, string[]>
+  properties: IFCPropertyDefinition[]
+}
+
+// Written by scripts/ifc_schema/applicability.py: uppercase entity ->
+// predefined type -> pset names; "*" holds the psets for every type.
+interface ApplicabilityIndexFile {
+  version: string
+  entities: Record<string, Record<string, string[]>>
+}
+
+// Written by scripts/ifc_schema/enumerations.py: the items of every enumerated
+// standard pset property, each list stored once. Pset and property keys are
+// uppercase.
+interface EnumerationIndexFile {
+  version: string
+  lists: Record<string, string[]>
+  properties: Record<string, Record<string, string>>
+}
+
+// Precomputed by scripts/ifc_schema/datatypes.py: value category per datatype
+// plus an N x N compatibility bitset (row-major, LSB-first, base64).
+interface DataTypeMatrixFile {
+  version: string
+  types: string[]
+  categories: DataTypeCategory[]
+  typeCategories: number[]
+  rowBytes: number
+  compatible: string
+}
+
+// Written by scripts/ifc_schema/fuzzy.py: trigram index over the entity,
+// pset and property names. nameKinds holds one bitmask digit per name (bits
+// index `kinds`); a posting list is the ascending name ids as base64 LEB128
+// varints of their gaps.
+interface FuzzyIndexFile {
+  version: string
+  kinds: SchemaNameKind[]
+  names: string[]
+  nameKinds: string
+  trigrams: Record<string, string>
+}
+
+// Written by scripts/ifc_schema/completion.py: per kind, the names by usage
+// rank (id = rank) and their sorted case-folded completion keys, `ids[i]`
+// being the name of `keys[i]`.
+interface CompletionTable {
+  names: string[]
+  keys: string[]
+  ids: number[]
+}
+
+interface CompletionIndexFile {
+  version: string
+  entity: CompletionTable
+  pset: CompletionTable
+  property: CompletionTable
+  datatype: CompletionTable
+}
+
+// Per-file entry of schema-index.json (scripts/ifc_schema/schema_index.py)
+interface SchemaFileInfo {
+  kind: string
+  version?: string
+  sha256: string
+  bytes: number
+  records: number
+  sections?: Record<string, { offset: number; bytes: number }>
+  locale?: string
+  layer?: string
 }
 
 interface SchemaIndex {
@@ -62,10 +147,36 @@ interface SchemaIndex {
   lastGenerated: string
   entityCounts: Record<string, number>
   propertySetCounts: Record<string, number>
+  files?: Record<string, SchemaFileInfo>
+}
+
+// Written last by scripts/ifc_schema/manifest.py: logical file name ->
+// content-hashed URL that can be cached immutably.
+interface SchemaManifest {
+  version: number
+  files: Record<string, string>
 }
 
 // Lazy loading cache
 const schemaCache = new Map<string, any>()
+let manifestPromise: Promise<Record<string, string>> | null = null
+
+function loadManifest(): Promise<Record<string, string>> {
+  if (!manifestPromise) {
+    manifestPromise = fetch('/generated/manifest.json', { cache: 'no-cache' })
+      .then(response => (response.ok ? response.json() : null))
+      .then((manifest: SchemaManifest | null) => manifest?.files ?? {})
+      .catch(() => ({}))
+  }
+  return manifestPromise
+}
+
+// Hashed URL from the manifest; the plain path when there is no manifest
+// (e.g. CI builds that skip schema generation).
+async function resolveSchemaUrl(filename: string): Promise<string> {
+  const files = await loadManifest()
+  return files[filename] ?? `/generated/${filename}`
+}
 
 // Browser-compatible schema loading
 async function loadSchemaFile<T>(filename: string): Promise<T> {
@@ -76,7 +187,7 @@ async function loadSchemaFile<T>(filename: string): Promise<T> {
 
   try {
     // In browser, fetch from public directory
-    const response = await fetch(`/generated/${filename}`)
+    const response = await fetch(await resolveSchemaUrl(filename))
     if (!response.ok) {
       throw new Error(`Failed to fetch ${filename}: ${response.status}`)
     }
@@ -104,6 +215,107 @@ async function loadPropertySets(version: IFCVersion): Promise<IFCPropertySetDefi
   return await loadSchemaFile<IFCPropertySetDefinition[]>(filename)
 }
 
+async function loadDataTypeMatrix(version: IFCVersion): Promise<DataTypeMatrixFile | null> {
+  const filename = `datatype-matrix-${version.toLowerCase()}.json`
+  const matrix = await loadSchemaFile<DataTypeMatrixFile | never[]>(filename)
+  return Array.isArray(matrix) ? null : matrix
+}
+
+async function loadEnumerationIndex(version: IFCVersion): Promise<EnumerationIndexFile | null> {
+  const filename = `enumerations-${version.toLowerCase()}.json`
+  const index = await loadSchemaFile<EnumerationIndexFile | never[]>(filename)
+  return Array.isArray(index) ? null : index
+}
+
+// Definitions and translated names from the PSD templates, one file per
+// locale (scripts/ifc_schema/locales.py). Fetched only for the locale shown.
+interface LocalePackFile {
+  locale: string
+  propertySets: Record<string, SchemaDocumentation & {
+    properties?: Record<string, SchemaDocumentation>
+  }>
+}
+
+export interface SchemaDocumentation {
+  name?: string
+  definition?: string
+}
+
+const DEFAULT_DOC_LOCALE = 'en'
+
+async function loadLocalePack(locale: string): Promise<LocalePackFile | null> {
+  const pack = await loadSchemaFile<LocalePackFile | never[]>(`psd-locale-${locale}.json`)
+  return Array.isArray(pack) ? null : pack
+}
+
+// Locales with a pack listed in schema-index.json. Packs are only written by
+// a generation run with the PSD sources, so this can be empty.
+async function availableDocLocales(): Promise<string[]> {
+  const index = await loadSchemaIndex()
+  return Object.values(index.files ?? {})
+    .filter((file) => file.kind === 'locale-pack' && file.locale)
+    .map((file) => file.locale!)
+}
+
+// Packs to read for `requested`, most specific first: the exact locale, one
+// of the same language ("de-AT" -> "de-DE"), then the untranslated English.
+// Only packs that exist are returned, so nothing is fetched without them.
+async function docLocalesFor(requested: string): Promise<string[]> {
+  const available = await availableDocLocales()
+  const lower = requested.toLowerCase()
+  const language = lower.split('-')[0]
+  const exact = available.find((l) => l.toLowerCase() === lower)
+  const sameLanguage = available.find((l) => l.toLowerCase().split('-')[0] === language)
+  const fallback = available.find((l) => l === DEFAULT_DOC_LOCALE)
+  return [...new Set([exact, sameLanguage, fallback].filter((l): l is string => !!l))]
+}
+
+/** Whether any PSD documentation pack has been generated. */
+export async function hasPropertySetDocumentation(): Promise<boolean> {
+  return (await availableDocLocales()).length > 0
+}
+
+/**
+ * Definition and localized name of a standard property set, or of one of its
+ * properties when `propertyName` is given. Fields missing from the requested
+ * locale fall back to English; undefined when the templates have nothing.
+ */
+export async function getPropertySetDocumentation(
+  propertySetName: string,
+  locale: string,
+  propertyName?: string,
+): Promise<SchemaDocumentation | undefined> {
+  if (!propertySetName || typeof propertySetName !== 'string') return undefined
+  const docs: SchemaDocumentation = {}
+  for (const candidate of await docLocalesFor(locale)) {
+    const entry = (await loadLocalePack(candidate))?.propertySets[propertySetName]
+    const source = propertyName
+      ? entry?.properties?.[propertyName] ?? entry?.properties?.[normalizePropertyName(propertyName)]
+      : entry
+    docs.name = docs.name ?? source?.name
+    docs.definition = docs.definition ?? source?.definition
+  }
+  return docs.name || docs.definition ? docs : undefined
+}
+
+async function loadApplicabilityIndex(version: IFCVersion): Promise<ApplicabilityIndexFile | null> {
+  const filename = `applicability-${version.toLowerCase()}.json`
+  const index = await loadSchemaFile<ApplicabilityIndexFile | never[]>(filename)
+  return Array.isArray(index) ? null : index
+}
+
+async function loadFuzzyIndexFile(version: IFCVersion): Promise<FuzzyIndexFile | null> {
+  const filename = `fuzzy-${version.toLowerCase()}.json`
+  const index = await loadSchemaFile<FuzzyIndexFile | never[]>(filename)
+  return Array.isArray(index) ? null : index
+}
+
+async function loadCompletionIndexFile(version: IFCVersion): Promise<CompletionIndexFile | null> {
+  const filename = `completion-${version.toLowerCase()}.json`
+  const index = await loadSchemaFile<CompletionIndexFile | never[]>(filename)
+  return Array.isArray(index) ? null : index
+}
+
 async function loadSchemaIndex(): Promise<SchemaIndex> {
   return await loadSchemaFile<SchemaIndex>('schema-index.json')
 }
@@ -212,13 +424,39 @@ const dataTypeBaseTypeCache = new Map<string, string>()
 // restriction base. Kept out of the numeric/string/… categories so they never
 // produce a "different kind of value" recommendation (issue #58).
 const referenceDataTypeCache = new Set<string>()
+// Decoded datatype matrix for the cached version, when the generated file is
+// available. Turns category/compatibility checks into table lookups.
+let dataTypeMatrix: {
+  index: Map<string, number>
+  categories: DataTypeCategory[]
+  typeCategories: number[]
+  rowBytes: number
+  bits: Uint8Array
+} | null = null
 let simpleTypesCacheVersion: IFCVersion | null = null
 
+function decodeDataTypeMatrix(file: DataTypeMatrixFile) {
+  const raw = atob(file.compatible)
+  const bits = new Uint8Array(raw.length)
+  for (let i = 0; i < raw.length; i++) bits[i] = raw.charCodeAt(i)
+  return {
+    index: new Map(file.types.map((name, i) => [name, i])),
+    categories: file.categories,
+    typeCategories: file.typeCategories,
+    rowBytes: file.rowBytes,
+    bits,
+  }
+}
+
 async function ensureSimpleTypeCaches(version: IFCVersion): Promise<void> {
   if (simpleTypesCacheVersion === version && validDataTypeCache.size > 0) return
   try {
-    const simpleTypes = await loadSimpleTypes(version)
+    const [simpleTypes, matrix] = await Promise.all([
+      loadSimpleTypes(version),
+      loadDataTypeMatrix(version),
+    ])
     if (simpleTypes.length === 0) return // keep any existing cache / legacy fallback
+    dataTypeMatrix = matrix ? decodeDataTypeMatrix(matrix) : null
     validDataTypeCache.clear()
     dataTypeBaseTypeCache.clear()
     referenceDataTypeCache.clear()
@@ -291,6 +529,10 @@ function baseTypeToCategory(base: string): DataTypeCategory {
 
 export function getDataTypeCategory(dataType: string): DataTypeCategory {
   const upper = dataType.toUpperCase()
+  if (dataTypeMatrix) {
+    const i = dataTypeMatrix.index.get(upper)
+    return i === undefined ? 'unknown' : dataTypeMatrix.categories[dataTypeMatrix.typeCategories[i]]
+  }
   // Reference value types have an empty restriction base (which would otherwise
   // fall into 'binary'); classify them explicitly so they stand apart. (#58)
   if (referenceDataTypeCache.has(upper)) return 'reference'
@@ -306,6 +548,13 @@ export function getDataTypeCategory(dataType: string): DataTypeCategory {
  */
 export function areDataTypesCompatible(a: string, b: string): boolean {
   if (a.toUpperCase() === b.toUpperCase()) return true
+  if (dataTypeMatrix) {
+    const i = dataTypeMatrix.index.get(a.toUpperCase())
+    const j = dataTypeMatrix.index.get(b.toUpperCase())
+    // Unknown types are never flagged (same as the category rules below).
+    if (i === undefined || j === undefined) return true
+    return (dataTypeMatrix.bits[i * dataTypeMatrix.rowBytes + (j >> 3)] & (1 << (j & 7))) !== 0
+  }
   const ca = getDataTypeCategory(a)
   const cb = getDataTypeCategory(b)
   // Unknown or reference value types are opaque — never flag them as a
@@ -379,24 +628,56 @@ export async function getAllPropertySets(version: IFCVersion): Promise<IFCProper
   return convertPropertySets(propertySets)
 }
 
-export async function getPropertySetsForEntityAsync(entityName: string, version: IFCVersion): Promise<IFCPropertySet[]> {
-  const allPropertySets = await getAllPropertySets(version)
+/**
+ * Property sets that apply to `entityName`. With a `predefinedType`, psets
+ * the templates scope to other predefined types of the entity are left out;
+ * without one, every pset of the entity applies.
+ */
+export async function getPropertySetsForEntityAsync(
+  entityName: string,
+  version: IFCVersion,
+  predefinedType?: string,
+): Promise<IFCPropertySet[]> {
+  const [allPropertySets, applicability] = await Promise.all([
+    getAllPropertySets(version),
+    loadApplicabilityIndex(version),
+  ])
   const normalizedEntityName = entityName.toUpperCase()
-  return allPropertySets.filter(pset =>
-    pset.applicableEntities.some(e => e.toUpperCase() === normalizedEntityName)
+  if (!applicability) {
+    return allPropertySets.filter(pset =>
+      pset.applicableEntities.some(e => e.toUpperCase() === normalizedEntityName)
+    )
+  }
+
+  const byType = applicability.entities[normalizedEntityName] ?? {}
+  const type = predefinedType?.trim().toUpperCase()
+  const names = new Set(
+    type ? [...(byType['*'] ?? []), ...(byType[type] ?? [])] : Object.values(byType).flat()
   )
+  return allPropertySets.filter(pset => names.has(pset.name))
 }
 
 export async function searchPropertySets(query: string, version: IFCVersion): Promise<IFCPropertySet[]> {
   const allPropertySets = await getAllPropertySets(version)
   const lowercaseQuery = query.toLowerCase()
 
-  return allPropertySets.filter(pset =>
+  const matches = allPropertySets.filter(pset =>
     pset.name.toLowerCase().includes(lowercaseQuery) ||
     pset.properties.some(prop =>
       prop.name.toLowerCase().includes(lowercaseQuery)
     )
   )
+  if (matches.length > 0 || !query.trim()) return matches
+
+  // Nothing contains the query: likely a typo, rank by the closest names.
+  const suggested = await suggestSchemaNames(query, version, ['pset', 'property'])
+  const order = (pset: IFCPropertySet) => suggested.findIndex((s) =>
+    s.name === pset.name || pset.properties.some((prop) => prop.name === s.name))
+  return allPropertySets
+    .map((pset) => ({ pset, rank: order(pset) }))
+    .filter(({ rank }) => rank >= 0)
+    .sort((a, b) => a.rank - b.rank)
+    .map(({ pset }) => pset)
 }
 
 export async function getAttributesForEntity(entityName: string, version: IFCVersion): Promise<{ name: string; type: string; optional: boolean }[]> {
@@ -468,9 +749,244 @@ export async function searchEntities(query: string, version: IFCVersion): Promis
     entity.name.toLowerCase().includes(query.toLowerCase()) ||
     entity.description?.toLowerCase().includes(query.toLowerCase())
   )
+  if (filtered.length === 0 && query.trim()) {
+    // Nothing contains the query: likely a typo, offer the closest names.
+    const byName = new Map(entities.map((entity) => [entity.name, entity]))
+    const suggested = await suggestSchemaNames(query, version, ['entity'])
+    return convertEntities(suggested.map((s) => byName.get(s.name)).filter((e): e is IFCEntityDefinition => !!e))
+  }
   return convertEntities(filtered)
 }
 
+// -- "Did you mean" suggestions (fuzzy-{version}.json) ------------------------
+
+export type SchemaNameKind = 'entity' | 'pset' | 'property'
+
+export interface SchemaNameSuggestion {
+  name: string
+  kinds: SchemaNameKind[]
+  // Edit distance from the query, ignoring case (0 = only the case differs)
+  distance: number
+}
+
+// Same limits as scripts/ifc_schema/fuzzy.py, so both rank alike.
+const FUZZY_CANDIDATES = 50
+const FUZZY_MAX_GRAMS_PER_EDIT = 4
+
+interface FuzzyIndex {
+  kinds: SchemaNameKind[]
+  names: string[]
+  keys: string[]
+  nameKinds: Uint8Array
+  gramCounts: Uint16Array
+  encoded: Record<string, string>
+  postings: Map<string, number[]>
+}
+
+const fuzzyIndexCache = new Map<IFCVersion, Promise<FuzzyIndex | null>>()
+
+function trigrams(key: string): Set<string> {
+  const padded = `  ${key} `
+  const grams = new Set<string>()
+  for (let i = 0; i + 3 <= padded.length; i++) grams.add(padded.slice(i, i + 3))
+  return grams
+}
+
+function decodePostings(encoded: string): number[] {
+  const raw = atob(encoded)
+  const ids: number[] = []
+  let last = 0
+  let gap = 0
+  let shift = 0
+  for (let i = 0; i < raw.length; i++) {
+    const byte = raw.charCodeAt(i)
+    gap += (byte & 0x7f) * 2 ** shift
+    if (byte & 0x80) {
+      shift += 7
+      continue
+    }
+    last += gap
+    ids.push(last)
+    gap = 0
+    shift = 0
+  }
+  return ids
+}
+
+function fuzzyPostings(index: FuzzyIndex, gram: string): number[] {
+  let ids = index.postings.get(gram)
+  if (!ids) {
+    const encoded = index.encoded[gram]
+    ids = encoded ? decodePostings(encoded) : []
+    index.postings.set(gram, ids)
+  }
+  return ids
+}
+
+// Optimal string alignment distance, or limit + 1 once it exceeds limit.
+// Mirrors edit_distance() in scripts/ifc_schema/fuzzy.py.
+function editDistance(a: string, b: string, limit: number): number {
+  const over = limit + 1
+  if (Math.abs(a.length - b.length) > limit) return over
+  let start = 0
+  while (start < a.length && start < b.length && a[start] === b[start]) start++
+  let end = 0
+  while (end < a.length - start && end < b.length - start &&
+         a[a.length - 1 - end] === b[b.length - 1 - end]) end++
+  a = a.slice(start, a.length - end)
+  b = b.slice(start, b.length - end)
+  if (!a || !b) return Math.min(Math.max(a.length, b.length), over)
+
+  let previous: number[] = []
+  let row = Array.from({ length: b.length + 1 }, (_, j) => Math.min(j, over))
+  for (let i = 1; i <= a.length; i++) {
+    const current = new Array<number>(b.length + 1).fill(over)
+    if (i <= limit) current[0] = i
+    let best = current[0]
+    for (let j = Math.max(1, i - limit); j <= Math.min(b.length, i + limit); j++) {
+      let value = Math.min(row[j] + 1, current[j - 1] + 1, row[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1))
+      if (i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+        value = Math.min(value, previous[j - 2] + 1)
+      }
+      current[j] = Math.min(value, over)
+      best = Math.min(best, current[j])
+    }
+    if (best > limit) return over
+    previous = row
+    row = current
+  }
+  return row[b.length]
+}
+
+function loadFuzzyIndex(version: IFCVersion): Promise<FuzzyIndex | null> {
+  let pending = fuzzyIndexCache.get(version)
+  if (!pending) {
+    pending = loadFuzzyIndexFile(version).then((file) => {
+      if (!file) return null
+      const keys = file.names.map((name) => name.toLowerCase())
+      return {
+        kinds: file.kinds,
+        names: file.names,
+        keys,
+        nameKinds: Uint8Array.from(file.nameKinds, (digit) => Number(digit)),
+        gramCounts: Uint16Array.from(keys, (key) => trigrams(key).size),
+        encoded: file.trigrams,
+        postings: new Map(),
+      }
+    })
+    fuzzyIndexCache.set(version, pending)
+  }
+  return pending
+}
+
+/**
+ * Closest entity / property set / property names to `query` (e.g.
+ * "Pset_WalCommon" -> "Pset_WallCommon"), best first. Only names within
+ * `maxDistance` edits (default: a quarter of the query length, at least 1)
+ * are returned; empty when the fuzzy index hasn't been generated.
+ */
+export async function suggestSchemaNames(
+  query: string,
+  version: IFCVersion,
+  kinds?: SchemaNameKind[],
+  limit = 5,
+  maxDistance?: number,
+): Promise<SchemaNameSuggestion[]> {
+  const key = query.trim().toLowerCase()
+  const index = key ? await loadFuzzyIndex(version) : null
+  if (!index) return []
+  const mask = (kinds ?? index.kinds).reduce((bits, kind) => bits | (1 << index.kinds.indexOf(kind)), 0)
+  const maxEdits = maxDistance ?? Math.max(1, Math.floor(key.length / 4))
+
+  const grams = trigrams(key)
+  const shared = new Map<number, number>()
+  for (const gram of grams) {
+    for (const id of fuzzyPostings(index, gram)) shared.set(id, (shared.get(id) ?? 0) + 1)
+  }
+  // One edit removes at most FUZZY_MAX_GRAMS_PER_EDIT of the query's trigrams
+  // and changes the length by at most one.
+  const need = grams.size - FUZZY_MAX_GRAMS_PER_EDIT * maxEdits
+  const dice = (id: number) => (2 * shared.get(id)!) / (grams.size + index.gramCounts[id])
+  const candidates = [...shared.keys()]
+    .filter((id) => shared.get(id)! >= need &&
+      Math.abs(index.keys[id].length - key.length) <= maxEdits &&
+      (index.nameKinds[id] & mask) !== 0)
+    .sort((x, y) => dice(y) - dice(x) || (index.keys[x] < index.keys[y] ? -1 : index.keys[x] > index.keys[y] ? 1 : 0))
+    .slice(0, FUZZY_CANDIDATES)
+
+  const found: { id: number; distance: number }[] = []
+  let bound = maxEdits
+  const rank = (x: { id: number; distance: number }, y: { id: number; distance: number }) =>
+    x.distance - y.distance || shared.get(y.id)! - shared.get(x.id)! ||
+    (index.keys[x.id] < index.keys[y.id] ? -1 : index.keys[x.id] > index.keys[y.id] ? 1 : 0)
+  for (const id of candidates) {
+    const distance = editDistance(key, index.keys[id], bound)
+    if (distance > bound) continue
+    found.push({ id, distance })
+    if (found.length >= limit) {
+      // Nothing further than the limit-th best can make the cut.
+      found.sort(rank)
+      found.length = limit
+      bound = found[limit - 1].distance
+    }
+  }
+  return found.sort(rank).map(({ id, distance }) => ({
+    name: index.names[id],
+    kinds: index.kinds.filter((_, bit) => (index.nameKinds[id] & (1 << bit)) !== 0),
+    distance,
+  }))
+}
+
+// -- Prefix completion (completion-{version}.json) ------------------------------
+
+export type CompletionKind = 'entity' | 'pset' | 'property' | 'datatype'
+
+/** Names starting with a typed prefix, most used first. */
+export type SchemaCompleter = (prefix: string, limit?: number) => string[]
+
+// First index of the sorted `keys` that is >= `key`.
+function lowerBound(keys: string[], key: string, lo = 0): number {
+  let hi = keys.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (keys[mid] < key) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+function completer(table: CompletionTable): SchemaCompleter {
+  return (prefix, limit) => {
+    const key = prefix.trim().toLowerCase()
+    const lo = lowerBound(table.keys, key)
+    const hi = lowerBound(table.keys, key + '\uffff', lo)
+    // A name can match through more than one key ("IfcWall" via "ifcwall" and "wall").
+    const ids = Int32Array.from(new Set(table.ids.slice(lo, hi))).sort()
+    const names: string[] = []
+    for (const id of limit === undefined ? ids : ids.subarray(0, limit)) names.push(table.names[id])
+    return names
+  }
+}
+
+const completionCache = new Map<IFCVersion, Promise<CompletionIndexFile | null>>()
+
+/**
+ * Prefix completer for `kind` names of `version`: matches names by their
+ * case-folded start, or by it without the "Ifc" / "Pset_" / "Qto_" prefix
+ * ("wall" -> IfcWall, Pset_WallCommon), ranked by how much the schema uses
+ * them. Two binary searches per call instead of a scan of every name; null
+ * when the completion index hasn't been generated.
+ */
+export async function getSchemaCompleter(version: IFCVersion, kind: CompletionKind): Promise<SchemaCompleter | null> {
+  let pending = completionCache.get(version)
+  if (!pending) {
+    pending = loadCompletionIndexFile(version)
+    completionCache.set(version, pending)
+  }
+  const index = await pending
+  return index ? completer(index[kind]) : null
+}
+
 export async function getSchemaStats(): Promise<{ version: string; entityCount: number; propertySetCount: number }[]> {
   const index = await loadSchemaIndex()
   return index.versions.map(version => ({
@@ -687,3 +1203,39 @@ export function isPropertyDataTypeValid(
 
   return { valid: false, expectedTypes }
 }
+
+/**
+ * Enumeration items the standard pset template defines for a property, or
+ * undefined when it isn't an enumerated property of a standard pset (custom
+ * psets and properties carry no template opinion).
+ */
+export async function getStandardEnumerationValues(
+  propertySetName: string,
+  propertyName: string,
+  version: IFCVersion,
+): Promise<string[] | undefined> {
+  if (!propertySetName || typeof propertySetName !== 'string') return undefined
+  const index = await loadEnumerationIndex(version)
+  const props = index?.properties[propertySetName.toUpperCase()]
+  if (!props) return undefined
+
+  const listName = props[propertyName.toUpperCase()] ?? props[normalizePropertyName(propertyName).toUpperCase()]
+  return listName ? index!.lists[listName] : undefined
+}
+
+/**
+ * Values of an IDS `enumeration` restriction that the standard template for
+ * `propertySetName.propertyName` doesn't list (case-insensitive). Empty when
+ * all values are listed or the property has no standard enumeration.
+ */
+export async function findNonStandardEnumerationValues(
+  propertySetName: string,
+  propertyName: string,
+  values: string[],
+  version: IFCVersion,
+): Promise<string[]> {
+  const allowed = await getStandardEnumerationValues(propertySetName, propertyName, version)
+  if (!allowed) return []
+  const known = new Set(allowed.map((v) => v.toUpperCase()))
+  return values.filter((v) => !known.has(v.trim().toUpperCase()))
+}
@@ -9,6 +9,19 @@ const nextConfig = {
   images: {
     unoptimized: true,
   },
+  async headers() {
+    return [
+      {
+        // Content-hashed schema files (scripts/ifc_schema/manifest.py)
+        source: '/generated/:file([^/]+\\.[0-9a-f]{10}\\.json)',
+        headers: [{ key: 'Cache-Control', value: 'public, max-age=31536000, immutable' }],
+      },
+      {
+        source: '/generated/manifest.json',
+        headers: [{ key: 'Cache-Control', value: 'no-cache' }],
+      },
+    ]
+  },
 }
 
 export default nextConfig
\ No newline at end of file
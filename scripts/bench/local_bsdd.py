@@ -0,0 +1,138 @@
+"""
+Local HTTP stand-in for the bSDD API endpoints ifc_schema/bsdd.py talks to.
+
+Serves a checked-in dictionary (``fixtures/bsdd/ifc-4.3.json``: the
+dictionary fields plus its ``classes`` with their ``classProperties``) the
+way ``api.bsdd.buildingsmart.org`` does:
+
+- ``/api/Dictionary/v1/Classes?Uri=...&Offset=...&Limit=...``  class list page
+- ``/api/Class/v1?Uri=...&IncludeClassProperties=true``        class details
+
+``Limit`` is capped at ``max_page_size`` so paging is exercised with a small
+corpus. Responses carry an ``ETag`` and answer a matching ``If-None-Match``
+with 304, like the real API. ``scale`` multiplies the classes: copy ``k`` of
+``IfcWall`` is served as ``IfcWall_k``.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURE = Path(__file__).parent / "fixtures" / "bsdd" / "ifc-4.3.json"
+
+CLASSES_PATH = "/api/Dictionary/v1/Classes"
+CLASS_PATH = "/api/Class/v1"
+
+
+class LocalBsdd:
+    """Threaded HTTP server serving the fixture dictionary; use as a context manager."""
+
+    def __init__(self, fixture: Path = FIXTURE, scale: int = 1, max_page_size: int = 3):
+        with open(fixture) as f:
+            dictionary = json.load(f)
+        self.max_page_size = max_page_size
+        self.classes = self._scaled(dictionary.pop("classes"), scale)
+        self.dictionary = dictionary
+        self.by_uri = {c["uri"]: c for c in self.classes}
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @staticmethod
+    def _scaled(classes: list[dict], scale: int) -> list[dict]:
+        scaled = list(classes)
+        for k in range(1, scale):
+            for cls in classes:
+                clone = copy.deepcopy(cls)
+                clone["code"] = clone["name"] = f"{cls['code']}_{k}"
+                clone["uri"] = f"{cls['uri']}_{k}"
+                scaled.append(clone)
+        return scaled
+
+    @property
+    def dictionary_uri(self) -> str:
+        return self.dictionary["uri"]
+
+    # -- responses ----------------------------------------------------------
+
+    def class_page(self, offset: int, limit: int) -> dict:
+        limit = max(1, min(limit, self.max_page_size))
+        page = [{k: c[k] for k in ("uri", "code", "name", "classType")}
+                for c in self.classes[offset:offset + limit]]
+        return {**self.dictionary, "classes": page, "classesTotalCount": len(self.classes),
+                "classesOffset": offset, "classesCount": len(page)}
+
+    def respond(self, path: str, params: dict) -> dict | None:
+        uri = params.get("Uri", [""])[0]
+        if path == CLASSES_PATH and uri == self.dictionary_uri:
+            return self.class_page(int(params.get("Offset", ["0"])[0]),
+                                   int(params.get("Limit", ["100"])[0]))
+        if path == CLASS_PATH and uri in self.by_uri:
+            cls = self.by_uri[uri]
+            if params.get("IncludeClassProperties", ["false"])[0].lower() == "true":
+                return cls
+            return {k: v for k, v in cls.items() if k != "classProperties"}
+        return None
+
+    # -- server -------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _record(self, not_modified: bool):
+        with self._lock:
+            self.requests += 1
+            self.not_modified += not_modified
+
+    def _handler(self):
+        bsdd = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                data = bsdd.respond(url.path, parse_qs(url.query))
+                if data is None:
+                    self._send(404, b'{"error": "Not Found"}')
+                    return
+                body = json.dumps(data).encode()
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", etag)
+                else:
+                    self._send(200, body, etag)
+
+            def _send(self, status: int, body: bytes, etag: str | None = None):
+                # Counted before the client can see the response.
+                bsdd._record(status == 304)
+                self.send_response(status)
+                if etag:
+                    self.send_header("ETag", etag)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
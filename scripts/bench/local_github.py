@@ -0,0 +1,154 @@
+"""
+Local HTTP stand-in for the GitHub endpoints the PSD fetcher talks to.
+
+Serves the checked-in fixture corpus (``fixtures/psd``) the way GitHub serves
+``buildingSMART/IFC4.3.x-development``:
+
+- ``/api/contents/reference_schemas/psd``   directory listing (contents API)
+- ``/raw/reference_schemas/psd/<file>``      raw file content
+- ``/tarball``                               tar.gz of the tree (codeload), with
+  the PSD files under ``<repo>-master/reference_schemas/psd/`` among a few
+  unrelated entries
+
+``scale`` multiplies the corpus so the benchmarks see a realistically sized
+set of files (the upstream directory has ~600): copy ``k`` of
+``Pset_WallCommon.xml`` is served as ``Pset_WallCommon__k.xml`` with the set
+renamed to ``Pset_WallCommon_k`` so copies don't collapse when merged.
+"""
+
+import gzip
+import io
+import json
+import re
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "psd"
+
+API_PATH = "/api/contents/reference_schemas/psd"
+RAW_PATH = "/raw/reference_schemas/psd/"
+TARBALL_PATH = "/tarball"
+TARBALL_ROOT = "IFC4.3.x-development-master"
+
+_COPY_NAME = re.compile(r"^(?P<stem>.+?)__(?P<copy>\d+)\.xml$")
+
+
+class LocalGitHub:
+    """Threaded HTTP server serving the fixture corpus; use as a context manager."""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR, scale: int = 1):
+        self.fixtures = {p.name: p.read_bytes() for p in sorted(fixtures_dir.glob("*.xml"))}
+        self.scale = scale
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._tarball: bytes | None = None
+        self._server: ThreadingHTTPServer | None = None
+
+    # -- corpus -------------------------------------------------------------
+
+    def file_names(self) -> list[str]:
+        names = list(self.fixtures)
+        for copy in range(1, self.scale):
+            names.extend(f"{Path(n).stem}__{copy}.xml" for n in self.fixtures)
+        return names
+
+    def file_content(self, name: str) -> bytes | None:
+        if name in self.fixtures:
+            return self.fixtures[name]
+        match = _COPY_NAME.match(name)
+        if not match or f"{match['stem']}.xml" not in self.fixtures:
+            return None
+        stem, copy = match["stem"], match["copy"]
+        content = self.fixtures[f"{stem}.xml"]
+        return content.replace(f"<Name>{stem}</Name>".encode(),
+                               f"<Name>{stem}_{copy}</Name>".encode(), 1)
+
+    def tarball(self) -> bytes:
+        """The tree as GitHub's codeload serves it (built once)."""
+        with self._lock:
+            if self._tarball is None:
+                entries = {"README.md": b"# IFC4.3.x-development\n",
+                           "reference_schemas/psd/README.md": b"PSD templates\n",
+                           "reference_schemas/qto/unrelated.xml": b"<QtoSetDef/>\n"}
+                entries.update((f"reference_schemas/psd/{n}", self.file_content(n))
+                               for n in self.file_names())
+                buffer = io.BytesIO()
+                with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz, \
+                        tarfile.open(fileobj=gz, mode="w") as archive:
+                    for name, content in entries.items():
+                        info = tarfile.TarInfo(f"{TARBALL_ROOT}/{name}")
+                        info.size = len(content)
+                        archive.addfile(info, io.BytesIO(content))
+                self._tarball = buffer.getvalue()
+            return self._tarball
+
+    # -- server -------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return self.base_url + API_PATH
+
+    @property
+    def raw_base(self) -> str:
+        return self.base_url + RAW_PATH.rstrip("/")
+
+    @property
+    def tarball_url(self) -> str:
+        return self.base_url + TARBALL_PATH
+
+    def _record(self, sent: int):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+
+    def _handler(self):
+        github = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path == API_PATH:
+                    listing = [{"name": n, "type": "file"} for n in github.file_names()]
+                    self._send(200, json.dumps(listing).encode(), "application/json")
+                elif self.path == TARBALL_PATH:
+                    self._send(200, github.tarball(), "application/x-gzip")
+                elif self.path.startswith(RAW_PATH):
+                    content = github.file_content(self.path[len(RAW_PATH):])
+                    if content is None:
+                        self._send(404, b"Not Found", "text/plain")
+                    else:
+                        self._send(200, content, "text/plain; charset=utf-8")
+                else:
+                    self._send(404, b"Not Found", "text/plain")
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                github._record(len(body))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the schema generation pipeline.
+
+Times the stages of fetch-and-parse-psd.py, update-schema-index.py and
+export-complete-ifc-schema.py separately against the checked-in PSD/QTO
+fixture corpus (scripts/bench/fixtures/psd), served by a local HTTP stand-in
+for GitHub so runs are offline and repeatable. With requests installed, the
+bSDD crawler (ifc_schema/bsdd.py) is timed against a stand-in serving the
+fixture dictionary (scripts/bench/fixtures/bsdd), cold and revalidating.
+
+Usage:
+    python3 scripts/bench/run-benchmarks.py                  # run + print
+    python3 scripts/bench/run-benchmarks.py --save           # also store results
+    python3 scripts/bench/run-benchmarks.py --compare        # against scripts/bench/baseline.json
+    python3 scripts/bench/run-benchmarks.py --compare scripts/bench/results/<file>.json
+
+Each benchmark runs --repeat times (setup excluded from the timing); min,
+median and mean are reported. With --compare the run fails (exit 1) when a
+benchmark's median is more than --threshold times the stored one. The
+committed reference run is scripts/bench/baseline.json (the results/
+directory is local only); its "meta" says which machine recorded it.
+"""
+
+import argparse
+import contextlib
+import copy
+import importlib.util
+import io
+import json
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS, REPO_ROOT, load_script  # noqa: E402
+from ifc_schema.completion import CompletionIndex, build_completion_index  # noqa: E402
+from ifc_schema.datatypes import build_datatype_matrix  # noqa: E402
+from ifc_schema.docs_index import build_docs_index  # noqa: E402
+from ifc_schema.fuzzy import FuzzyIndex, build_fuzzy_index  # noqa: E402
+from local_bsdd import LocalBsdd  # noqa: E402
+from local_github import LocalGitHub  # noqa: E402
+
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+_DATA_TYPE_ATTR = re.compile(r'<DataType type="([^"]+)"')
+
+
+class Benchmark:
+    """One timed stage: ``setup()`` builds fresh inputs, ``run(inputs)`` is timed."""
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda: None)
+
+
+def time_benchmark(bench: Benchmark, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        inputs = bench.setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            bench.run(inputs)
+            samples.append(time.perf_counter() - start)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+    }
+
+
+def bsdd_benchmarks(bsdd: LocalBsdd, workdir: Path) -> list[Benchmark]:
+    import requests
+    from ifc_schema.bsdd import BsddClient
+
+    session = requests.Session()
+    cache_dir = workdir / "bsdd-cache"
+
+    def cold():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return BsddClient(session, bsdd.base_url, cache_dir)
+
+    def warm():
+        client = BsddClient(session, bsdd.base_url, cache_dir)
+        client.crawl_dictionary(bsdd.dictionary_uri)
+        return client
+
+    return [
+        Benchmark("bsdd.crawl", lambda c: c.crawl_dictionary(bsdd.dictionary_uri), cold),
+        Benchmark("bsdd.revalidate", lambda c: c.crawl_dictionary(bsdd.dictionary_uri), warm),
+    ]
+
+
+def build_benchmarks(github: LocalGitHub, workdir: Path) -> list[Benchmark]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        psd = load_script(SCRIPTS_DIR / "psd" / "fetch-and-parse-psd.py")
+        index_script = load_script(SCRIPTS_DIR / "psd" / "update-schema-index.py")
+    psd.GITHUB_API_URL = github.api_url
+    psd.GITHUB_RAW_BASE = github.raw_base
+
+    # Inputs for the later stages, produced once by running the earlier ones.
+    with contextlib.redirect_stdout(io.StringIO()):
+        files = psd.fetch_file_list(cache_file=None)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            contents = dict(zip(files, executor.map(psd.fetch_psd_xml, files)))
+        parsed = [p for p in (psd.parse_psd_file(c, f) for f, c in contents.items()) if p]
+        merged = psd.merge_duplicate_psets(copy.deepcopy(parsed))
+        by_version = psd.split_by_version(merged)
+    raw_types = [t for c in contents.values() for t in _DATA_TYPE_ATTR.findall(c)]
+
+    def fetch(_):
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(psd.fetch_psd_xml, files))
+
+    def parse(_):
+        for filename, content in contents.items():
+            psd.parse_psd_file(content, filename)
+
+    def normalize(_):
+        for raw in raw_types:
+            psd.normalize_type(raw)
+
+    write_dir = workdir / "write"
+
+    def index_setup():
+        index_dir = workdir / "index"
+        shutil.rmtree(index_dir, ignore_errors=True)
+        index_dir.mkdir()
+        shutil.copy(GENERATED_DIR / "schema-index.json", index_dir)
+        psd.write_property_sets(by_version, index_dir)
+        return index_dir
+
+    simple_types = {}
+    for version in IFC_VERSIONS:
+        with open(GENERATED_DIR / f"simple-types-{version.lower()}.json") as f:
+            simple_types[version] = json.load(f)
+
+    def datatype_matrix(_):
+        for version in IFC_VERSIONS:
+            build_datatype_matrix(version, simple_types[version])
+
+    # Typos and case slips of the kind an IDS author makes.
+    fuzzy_queries = ["Pset_WalCommon", "pset_wallcommon", "IfcWal", "IFCDOORR", "LoadBaring",
+                     "Thermaltransmitance", "Qto_SlabBaseQuantites", "FireRatting"]
+    schema = {}
+    for kind in ("entities", "property-sets", "simple-types"):
+        with open(GENERATED_DIR / f"{kind}-ifc4x3_add2.json") as f:
+            schema[kind] = json.load(f)
+
+    def fuzzy_build(_):
+        build_fuzzy_index("IFC4X3_ADD2", schema["entities"], schema["property-sets"])
+
+    def fuzzy_suggest(index):
+        for query in fuzzy_queries:
+            index.suggest(query)
+
+    # Keystroke by keystroke, against the standard sets plus a 2,000 set
+    # company overlay.
+    completion_queries = [q[:n] for q in ("Pset_WallCommon", "IfcWallStandardCase", "Acme_Pset1234",
+                                          "FireRating", "IFCLABEL") for n in range(1, len(q) + 1)]
+    overlay_psets = [{"name": f"Acme_Pset{i:04d}", "applicableEntities": ["IfcWall"],
+                      "properties": [{"name": f"AcmeProperty{i % 500}", "dataType": "IFCLABEL"}]}
+                     for i in range(2000)]
+
+    def completion_index():
+        return build_completion_index("IFC4X3_ADD2", schema["entities"],
+                                      schema["property-sets"] + overlay_psets, schema["simple-types"])
+
+    def completion_complete(index):
+        for query in completion_queries:
+            for kind in ("entity", "pset", "property", "datatype"):
+                index.complete(query, kind)
+
+    benchmarks = [
+        Benchmark("psd.fetch_file_list", lambda _: psd.fetch_file_list(cache_file=None)),
+        Benchmark("psd.fetch", fetch),
+        Benchmark("psd.fetch_tarball", lambda _: psd.download_and_parse_tarball(github.tarball_url)),
+        Benchmark("psd.parse", parse),
+        Benchmark("psd.normalize", normalize),
+        Benchmark("psd.merge", psd.merge_duplicate_psets, lambda: copy.deepcopy(parsed)),
+        Benchmark("psd.filter", psd.split_by_version, lambda: merged),
+        Benchmark("psd.write", lambda bv: psd.write_property_sets(bv, write_dir), lambda: by_version),
+        Benchmark("index.update", index_script.update_schema_index, index_setup),
+        Benchmark("export.datatype_matrix", datatype_matrix),
+        Benchmark("fuzzy.build", fuzzy_build),
+        Benchmark("fuzzy.suggest", fuzzy_suggest,
+                  lambda: FuzzyIndex(build_fuzzy_index("IFC4X3_ADD2", schema["entities"],
+                                                       schema["property-sets"]))),
+        Benchmark("completion.build", lambda _: completion_index()),
+        Benchmark("completion.complete", completion_complete,
+                  lambda: CompletionIndex(completion_index())),
+        Benchmark("docs.index", lambda _: build_docs_index()),
+    ]
+
+    # The entity export needs IfcOpenShell; importing the exporter without it
+    # would try to pip-install it, so only benchmark it when it's present.
+    if importlib.util.find_spec("ifcopenshell"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            exporter = load_script(SCRIPTS_DIR / "export-complete-ifc-schema.py")
+        benchmarks.append(Benchmark(
+            "export.entities",
+            lambda _: exporter.export_complete_entities(workdir / "entities")))
+    return benchmarks
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print a comparison table; return the names of regressed benchmarks."""
+    regressed = []
+    print(f"\n{'benchmark':28} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, current in results["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if not before:
+            print(f"{name:28} {'-':>10} {current['median'] * 1000:9.2f}ms {'new':>7}")
+            continue
+        ratio = current["median"] / before["median"] if before["median"] else float("inf")
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:28} {before['median'] * 1000:9.2f}ms {current['median'] * 1000:9.2f}ms "
+              f"{ratio:6.2f}x{flag}")
+        if flag:
+            regressed.append(name)
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the schema generation pipeline.")
+    parser.add_argument("--scale", type=int, default=75,
+                        help="copies of the fixture corpus to serve (default: 75, ~600 files)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark (default: 5)")
+    parser.add_argument("--only", help="comma-separated name prefixes to run (e.g. psd.parse,index)")
+    parser.add_argument("--save", nargs="?", const="", metavar="PATH",
+                        help="store results (default: scripts/bench/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_FILE, type=Path, metavar="PATH",
+                        help="results file to compare against (default: the committed "
+                             "scripts/bench/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="median ratio that counts as a regression (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    with LocalGitHub(scale=args.scale) as github, LocalBsdd(scale=args.scale) as bsdd, \
+            tempfile.TemporaryDirectory() as tmp:
+        benchmarks = build_benchmarks(github, Path(tmp))
+        if importlib.util.find_spec("requests"):
+            benchmarks += bsdd_benchmarks(bsdd, Path(tmp))
+        if args.only:
+            prefixes = tuple(args.only.split(","))
+            benchmarks = [b for b in benchmarks if b.name.startswith(prefixes)]
+
+        print(f"Corpus: {len(github.file_names())} PSD files (scale {args.scale}), "
+              f"{args.repeat} runs per benchmark\n")
+        print(f"{'benchmark':28} {'min':>10} {'median':>10} {'mean':>10}")
+        results = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "platform": platform.platform(),
+                "scale": args.scale,
+                "files": len(github.file_names()),
+            },
+            "benchmarks": {},
+        }
+        for bench in benchmarks:
+            timing = time_benchmark(bench, args.repeat)
+            results["benchmarks"][bench.name] = timing
+            print(f"{bench.name:28} {timing['min'] * 1000:9.2f}ms {timing['median'] * 1000:9.2f}ms "
+                  f"{timing['mean'] * 1000:9.2f}ms")
+
+    if args.save is not None:
+        if args.save:
+            path = Path(args.save)
+        else:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+            path = RESULTS_DIR / f"{stamp}-{results['meta']['commit'] or 'nogit'}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved results to {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        meta = baseline.get("meta", {})
+        print(f"\nBaseline {args.compare}: commit {meta.get('commit') or '?'}, "
+              f"Python {meta.get('python', '?')} on {meta.get('platform', '?')}")
+        if meta.get("machine") not in (None, results["meta"]["machine"]):
+            print(f"  (recorded on {meta['machine']}, this is {results['meta']['machine']}; "
+                  "ratios are only indicative)")
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} benchmark(s) regressed beyond {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,11 @@ import os
 import sys
 from pathlib import Path
 
+from ifc_schema import metrics
+from ifc_schema.datatypes import write_datatype_matrices
+from ifc_schema.output import write_json
+from ifc_schema.schema_index import index_from_files, write_schema_index
+
 try:
     import ifcopenshell
     import ifcopenshell.api
@@ -20,7 +25,112 @@ except ImportError:
     import ifcopenshell.api
     import ifcopenshell.util.element
 
-def export_complete_entities():
+OUTPUT_DIR = Path(__file__).parent.parent / "lib" / "generated" / "ifc-schema"
+
+def build_entities(version_name, version_code=None):
+    """Extract every entity of one IFC version from the IfcOpenShell schema"""
+    
+    # Get schema using IfcOpenShell
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(version_code or version_name)
+    
+    entities = []
+    
+    # Get ALL entities from schema
+    entity_names = schema.entities()
+    print(f"  📊 Found {len(entity_names)} entities in schema")
+    
+    for entity_obj in entity_names:
+        try:
+            # Extract entity name from entity object
+            entity_name = str(entity_obj)
+            if entity_name.startswith('<entity '):
+                entity_name = entity_name[8:-1]  # Remove '<entity ' and '>'
+            
+            # Get entity declaration
+            entity_decl = schema.declaration_by_name(entity_name)
+            
+            # Extract predefined types from the PredefinedType attribute's enum
+            predefined_types = []
+            if hasattr(entity_decl, 'all_attributes'):
+                try:
+                    for attr in entity_decl.all_attributes():
+                        if attr.name() == 'PredefinedType':
+                            toa = attr.type_of_attribute()
+                            dt = toa.declared_type()
+                            if hasattr(dt, 'enumeration_items'):
+                                predefined_types = list(dt.enumeration_items())
+                            break
+                except:
+                    pass
+            
+            # Extract attributes
+            attributes = []
+            if hasattr(entity_decl, 'all_attributes'):
+                try:
+                    for attr in entity_decl.all_attributes():
+                        attr_data = {
+                            'name': attr.name(),
+                            'optional': attr.optional()
+                        }
+                        try:
+                            attr_data['type'] = attr.type_of_attribute().declared_type().name()
+                        except:
+                            attr_data['type'] = 'UNKNOWN'
+                        attributes.append(attr_data)
+                except:
+                    pass
+            
+            # Get supertype and subtypes
+            supertype = None
+            subtypes = []
+            try:
+                if hasattr(entity_decl, 'supertype'):
+                    supertype_decl = entity_decl.supertype()
+                    if supertype_decl:
+                        supertype = supertype_decl.name()
+                
+                if hasattr(entity_decl, 'subtypes'):
+                    subtypes = [subtype.name() for subtype in entity_decl.subtypes()]
+            except:
+                pass
+            
+            # Determine category
+            category = determine_entity_category(entity_name)
+            
+            entity_data = {
+                'name': entity_name,
+                'category': category,
+                'predefinedTypes': predefined_types,
+                'attributes': attributes,
+                'supertype': supertype,
+                'subtypes': subtypes,
+                'description': f"IFC {version_name} entity: {entity_name}",
+                'ifcVersion': [version_name]
+            }
+            
+            entities.append(entity_data)
+            
+        except Exception as entity_error:
+            metrics.incr("entities.fallback")
+            print(f"    ⚠️  Error processing entity {entity_name}: {entity_error}")
+            # Add basic entity data even if detailed extraction fails
+            entities.append({
+                'name': entity_name,
+                'category': determine_entity_category(entity_name),
+                'predefinedTypes': [],
+                'attributes': [],
+                'supertype': None,
+                'subtypes': [],
+                'description': f"IFC {version_name} entity: {entity_name}",
+                'ifcVersion': [version_name]
+            })
+    
+    # Sort by category then name
+    entities.sort(key=lambda x: (x['category'], x['name']))
+    metrics.incr(f"entities.{version_name}", len(entities))
+    return entities
+
+def export_complete_entities(output_dir=OUTPUT_DIR):
     """Export ALL IFC entities with complete metadata using IfcOpenShell"""
     
     # IFC versions to export
@@ -30,123 +140,29 @@ def export_complete_entities():
         'IFC4X3_ADD2': 'IFC4X3_ADD2'
     }
     
+    exported = {}
     for version_name, version_code in versions.items():
         print(f"\n📋 Exporting {version_name} entities...")
         
         try:
-            # Get schema using IfcOpenShell
-            schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(version_code)
-            
-            entities = []
-            
-            # Get ALL entities from schema
-            entity_names = schema.entities()
-            print(f"  📊 Found {len(entity_names)} entities in schema")
-            
-            for entity_obj in entity_names:
-                try:
-                    # Extract entity name from entity object
-                    entity_name = str(entity_obj)
-                    if entity_name.startswith('<entity '):
-                        entity_name = entity_name[8:-1]  # Remove '<entity ' and '>'
-                    
-                    # Get entity declaration
-                    entity_decl = schema.declaration_by_name(entity_name)
-                    
-                    # Extract predefined types from the PredefinedType attribute's enum
-                    predefined_types = []
-                    if hasattr(entity_decl, 'all_attributes'):
-                        try:
-                            for attr in entity_decl.all_attributes():
-                                if attr.name() == 'PredefinedType':
-                                    toa = attr.type_of_attribute()
-                                    dt = toa.declared_type()
-                                    if hasattr(dt, 'enumeration_items'):
-                                        predefined_types = list(dt.enumeration_items())
-                                    break
-                        except:
-                            pass
-                    
-                    # Extract attributes
-                    attributes = []
-                    if hasattr(entity_decl, 'all_attributes'):
-                        try:
-                            for attr in entity_decl.all_attributes():
-                                attr_data = {
-                                    'name': attr.name(),
-                                    'optional': attr.optional()
-                                }
-                                try:
-                                    attr_data['type'] = attr.type_of_attribute().declared_type().name()
-                                except:
-                                    attr_data['type'] = 'UNKNOWN'
-                                attributes.append(attr_data)
-                        except:
-                            pass
-                    
-                    # Get supertype and subtypes
-                    supertype = None
-                    subtypes = []
-                    try:
-                        if hasattr(entity_decl, 'supertype'):
-                            supertype_decl = entity_decl.supertype()
-                            if supertype_decl:
-                                supertype = supertype_decl.name()
-                        
-                        if hasattr(entity_decl, 'subtypes'):
-                            subtypes = [subtype.name() for subtype in entity_decl.subtypes()]
-                    except:
-                        pass
-                    
-                    # Determine category
-                    category = determine_entity_category(entity_name)
-                    
-                    entity_data = {
-                        'name': entity_name,
-                        'category': category,
-                        'predefinedTypes': predefined_types,
-                        'attributes': attributes,
-                        'supertype': supertype,
-                        'subtypes': subtypes,
-                        'description': f"IFC {version_name} entity: {entity_name}",
-                        'ifcVersion': [version_name]
-                    }
-                    
-                    entities.append(entity_data)
-                    
-                except Exception as entity_error:
-                    print(f"    ⚠️  Error processing entity {entity_name}: {entity_error}")
-                    # Add basic entity data even if detailed extraction fails
-                    entities.append({
-                        'name': entity_name,
-                        'category': determine_entity_category(entity_name),
-                        'predefinedTypes': [],
-                        'attributes': [],
-                        'supertype': None,
-                        'subtypes': [],
-                        'description': f"IFC {version_name} entity: {entity_name}",
-                        'ifcVersion': [version_name]
-                    })
-            
-            # Sort by category then name
-            entities.sort(key=lambda x: (x['category'], x['name']))
+            entities = build_entities(version_name, version_code)
             
             print(f"  ✅ Exported {len(entities)} entities")
             
             # Write to file
-            output_dir = Path(__file__).parent.parent / "lib" / "generated" / "ifc-schema"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
             output_file = output_dir / f"entities-{version_name.lower()}.json"
-            with open(output_file, 'w') as f:
-                json.dump(entities, f, indent=2)
+            write_json(output_file, entities)
             
             print(f"  📁 Saved to {output_file}")
+            exported[version_name] = entities
             
         except Exception as e:
+            metrics.incr("entities.version_failures")
             print(f"  ❌ Error exporting {version_name}: {e}")
             print(f"  🔍 Available schemas: {ifcopenshell.ifcopenshell_wrapper.schema_names()}")
             continue
+    
+    return exported
 
 def determine_entity_category(entity_name):
     """Determine entity category based on name patterns"""
@@ -205,6 +221,18 @@ def export_property_sets():
         else:
             print(f"  ⚠️  No property sets found for {version}")
 
+def export_datatype_matrices():
+    """Precompute datatype category/compatibility tables from the simple types"""
+
+    print("\n📋 Building datatype compatibility matrices...")
+
+    output_dir = Path(__file__).parent.parent / "lib" / "generated" / "ifc-schema"
+    try:
+        for version, path in write_datatype_matrices(output_dir).items():
+            print(f"  ✅ {version}: {path.name}")
+    except (OSError, ValueError) as e:
+        print(f"  ⚠️  Could not build datatype matrices: {e}")
+
 def generate_comprehensive_property_sets(version):
     """Generate comprehensive property sets as fallback"""
     
@@ -370,50 +398,14 @@ def generate_comprehensive_property_sets(version):
     
     return property_sets
 
-def create_schema_index():
+def create_schema_index(output_dir=OUTPUT_DIR):
     """Create schema index for quick lookups"""
     
-    output_dir = Path(__file__).parent.parent / "lib" / "generated" / "ifc-schema"
-    
-    index = {
-        "versions": ["IFC2X3", "IFC4", "IFC4X3_ADD2"],
-        "lastGenerated": "2025-01-13T00:00:00.000Z",
-        "entityCounts": {},
-        "propertySetCounts": {},
-        "categories": {
-            "Building Element": "Structural building components",
-            "Spatial Structure": "Spatial organization elements", 
-            "MEP Element": "Mechanical, electrical, plumbing",
-            "Structural Element": "Structural engineering elements",
-            "Material & Property": "Materials and properties",
-            "Geometry & Representation": "Geometric representations",
-            "Process & Control": "Process control systems",
-            "Documentation": "Documentation and references",
-            "Other": "Other IFC entities"
-        }
-    }
-    
-    # Count entities and property sets
-    for version in index["versions"]:
-        try:
-            entities_file = output_dir / f"entities-{version.lower()}.json"
-            if entities_file.exists():
-                with open(entities_file) as f:
-                    entities = json.load(f)
-                    index["entityCounts"][version] = len(entities)
-            
-            psets_file = output_dir / f"property-sets-{version.lower()}.json"
-            if psets_file.exists():
-                with open(psets_file) as f:
-                    psets = json.load(f)
-                    index["propertySetCounts"][version] = len(psets)
-        except:
-            continue
+    # Count entities and property sets, hash and size every file
+    index = index_from_files(output_dir)
     
     # Write index
-    index_file = output_dir / "schema-index.json"
-    with open(index_file, 'w') as f:
-        json.dump(index, f, indent=2)
+    index_file = write_schema_index(index, output_dir)
     
     print(f"\n📊 Schema index created: {index_file}")
     print(f"   Entity counts: {index['entityCounts']}")
@@ -447,20 +439,28 @@ def main():
     print("   This will export ALL entities and property sets")
     
     # Check available schemas first
-    check_available_schemas()
+    with metrics.stage("check_schemas"):
+        check_available_schemas()
     
     # Export entities
-    export_complete_entities()
+    with metrics.stage("entities"):
+        export_complete_entities()
     
     # Export property sets  
-    export_property_sets()
+    with metrics.stage("property_sets"):
+        export_property_sets()
+
+    # Precompute datatype compatibility tables
+    with metrics.stage("datatype_matrix"):
+        export_datatype_matrices()
     
     # Create index
-    create_schema_index()
+    with metrics.stage("schema_index"):
+        create_schema_index()
     
     print("\n✅ Complete IFC schema export finished!")
-    print("   Copy files to public directory for browser access:")
-    print("   cp -r lib/generated/ifc-schema/* public/generated/")
+    print("   Changed files were published to public/generated/")
+    metrics.write_report("export-complete-ifc-schema")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Generate the IFC schema data (``npm run generate-schema``).
+
+Runs the generator stages as one dependency graph in a single process:
+
+    psd_file_list ─▶ property_sets ─┬─▶ enumerations ─┐
+                                    ├─▶ applicability ┤
+                                    ├─▶ fuzzy ────────┤
+                                    ├─▶ completion ───┤
+                                    ├─▶ snapshot ─────┴─▶ schema_index ─▶ publish ─▶ manifest
+    entities ───────────────────────┤                     ▲
+    datatype_matrix ────────────────┴─────────────────────┤
+    docs_index ───────────────────────────────────────────┘
+
+Results are handed between stages in memory (the schema index is built from
+the record counts the PSD and entity stages return and the digests of the
+files they just wrote, rather than by re-reading them), independent stages run concurrently, and stages whose inputs haven't
+changed since the last run are skipped. Outputs are written atomically and
+published to ``public/generated`` as they're written (ifc_schema/output.py);
+the final ``publish`` stage, which replaces the old
+``cp -r lib/generated/ifc-schema/* public/generated/``, only catches files no
+stage wrote (the simple types) or that drifted. ``manifest`` then adds the
+content-hashed copies and ``public/generated/manifest.json`` the browser
+resolves file names through (ifc_schema/manifest.py). ``snapshot`` writes the
+binary ``schema-snapshot-{version}.bin`` files server-side consumers mmap
+(ifc_schema/snapshot.py); they stay in ``lib/generated/ifc-schema``.
+``docs_index`` turns the markdown in ``ids-docs/`` into the docs search
+index (ifc_schema/docs_index.py).
+
+``property_sets`` reads the official per-version PSD bundles when
+scripts/psd/download-psd.py has fetched all of them into
+``scripts/psd/downloaded`` (each version then gets exactly its own sets);
+otherwise it falls back to the IFC4X3 development tree on GitHub and derives
+IFC4 / IFC2X3 by name prefix. Overlay packs in ``scripts/psd/overlays`` are
+then merged on top (ifc_schema/layers.py), each also written as its own
+``pset-layer-{name}.json`` delta. When the PSD fetch mostly fails (e.g. an
+offline ``postinstall``), a version comes out empty or no pset is scoped to a
+predefined type, the stage fails before writing anything, so the committed
+property sets stay in place.
+
+Before any of that, a whole-run fingerprint (hashes of the generator code,
+the PSD file list and the simple types, the IfcOpenShell version, and the
+size/mtime of every generated file) is compared with the one stored after
+the last run. If nothing moved the script exits right away, which keeps
+``postinstall`` to a few milliseconds on repeated installs. A failed run
+stores its fingerprint flagged as failed, so an offline install doesn't
+retry the fetch every time either; only changed inputs (or ``--force``)
+start a new run.
+
+The individual scripts (scripts/psd/fetch-and-parse-psd.py,
+scripts/export-complete-ifc-schema.py, ...) still work on their own.
+
+Usage:
+    python3 scripts/generate-schema.py                    # incremental run
+    python3 scripts/generate-schema.py --force            # skip the no-op check, re-run every stage
+    python3 scripts/generate-schema.py --force property_sets
+    python3 scripts/generate-schema.py --verify           # regenerate and diff, exit 1 on drift
+    python3 scripts/generate-schema.py --prune            # drop superseded hashed files before committing
+
+Output is canonical (sorted property sets and properties, fixed key order,
+one JSON format), so the same inputs give byte-identical files; ``--verify``
+checks exactly that. It also fails while ``public/generated`` holds hashed
+copies the manifest no longer references (the ``manifest`` stage keeps the
+previous generation for a running server); ``--prune`` deletes them.
+"""
+
+import argparse
+import difflib
+import importlib.util
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS, PUBLIC_GENERATED_DIR, load_script, metrics  # noqa: E402
+from ifc_schema.applicability import (  # noqa: E402
+    build_applicability_index, count_scoped, write_applicability_indexes,
+)
+from ifc_schema.completion import write_completion_indexes  # noqa: E402
+from ifc_schema.datatypes import write_datatype_matrices  # noqa: E402
+from ifc_schema.docs_index import INDEX_FILE as DOCS_INDEX_FILE, docs_files, write_docs_index  # noqa: E402
+from ifc_schema.enumerations import write_enumeration_indexes  # noqa: E402
+from ifc_schema.fuzzy import write_fuzzy_indexes  # noqa: E402
+from ifc_schema.layers import (  # noqa: E402
+    delta_files, load_overlays, merge_layers, overlay_files, write_layer_deltas,
+)
+from ifc_schema.locales import locale_pack_files, split_localizations, write_locale_packs  # noqa: E402
+from ifc_schema.manifest import prune_superseded, superseded_files, write_manifest  # noqa: E402
+from ifc_schema.output import publish_file, write_json  # noqa: E402
+from ifc_schema.pipeline import (  # noqa: E402
+    PipelineError, Stage, read_fingerprint, run_pipeline, tree_fingerprint, write_fingerprint,
+)
+from ifc_schema.schema_index import (  # noqa: E402
+    build_schema_index, describe_generated, read_schema_index, write_schema_index,
+)
+from ifc_schema.snapshot import snapshot_path, write_snapshot  # noqa: E402
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PSD_SCRIPT = SCRIPTS_DIR / "psd" / "fetch-and-parse-psd.py"
+EXPORT_SCRIPT = SCRIPTS_DIR / "export-complete-ifc-schema.py"
+PACKAGE_DIR = SCRIPTS_DIR / "ifc_schema"
+PSD_FILE_LIST = SCRIPTS_DIR / "psd" / "psd_file_list.json"
+PSD_ARCHIVE_DIR = SCRIPTS_DIR / "psd" / "downloaded"
+
+# Share of the listed PSD files that must download and parse; below it the
+# run is treated as offline/broken and the committed property sets are kept.
+MIN_PARSED_FRACTION = 0.9
+
+
+def _version_files(prefix: str, output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    return {v: output_dir / f"{prefix}-{v.lower()}.json" for v in IFC_VERSIONS}
+
+
+def _load_version_files(prefix: str, output_dir: Path = GENERATED_DIR) -> dict[str, list]:
+    loaded = {}
+    for version, path in _version_files(prefix, output_dir).items():
+        with open(path) as f:
+            loaded[version] = json.load(f)
+    return loaded
+
+
+def ifcopenshell_version() -> str | None:
+    if not importlib.util.find_spec("ifcopenshell"):
+        return None
+    from importlib import metadata  # slow to import; only needed when it's installed
+    try:
+        return metadata.version("ifcopenshell")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run_fingerprint() -> str:
+    inputs = [Path(__file__).resolve(), PSD_SCRIPT, EXPORT_SCRIPT, PSD_FILE_LIST,
+              *sorted(PACKAGE_DIR.glob("*.py")), *_version_files("simple-types").values(),
+              *overlay_files(), *docs_files()]
+    outputs = [*sorted(GENERATED_DIR.glob("*.json")), *sorted(GENERATED_DIR.glob("*.bin")),
+               *sorted(PUBLIC_GENERATED_DIR.glob("*.json"))]
+    # The PSD bundles are too big to hash on every install; size and mtime will do.
+    archives = {p.name: [p.stat().st_size, p.stat().st_mtime_ns]
+                for p in sorted(PSD_ARCHIVE_DIR.glob("*_PropertySets.zip"))}
+    return tree_fingerprint(inputs, outputs, {"ifcopenshell": ifcopenshell_version(),
+                                              "psdArchives": archives})
+
+
+# -- stages -----------------------------------------------------------------
+
+def psd_archives() -> dict[str, Path]:
+    return load_script(PSD_SCRIPT).find_archives(PSD_ARCHIVE_DIR)
+
+
+def psd_file_list(_):
+    # With the official bundles downloaded there's nothing to list.
+    if psd_archives():
+        return []
+    return load_script(PSD_SCRIPT).fetch_file_list()
+
+
+def _check_versions(by_version: dict[str, list[dict]]):
+    # Raised before anything is written, so the previous outputs stay in place.
+    empty = [v for v in IFC_VERSIONS if not by_version.get(v)]
+    if empty:
+        raise PipelineError(f"No property sets parsed for {', '.join(empty)}; "
+                            "keeping the committed property sets")
+    # Every PSD release scopes some psets to predefined types (IfcWall/STANDARD);
+    # none at all means the parser lost applicablePredefinedTypes.
+    if not any(count_scoped(build_applicability_index(v, psets))
+               for v, psets in by_version.items()):
+        raise PipelineError("No entity has property sets scoped to a predefined type; "
+                            "the parsed property sets carry no applicablePredefinedTypes")
+
+
+def property_sets(results, output_dir):
+    psd = load_script(PSD_SCRIPT)
+    archives = psd_archives()
+    if archives:
+        print(f"\nParsing PSD bundles from {PSD_ARCHIVE_DIR}...")
+        by_version, locale_packs = psd.parse_archives(archives)
+        _check_versions(by_version)
+    else:
+        xml_files = results["psd_file_list"]
+        if not xml_files:
+            raise PipelineError("Could not fetch the PSD file list")
+
+        print(f"\nDownloading and parsing {len(xml_files)} PSD files...")
+        try:
+            parsed, failed = psd.download_and_parse(xml_files)
+        except psd.FetchAborted as e:
+            raise PipelineError(f"PSD download failed ({e}); keeping the committed property sets")
+        print(f"  Successfully parsed: {len(parsed)} property sets")
+        if failed:
+            print(f"  Failed: {len(failed)} files")
+        if len(parsed) < MIN_PARSED_FRACTION * len(xml_files):
+            raise PipelineError(f"Only {len(parsed)} of {len(xml_files)} PSD files parsed; "
+                                "keeping the committed property sets")
+        locale_packs = split_localizations(parsed)
+        by_version = psd.split_by_version(psd.merge_duplicate_psets(parsed))
+        _check_versions(by_version)
+    layers = [("psd", by_version), *load_overlays()]
+    if len(layers) > 1:
+        print(f"  Merging overlay packs: {', '.join(name for name, _ in layers[1:])}")
+        by_version, deltas = merge_layers(layers)
+    else:
+        deltas = {}
+    for path in psd.write_property_sets(by_version, output_dir):
+        print(f"  Wrote {path}")
+    for path in write_layer_deltas(layers, deltas, output_dir):
+        print(f"  Wrote {path}")
+    packs = write_locale_packs(locale_packs, output_dir)
+    print(f"  Wrote {len(packs)} locale pack(s)")
+    for version, psets in by_version.items():
+        metrics.incr(f"psets.{version}", len(psets))
+    return by_version
+
+
+def entities(_, output_dir):
+    # Importing the exporter without IfcOpenShell would pip-install it; keep
+    # the committed entity files instead, like the postinstall fallback does.
+    if ifcopenshell_version() is None:
+        print("IfcOpenShell not installed, keeping the committed entity files")
+        committed = _load_version_files("entities")
+        for version, path in _version_files("entities", output_dir).items():
+            write_json(path, committed[version])
+        return committed
+
+    exporter = load_script(EXPORT_SCRIPT)
+    exported = exporter.export_complete_entities(output_dir)
+    missing = [v for v in IFC_VERSIONS if v not in exported]
+    if missing:
+        committed = _load_version_files("entities")
+        exported.update({v: committed[v] for v in missing})
+    return exported
+
+
+def datatype_matrix(_, output_dir):
+    written = write_datatype_matrices(output_dir)
+    for version, path in written.items():
+        print(f"  {version}: {path.name}")
+    return written
+
+
+def enumerations(results, output_dir):
+    by_version = results["property_sets"]
+    written = write_enumeration_indexes(by_version, output_dir)
+    for version in by_version:
+        if version in written:
+            print(f"  {version}: {written[version].name}")
+        else:
+            print(f"  {version}: no enumerated properties, no index written")
+    return written
+
+
+def applicability(results, output_dir):
+    by_version = results["property_sets"]
+    written = write_applicability_indexes(by_version, output_dir)
+    for version, psets in by_version.items():
+        if version in written:
+            scoped = count_scoped(build_applicability_index(version, psets))
+            print(f"  {version}: {written[version].name} ({scoped} entities with scoped psets)")
+        else:
+            print(f"  {version}: no psets scoped to predefined types, no index written")
+    return written
+
+
+def fuzzy(results, output_dir):
+    written = write_fuzzy_indexes(results["entities"], results["property_sets"], output_dir)
+    for version, path in written.items():
+        print(f"  {version}: {path.name}")
+    return written
+
+
+def completion(results, output_dir):
+    written = write_completion_indexes(results["entities"], results["property_sets"],
+                                       _load_version_files("simple-types", output_dir), output_dir)
+    for version, path in written.items():
+        print(f"  {version}: {path.name}")
+    return written
+
+
+def docs_index(_, output_dir):
+    path = write_docs_index(output_dir=output_dir)
+    print(f"  {path.name}")
+    return path
+
+
+def snapshot(results, output_dir):
+    written = {}
+    for version, path in results["datatype_matrix"].items():
+        with open(path) as f:
+            matrix = json.load(f)
+        written[version] = write_snapshot(version, results["entities"].get(version, []),
+                                          results["property_sets"].get(version, []),
+                                          matrix, output_dir)
+        print(f"  {version}: {written[version].name}")
+    return written
+
+
+def schema_index(results, output_dir):
+    entity_counts = {v: len(e) for v, e in results["entities"].items()}
+    pset_counts = {v: len(p) for v, p in results["property_sets"].items()}
+    records = {f"entities-{v.lower()}.json": n for v, n in entity_counts.items()}
+    records.update({f"property-sets-{v.lower()}.json": n for v, n in pset_counts.items()})
+    # Always the committed index, so --verify reproduces its timestamp.
+    previous = read_schema_index(GENERATED_DIR)
+    index = build_schema_index(
+        entity_counts, pset_counts, previous=previous,
+        files=describe_generated(output_dir, records=records, previous=previous),
+    )
+    path = write_schema_index(index, output_dir)
+    print(f"Schema index: {path}")
+    print(f"   Entity counts: {index['entityCounts']}")
+    print(f"   Property set counts: {index['propertySetCounts']}")
+    return index
+
+
+def publish(_):
+    """Publish generated files the stages didn't already publish."""
+    copied = [PUBLIC_GENERATED_DIR / source.name
+              for source in sorted(GENERATED_DIR.glob("*.json"))
+              if publish_file(source, PUBLIC_GENERATED_DIR / source.name)]
+    print(f"Published {len(copied)} changed file(s) to {PUBLIC_GENERATED_DIR}")
+    return copied
+
+
+def manifest(_):
+    written = write_manifest(PUBLIC_GENERATED_DIR)
+    print(f"Manifest: {len(written['files'])} content-hashed file(s)")
+    return written
+
+
+def build_stages(output_dir: Path = GENERATED_DIR) -> list[Stage]:
+    """The stage graph writing into ``output_dir``.
+
+    ``publish`` and ``manifest`` are only part of the graph for the real
+    output directory (``--verify`` regenerates into a scratch directory).
+    """
+    simple_types = _version_files("simple-types", output_dir)
+    stages = [
+        Stage("psd_file_list", psd_file_list),
+        Stage("property_sets", lambda r: property_sets(r, output_dir), deps=("psd_file_list",),
+              inputs=lambda r: [r["psd_file_list"], PSD_SCRIPT, PACKAGE_DIR / "canonical.py",
+                                *psd_archives().values(), PACKAGE_DIR / "layers.py",
+                                *overlay_files()],
+              outputs=lambda: [*_version_files("property-sets", output_dir).values(),
+                               *locale_pack_files(output_dir), *delta_files(output_dir)],
+              load=lambda: _load_version_files("property-sets", output_dir)),
+        Stage("entities", lambda r: entities(r, output_dir),
+              inputs=lambda r: [ifcopenshell_version(), EXPORT_SCRIPT],
+              outputs=lambda: list(_version_files("entities", output_dir).values()),
+              load=lambda: _load_version_files("entities", output_dir)),
+        Stage("datatype_matrix", lambda r: datatype_matrix(r, output_dir),
+              inputs=lambda r: [*simple_types.values(), PACKAGE_DIR / "datatypes.py"],
+              outputs=lambda: list(_version_files("datatype-matrix", output_dir).values()),
+              load=lambda: _version_files("datatype-matrix", output_dir)),
+        Stage("enumerations", lambda r: enumerations(r, output_dir), deps=("property_sets",),
+              inputs=lambda r: [PACKAGE_DIR / "enumerations.py"],
+              outputs=lambda: list(_version_files("enumerations", output_dir).values()),
+              load=lambda: _version_files("enumerations", output_dir)),
+        Stage("applicability", lambda r: applicability(r, output_dir), deps=("property_sets",),
+              inputs=lambda r: [PACKAGE_DIR / "applicability.py"],
+              outputs=lambda: list(_version_files("applicability", output_dir).values()),
+              load=lambda: _version_files("applicability", output_dir)),
+        Stage("fuzzy", lambda r: fuzzy(r, output_dir), deps=("property_sets", "entities"),
+              inputs=lambda r: [PACKAGE_DIR / "fuzzy.py"],
+              outputs=lambda: list(_version_files("fuzzy", output_dir).values()),
+              load=lambda: _version_files("fuzzy", output_dir)),
+        Stage("completion", lambda r: completion(r, output_dir), deps=("property_sets", "entities"),
+              inputs=lambda r: [PACKAGE_DIR / "completion.py", *simple_types.values()],
+              outputs=lambda: list(_version_files("completion", output_dir).values()),
+              load=lambda: _version_files("completion", output_dir)),
+        Stage("docs_index", lambda r: docs_index(r, output_dir),
+              inputs=lambda r: [PACKAGE_DIR / "docs_index.py", *docs_files()],
+              outputs=lambda: [output_dir / DOCS_INDEX_FILE],
+              load=lambda: output_dir / DOCS_INDEX_FILE),
+        Stage("snapshot", lambda r: snapshot(r, output_dir),
+              deps=("property_sets", "entities", "datatype_matrix"),
+              inputs=lambda r: [PACKAGE_DIR / "snapshot.py"],
+              outputs=lambda: [snapshot_path(v, output_dir) for v in IFC_VERSIONS],
+              load=lambda: {v: snapshot_path(v, output_dir) for v in IFC_VERSIONS}),
+        Stage("schema_index", lambda r: schema_index(r, output_dir),
+              deps=("property_sets", "entities", "datatype_matrix", "enumerations",
+                    "applicability", "fuzzy", "completion", "docs_index", "snapshot"),
+              inputs=lambda r: [PACKAGE_DIR / "schema_index.py", *simple_types.values()],
+              outputs=lambda: [output_dir / "schema-index.json"],
+              load=lambda: read_schema_index(output_dir)),
+    ]
+    if output_dir == GENERATED_DIR:
+        stages += [
+            Stage("publish", publish,
+                  deps=("property_sets", "entities", "datatype_matrix", "enumerations",
+                        "applicability", "fuzzy", "completion", "docs_index", "schema_index")),
+            Stage("manifest", manifest, deps=("publish",)),
+        ]
+    return stages
+
+
+def verify(jobs: int) -> int:
+    """Regenerate into a scratch directory and diff against lib/generated."""
+    print("🔍 Regenerating into a scratch directory to verify reproducibility")
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        # Inputs no stage produces.
+        for path in _version_files("simple-types").values():
+            shutil.copyfile(path, scratch / path.name)
+        try:
+            run_pipeline(build_stages(scratch), force=True, jobs=jobs,
+                         state_file=scratch / ".pipeline-state")
+        except PipelineError as e:
+            print(f"\n❌ {e}")
+            return 1
+
+        differing = []
+        for fresh in sorted([*scratch.glob("*.json"), *scratch.glob("*.bin")]):
+            committed = GENERATED_DIR / fresh.name
+            if not committed.exists() or committed.read_bytes() != fresh.read_bytes():
+                differing.append((committed, fresh))
+
+        superseded = superseded_files(PUBLIC_GENERATED_DIR)
+        if superseded:
+            print(f"\n❌ {len(superseded)} hashed file(s) in {PUBLIC_GENERATED_DIR} are not in "
+                  "the manifest (run with --prune):")
+            for path in superseded:
+                print(f"    {path.name}")
+        if not differing:
+            if superseded:
+                return 1
+            print("\n✅ Regenerated output is byte-identical to lib/generated/ifc-schema")
+            return 0
+        print(f"\n❌ {len(differing)} file(s) differ from a fresh regeneration:")
+        for committed, fresh in differing:
+            if fresh.suffix == ".bin":
+                print(f"\n  {committed.name}: binary content differs")
+                continue
+            old = committed.read_text().splitlines() if committed.exists() else []
+            diff = list(difflib.unified_diff(old, fresh.read_text().splitlines(),
+                                             str(committed), "regenerated", lineterm="", n=1))
+            print(f"\n  {committed.name}: {max(len(diff) - 2, 0)} diff line(s)")
+            for line in diff[2:22]:
+                print(f"    {line}")
+        return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    stages = build_stages()
+    parser = argparse.ArgumentParser(description="Generate the IFC schema data.")
+    parser.add_argument("--force", nargs="*", metavar="STAGE",
+                        help="re-run all stages, or only the named ones "
+                             f"({', '.join(s.name for s in stages)})")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="stages to run concurrently (default: 4)")
+    parser.add_argument("--verify", action="store_true",
+                        help="regenerate into a scratch directory and fail if the output "
+                             "differs from lib/generated/ifc-schema")
+    parser.add_argument("--prune", action="store_true",
+                        help="delete the hashed files in public/generated the manifest "
+                             "no longer references")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        return verify(args.jobs)
+    if args.prune:
+        pruned = prune_superseded(PUBLIC_GENERATED_DIR)
+        for path in pruned:
+            print(f"  Removed {path.name}")
+        print(f"🧹 Pruned {len(pruned)} superseded hashed file(s)")
+        return 0
+
+    force: set[str] | bool = False
+    if args.force is not None:
+        force = set(args.force) if args.force else True
+        unknown = force - {s.name for s in stages} if force is not True else set()
+        if unknown:
+            parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    if not force:
+        start = time.perf_counter()
+        previous, failed = read_fingerprint()
+        if previous == run_fingerprint():
+            elapsed = (time.perf_counter() - start) * 1000
+            if failed:
+                print(f"⏭️  The last run with these inputs failed ({elapsed:.0f} ms check); "
+                      "keeping the committed schema data. Use --force to retry.")
+            else:
+                print(f"✅ Schema data up to date ({elapsed:.0f} ms check), nothing to generate. "
+                      "Use --force to regenerate.")
+            return 0
+
+    print("🚀 Generating IFC schema data")
+    try:
+        run_pipeline(stages, force=force, jobs=args.jobs)
+    except PipelineError as e:
+        print(f"\n❌ {e}")
+        # Remembered too, so an offline install doesn't refetch on every run.
+        write_fingerprint(run_fingerprint(), failed=True)
+        return 1
+    finally:
+        metrics.write_report("generate-schema")
+    # Taken after the run so it covers the files the stages just wrote.
+    write_fingerprint(run_fingerprint())
+    print("\n✅ Schema generation finished")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Headless IFC schema audit for IDS files.
+
+Runs the same checks as the editor's in-browser validation
+(lib/ids-client-validation.ts) against the generated schema data in
+lib/generated/ifc-schema/. --strict adds warnings for unknown entities,
+non-standard predefined types and unknown Pset_/Qto_ property sets, which
+the editor accepts. Directories are searched recursively for *.ids and
+*.xml files, which are audited in parallel across processes.
+
+Usage:
+    python3 scripts/ids-audit.py path/to/file.ids path/to/ids-dir/
+    python3 scripts/ids-audit.py ids/ --jobs 8 --json > audit.json
+    python3 scripts/ids-audit.py ids/ --strict --fail-on warning
+
+Exit status is 1 when any file has an error (or a warning with
+--fail-on warning), so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS
+from ifc_schema.audit import audit_file, get_schema_index
+
+IDS_SUFFIXES = (".ids", ".xml")
+
+
+def collect_files(paths: list[str]) -> list[Path]:
+    """Expand the command line paths into a sorted list of IDS files."""
+    files = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(p for p in path.rglob("*") if p.suffix.lower() in IDS_SUFFIXES and p.is_file())
+        elif path.is_file():
+            files.append(path)
+        else:
+            print(f"Warning: {raw} does not exist, skipping", file=sys.stderr)
+    return sorted(set(files))
+
+
+def _warm_indexes(schema_dir: str):
+    """Process-pool initializer: build every version's index once per worker."""
+    for version in IFC_VERSIONS:
+        get_schema_index(version, schema_dir)
+
+
+def print_report(results: list[dict]):
+    for result in results:
+        if not result["issues"]:
+            continue
+        print(f"{result['path']}:")
+        for issue in result["issues"]:
+            where = issue.get("specification", "")
+            if issue.get("section"):
+                where += f" / {issue['section']}"
+            if issue.get("facet"):
+                where += f" / {issue['facet']}"
+            prefix = f"  {issue['severity'].upper():7} [{issue['category']}]"
+            print(f"{prefix} {where + ': ' if where else ''}{issue['message']}")
+
+
+def summarize(results: list[dict]) -> dict:
+    errors = sum(1 for r in results for i in r["issues"] if i["severity"] == "error")
+    warnings = sum(1 for r in results for i in r["issues"] if i["severity"] == "warning")
+    return {
+        "files": len(results),
+        "specifications": sum(r["specifications"] for r in results),
+        "filesWithErrors": sum(1 for r in results if any(i["severity"] == "error" for i in r["issues"])),
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit IDS files against the generated IFC schema.")
+    parser.add_argument("paths", nargs="+", help="IDS files or directories to audit")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--schema-dir", default=str(GENERATED_DIR),
+                        help="directory with the generated schema JSON")
+    parser.add_argument("--json", action="store_true", help="print a JSON report instead of text")
+    parser.add_argument("--fail-on", choices=["error", "warning"], default="error",
+                        help="lowest severity that makes the run fail (default: error)")
+    parser.add_argument("--strict", action="store_true",
+                        help="also warn about unknown entities, non-standard predefined types "
+                             "and unknown Pset_/Qto_ property sets")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths)
+    if not files:
+        print("No IDS files found.", file=sys.stderr)
+        return 1
+
+    audit = partial(audit_file, schema_dir=Path(args.schema_dir), strict=args.strict)
+    jobs = max(1, min(args.jobs, len(files)))
+    if jobs == 1:
+        _warm_indexes(args.schema_dir)
+        results = [audit(f) for f in files]
+    else:
+        chunksize = max(1, len(files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_indexes,
+                                 initargs=(args.schema_dir,)) as executor:
+            results = list(executor.map(audit, files, chunksize=chunksize))
+
+    summary = summarize(results)
+    if args.json:
+        json.dump({"summary": summary, "files": results}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_report(results)
+        print(f"\nAudited {summary['files']} files ({summary['specifications']} specifications): "
+              f"{summary['errors']} errors, {summary['warnings']} warnings")
+
+    failing = summary["errors"] + (summary["warnings"] if args.fail_on == "warning" else 0)
+    return 1 if failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Shared Python helpers for the IFC schema generator scripts and the headless
+IDS tooling built on top of the generated schema data.
+
+The generator entry points stay as standalone scripts (``scripts/*.py``,
+``scripts/psd/*.py``); anything they or the IDS audit CLI need to share lives
+in this package.
+"""
+
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GENERATED_DIR = REPO_ROOT / "lib" / "generated" / "ifc-schema"
+PUBLIC_GENERATED_DIR = REPO_ROOT / "public" / "generated"
+
+IFC_VERSIONS = ["IFC2X3", "IFC4", "IFC4X3_ADD2"]
+
+# Pipeline stages call load_script() from worker threads; re-entrant because a
+# script may load another while it's being executed.
+_load_lock = threading.RLock()
+
+
+def load_script(path: Path, name: str | None = None):
+    """Import one of the hyphenated generator scripts as a module.
+
+    The scripts are meant to be run directly (``python3 scripts/psd/...``), so
+    their file names aren't importable; tooling that wants to call their
+    functions in-process (benchmarks, the orchestrator) loads them with this.
+    """
+    path = Path(path)
+    name = name or path.stem.replace("-", "_")
+    # Held across exec_module(), so no other thread sees the module half run.
+    with _load_lock:
+        if name in sys.modules:
+            return sys.modules[name]
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        return module
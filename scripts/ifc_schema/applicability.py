@@ -0,0 +1,94 @@
+"""
+Property set applicability index keyed by (entity, predefined type).
+
+PSD templates can scope a property set to predefined types of an entity
+(``IfcWall/STANDARD``); the parsers (the PSD one and ifc_schema/bsdd.py)
+split such class names with ``parse_applicability()`` and keep the scoping as
+``"applicablePredefinedTypes"`` next to ``applicableEntities``. This module
+inverts it into ``applicability-{version}.json``:
+
+    {
+      "version": "IFC4X3_ADD2",
+      "entities": {
+        "IFCWALL": {"*": ["Pset_WallCommon", ...], "STANDARD": ["Pset_WallTypeStandard"]}
+      }
+    }
+
+``"*"`` lists the psets that apply to every occurrence of the entity. The
+psets for ``(entity, type)`` are ``"*"`` plus the ``type`` list; without a
+predefined type, all lists of the entity apply. Entity keys are upper-cased,
+pset lists are sorted.
+
+Without any scoped entry the index says no more than ``applicableEntities``
+itself, so such a version gets no file (and a previous one is removed);
+lib/ifc-schema.ts falls back to ``applicableEntities`` then.
+"""
+
+from pathlib import Path
+
+from . import GENERATED_DIR
+from .output import remove_output, write_json
+
+ANY_TYPE = "*"
+
+
+def parse_applicability(class_names: list[str]) -> tuple[list[str], dict[str, list[str]]]:
+    """Split ``IfcWall/STANDARD`` style class names.
+
+    Returns the applicable entities (as before: the part before the slash,
+    upper-cased for Ifc names) and, for entities the template only scopes to
+    some predefined types, ``{entity: [predefined types]}``. An entity that is
+    also listed without a type (or as ``IfcWall/*``) applies to all of them
+    and gets no entry.
+    """
+    entities = []
+    scoped: dict[str, set[str]] = {}
+    unscoped = set()
+    for raw in class_names:
+        # Normalize: "IfcWall" -> "IFCWALL"
+        name = raw.upper() if raw.startswith("Ifc") else raw
+        entity, _, predefined = name.partition("/")
+        predefined = predefined.strip().upper()
+        entities.append(entity)
+        if predefined and predefined != "*":
+            scoped.setdefault(entity, set()).add(predefined)
+        else:
+            unscoped.add(entity)
+    return entities, {e: sorted(types) for e, types in sorted(scoped.items()) if e not in unscoped}
+
+
+def build_applicability_index(version: str, property_sets: list[dict]) -> dict:
+    entities: dict[str, dict[str, set[str]]] = {}
+    for pset in property_sets:
+        scoped = pset.get("applicablePredefinedTypes") or {}
+        for entity in pset.get("applicableEntities", []):
+            key = entity.upper()
+            for predefined in scoped.get(entity) or [ANY_TYPE]:
+                entities.setdefault(key, {}).setdefault(predefined, set()).add(pset["name"])
+    return {
+        "version": version,
+        "entities": {
+            entity: {t: sorted(names) for t, names in sorted(types.items())}
+            for entity, types in sorted(entities.items())
+        },
+    }
+
+
+def count_scoped(index: dict) -> int:
+    """Entities of ``index`` with property sets scoped to some predefined types."""
+    return sum(1 for types in index["entities"].values() if set(types) - {ANY_TYPE})
+
+
+def write_applicability_indexes(by_version: dict[str, list[dict]],
+                                output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Write ``applicability-{version}.json`` for every version with scoped psets."""
+    written = {}
+    for version, psets in by_version.items():
+        path = output_dir / f"applicability-{version.lower()}.json"
+        index = build_applicability_index(version, psets)
+        if not count_scoped(index):
+            remove_output(path)
+            continue
+        write_json(path, index)
+        written[version] = path
+    return written
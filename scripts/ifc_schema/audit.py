@@ -0,0 +1,337 @@
+"""
+IFC schema audit of IDS specifications against the generated schema data.
+
+Mirrors the checks ``lib/ids-client-validation.ts`` runs in the browser, so a
+file audited here reports the same issues as the editor:
+
+- ``ids-schema``:     structural problems (no specifications, missing
+                      propertySet/baseName, entity facet without a name).
+- ``ifc-audit``:      datatypes that are not valid for the IFC version.
+- ``recommendation``: non-binding hints (a datatype that is a different kind of
+                      value than the standard pset template uses, an
+                      applicability without an entity facet).
+
+With ``strict=True`` (``ids-audit.py --strict``) the audit also warns about
+references the editor accepts: unknown entities, non-standard predefined
+types and unknown property sets with a reserved ``Pset_``/``Qto_`` prefix.
+Unknown entity and property set names get "did you mean" ``suggestions``
+from the fuzzy index (fuzzy.py). These checks are off by default so that
+the CLI doesn't fail a file the editor accepts.
+
+All lookups go through an index that is built (or mapped) once per IFC
+version and then reused for every specification and file in the process.
+"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from . import GENERATED_DIR, IFC_VERSIONS
+from .datatypes import DatatypeMatrix, build_datatype_matrix
+from .fuzzy import get_fuzzy_index
+from .ids_reader import IdsParseError, iter_specifications
+
+# Standard property/quantity sets use these reserved prefixes; a name with one
+# of them that isn't in the generated schema is not a valid standard set.
+RESERVED_PSET_PREFIXES = ("PSET_", "QTO_")
+
+_BRACKET_NAME = re.compile(r"\[(\w+)\]")
+_PAREN_NAME = re.compile(r"\((\w+)\)")
+
+
+def normalize_property_name(base_name: str) -> str:
+    """Extract the technical name from "Load Bearing [LoadBearing]" style names.
+
+    Same rules as normalizePropertyName() in lib/ifc-schema.ts.
+    """
+    trimmed = base_name.strip()
+    match = _BRACKET_NAME.search(trimmed) or _PAREN_NAME.search(trimmed)
+    return match.group(1) if match else trimmed
+
+
+def _load_json(path: Path) -> list | dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+class SchemaIndex:
+    """Prebuilt lookup tables for one IFC version of the generated schema."""
+
+    def __init__(self, version: str, schema_dir: Path = GENERATED_DIR):
+        self.version = version
+        suffix = version.lower()
+
+        self.entities: set[str] = set()
+        self.predefined_types: dict[str, set[str]] = {}
+        for entity in _load_json(schema_dir / f"entities-{suffix}.json"):
+            name = entity["name"].upper()
+            self.entities.add(name)
+            if entity.get("predefinedTypes"):
+                self.predefined_types[name] = set(entity["predefinedTypes"])
+
+        # Datatype validity/compatibility come from the precomputed matrix
+        # (see datatypes.py); build it in memory if it hasn't been generated.
+        matrix = _load_json(schema_dir / f"datatype-matrix-{suffix}.json")
+        if not matrix:
+            simple_types = _load_json(schema_dir / f"simple-types-{suffix}.json")
+            matrix = build_datatype_matrix(version, simple_types)
+        self.datatypes = DatatypeMatrix(matrix)
+
+        self.property_sets: set[str] = set()
+        # (PSET, PROP) uppercase -> template datatypes.
+        self.scoped_data_types: dict[tuple[str, str], set[str]] = {}
+        for pset in _load_json(schema_dir / f"property-sets-{suffix}.json"):
+            pset_name = pset["name"].upper()
+            self.property_sets.add(pset_name)
+            for prop in pset.get("properties", []):
+                key = (pset_name, prop["name"].upper())
+                self.scoped_data_types.setdefault(key, set()).add(prop["dataType"])
+
+    def is_valid_data_type(self, data_type: str) -> bool:
+        return data_type in self.datatypes
+
+    def are_data_types_compatible(self, a: str, b: str) -> bool:
+        """Same rules as areDataTypesCompatible() in lib/ifc-schema.ts."""
+        return self.datatypes.compatible(a, b)
+
+    def predefined_types_for(self, entity: str) -> set[str]:
+        """Predefined types of ``entity``, falling back to its ``...TYPE`` entity."""
+        name = entity.upper()
+        if name in self.predefined_types:
+            return self.predefined_types[name]
+        if not name.endswith("TYPE"):
+            return self.predefined_types.get(name + "TYPE", set())
+        return set()
+
+    def expected_data_types(self, pset: str, prop: str) -> set[str] | None:
+        """Template datatypes of ``pset.prop``, or None when there is no opinion."""
+        pset_name = pset.upper()
+        if pset_name not in self.property_sets:
+            return None
+        direct = self.scoped_data_types.get((pset_name, prop.upper()))
+        if direct:
+            return direct
+        normalized = normalize_property_name(prop)
+        if normalized != prop:
+            return self.scoped_data_types.get((pset_name, normalized.upper()))
+        return None
+
+
+def _snapshot_sources(version: str, schema_dir: Path) -> dict[str, str]:
+    """Digests the schema index recorded for the files a snapshot is built from."""
+    try:
+        with open(schema_dir / "schema-index.json") as f:
+            files = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+    names = {f"{kind}-{version.lower()}.json"
+             for kind in ("entities", "property-sets", "datatype-matrix")}
+    return {name: entry["sha256"] for name, entry in files.items() if name in names}
+
+
+@lru_cache(maxsize=None)
+def get_schema_index(version: str, schema_dir: str = str(GENERATED_DIR),
+                     use_snapshot: bool = True):
+    """Return the (process-wide cached) index for ``version``.
+
+    This is the memory-mapped binary snapshot (snapshot.py) when one built
+    from the current JSON files exists, and a ``SchemaIndex`` parsed from the
+    JSON otherwise. Both answer the same lookups.
+    """
+    path = Path(schema_dir)
+    if use_snapshot:
+        from .snapshot import open_snapshot  # snapshot.py imports this module
+
+        snapshot = open_snapshot(version, path, _snapshot_sources(version, path))
+        if snapshot is not None:
+            return snapshot
+    return SchemaIndex(version, path)
+
+
+def _simple_values(value) -> list[str]:
+    """Concrete values an IDS value can take, for checks that need names."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, dict):
+        return list(value.get("enumeration", []))
+    return []
+
+
+@lru_cache(maxsize=4096)
+def _suggestions(version: str, schema_dir: str, name: str, kind: str) -> tuple[str, ...]:
+    # Batches repeat the same typos; look each one up once.
+    return tuple(n for n, _ in get_fuzzy_index(version, schema_dir).suggest(name, [kind], limit=3))
+
+
+def _with_suggestions(issue: dict, version: str, schema_dir: Path, name: str, kind: str) -> dict:
+    """Add the closest known names of ``kind`` to an unknown-name issue."""
+    suggestions = list(_suggestions(version, str(schema_dir), name, kind))
+    if suggestions:
+        issue["message"] += f'. Did you mean "{suggestions[0]}"?'
+        issue["suggestions"] = suggestions
+    return issue
+
+
+def _issue(severity: str, category: str, message: str, spec: dict, spec_index: int,
+           section: str | None = None, facet: dict | None = None,
+           field: str | None = None, version: str | None = None) -> dict:
+    issue = {
+        "severity": severity,
+        "category": category,
+        "message": message,
+        "specification": spec.get("name") or f"Specification {spec_index + 1}",
+        "specIndex": spec_index,
+    }
+    if section:
+        issue["section"] = section
+    if facet:
+        issue["facet"] = facet["facet"]
+    if field:
+        issue["field"] = field
+    if version:
+        issue["ifcVersion"] = version
+    return issue
+
+
+def _audit_entity(facet, section, spec, spec_index, index, issues, schema_dir, strict):
+    names = _simple_values(facet.get("name"))
+    if "name" not in facet:
+        issues.append(_issue("error", "ids-schema", "Entity facet is missing name",
+                             spec, spec_index, section, facet, "name"))
+        return
+    if not strict:
+        return
+
+    for name in names:
+        if name.upper() not in index.entities:
+            issues.append(_with_suggestions(_issue(
+                "warning", "ifc-audit",
+                f'Unknown IFC entity "{name}" for {index.version}',
+                spec, spec_index, section, facet, "name", index.version),
+                index.version, schema_dir, name, "entity"))
+            continue
+        allowed = index.predefined_types_for(name)
+        for predefined in _simple_values(facet.get("predefinedType")):
+            # Non-standard values are legal (they match a USERDEFINED
+            # ObjectType), hence only a warning.
+            if allowed and predefined.upper() not in allowed:
+                issues.append(_issue(
+                    "warning", "ifc-audit",
+                    f'"{predefined}" is not a standard predefined type of "{name}" in '
+                    f'{index.version} (it only matches USERDEFINED object types)',
+                    spec, spec_index, section, facet, "predefinedType", index.version))
+
+
+def _audit_property(facet, section, spec, spec_index, index, issues, schema_dir, strict):
+    data_type = facet.get("dataType")
+    pset_values = _simple_values(facet.get("propertySet"))
+    base_names = _simple_values(facet.get("baseName"))
+
+    if data_type and not index.is_valid_data_type(data_type):
+        issues.append(_issue(
+            "error", "ifc-audit",
+            f'Invalid IFC data type "{data_type}" in property '
+            f'"{base_names[0] if base_names else "unnamed"}" for {index.version}',
+            spec, spec_index, section, facet, "dataType", index.version))
+
+    for pset in pset_values if strict else ():
+        if pset.upper().startswith(RESERVED_PSET_PREFIXES) and pset.upper() not in index.property_sets:
+            issues.append(_with_suggestions(_issue(
+                "warning", "ifc-audit",
+                f'"{pset}" uses a reserved prefix but is not a standard property set in {index.version}',
+                spec, spec_index, section, facet, "propertySet", index.version),
+                index.version, schema_dir, pset, "pset"))
+
+    if data_type and index.is_valid_data_type(data_type):
+        for pset in pset_values:
+            for base_name in base_names:
+                expected = index.expected_data_types(pset, base_name)
+                if not expected:
+                    continue
+                if any(index.are_data_types_compatible(data_type, t) for t in expected):
+                    continue
+                issues.append(_issue(
+                    "warning", "recommendation",
+                    f'Property "{base_name}" is usually defined as {" or ".join(sorted(expected))} '
+                    f'in standard IFC property sets. You used "{data_type}", which is a valid IDS '
+                    f'datatype but a different kind of value, so double check that is what you want.',
+                    spec, spec_index, section, facet, "dataType", index.version))
+
+    if "propertySet" not in facet:
+        issues.append(_issue("warning", "ids-schema", "Property facet is missing propertySet",
+                             spec, spec_index, section, facet, "propertySet"))
+    if "baseName" not in facet:
+        issues.append(_issue("warning", "ids-schema", "Property facet is missing baseName",
+                             spec, spec_index, section, facet, "baseName"))
+
+
+def audit_specification(spec: dict, spec_index: int, schema_dir: Path = GENERATED_DIR,
+                        strict: bool = False) -> list[dict]:
+    """Run the checks against one specification dict (see ids_reader)."""
+    issues: list[dict] = []
+
+    versions = [v for v in spec.get("ifcVersion", []) if v in IFC_VERSIONS]
+    if not versions:
+        issues.append(_issue(
+            "error", "ids-schema",
+            f'Unsupported or missing ifcVersion "{" ".join(spec.get("ifcVersion", []))}"',
+            spec, spec_index))
+
+    for version in versions:
+        index = get_schema_index(version, str(schema_dir))
+        for section in ("applicability", "requirements"):
+            for facet in spec.get(section, []):
+                if facet["facet"] == "entity":
+                    _audit_entity(facet, section, spec, spec_index, index, issues, schema_dir, strict)
+                elif facet["facet"] == "property":
+                    _audit_property(facet, section, spec, spec_index, index, issues, schema_dir, strict)
+
+    # Structural issues are version independent: report them once.
+    seen = set()
+    unique = []
+    for issue in issues:
+        key = (issue["severity"], issue["category"], issue["message"], issue.get("section"))
+        if issue["category"] != "ifc-audit" and key in seen:
+            continue
+        seen.add(key)
+        unique.append(issue)
+
+    applicability = spec.get("applicability", [])
+    if applicability and not any(f["facet"] == "entity" for f in applicability):
+        unique.append(_issue(
+            "warning", "recommendation",
+            f'Specification "{spec.get("name") or "unnamed"}" applicability should include at least one entity',
+            spec, spec_index, "applicability"))
+    return unique
+
+
+def audit_file(path, schema_dir: Path = GENERATED_DIR, strict: bool = False) -> dict:
+    """Audit every specification in an IDS file.
+
+    Returns ``{"path", "specifications", "issues"}``; a file that cannot be
+    parsed is reported as a single ``ids-schema`` error.
+    """
+    result = {"path": str(path), "specifications": 0, "issues": []}
+    try:
+        for spec_index, spec in enumerate(iter_specifications(path)):
+            result["specifications"] += 1
+            result["issues"].extend(audit_specification(spec, spec_index, schema_dir, strict))
+    except (IdsParseError, OSError) as e:
+        result["issues"].append({
+            "severity": "error",
+            "category": "ids-schema",
+            "message": f"Could not parse IDS file: {e}",
+        })
+        return result
+
+    if result["specifications"] == 0:
+        result["issues"].append({
+            "severity": "error",
+            "category": "ids-schema",
+            "message": "At least one specification is required",
+        })
+    return result
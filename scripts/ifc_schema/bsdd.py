@@ -0,0 +1,259 @@
+"""
+Client for the buildingSMART Data Dictionary (bSDD) API.
+
+``BsddClient.crawl_dictionary()`` fetches every class of a dictionary with
+its class properties:
+
+- the class list (``/api/Dictionary/v1/Classes``) is paged with
+  ``Offset`` / ``Limit``; the first page gives the total count and the
+  remaining pages are fetched concurrently
+- the details of every class (``/api/Class/v1`` with
+  ``IncludeClassProperties``) are then fetched concurrently too
+
+One client keeps at most ``max_concurrency`` requests in flight, however
+many crawls share it. Responses are cached on disk (``scripts/.cache/bsdd``,
+not committed) together with their ``ETag`` / ``Last-Modified``, and a cached
+response is revalidated with ``If-None-Match`` / ``If-Modified-Since``, so
+crawling an unchanged dictionary again only transfers 304s.
+
+``normalize_property_sets()`` turns the crawled classes into the property
+set records of the PSD parser (scripts/psd/fetch-and-parse-psd.py), with the
+definitions as ``"localizations"`` for the locale packs.
+
+scripts/bench/local_bsdd.py serves a fixture dictionary on the same
+endpoints, for offline runs and benchmarks.
+"""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+from . import REPO_ROOT, metrics
+from .applicability import parse_applicability
+from .locales import DEFAULT_LOCALE
+from .output import write_json
+
+BSDD_API = "https://api.bsdd.buildingsmart.org"
+CLASSES_PATH = "/api/Dictionary/v1/Classes"
+CLASS_PATH = "/api/Class/v1"
+
+CACHE_DIR = REPO_ROOT / "scripts" / ".cache" / "bsdd"
+
+# Largest Limit the API accepts for the class list.
+PAGE_SIZE = 1000
+
+# bSDD property data types -> the IFC value types used in the pset files.
+DATA_TYPES = {
+    "Boolean": "IFCBOOLEAN",
+    "Character": "IFCLABEL",
+    "Integer": "IFCINTEGER",
+    "Real": "IFCREAL",
+    "String": "IFCLABEL",
+    "Time": "IFCDATETIME",
+}
+
+# bSDD propertyValueKind -> the PSD parser's valueKind (Single has none).
+VALUE_KINDS = {"Range": "bounded", "List": "list"}
+
+
+class BsddError(Exception):
+    """A bSDD request failed or returned something unusable."""
+
+
+class BsddClient:
+    """Cached, concurrent access to one bSDD API; thread-safe.
+
+    ``session`` is a ``requests.Session`` (or anything with the same
+    ``get()``). Pass ``cache_dir=None`` to skip the on-disk cache.
+    """
+
+    def __init__(self, session, base_url: str = BSDD_API, cache_dir: Path | None = CACHE_DIR,
+                 max_concurrency: int = 4, page_size: int = PAGE_SIZE, timeout: float = 30):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.max_concurrency = max_concurrency
+        self.page_size = page_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    # -- requests -----------------------------------------------------------
+
+    def _cache_path(self, url: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+    def _cached(self, url: str) -> dict | None:
+        path = self._cache_path(url)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (TypeError, OSError, ValueError):
+            return None
+        return entry if entry.get("url") == url else None
+
+    def _store(self, url: str, headers, body):
+        path = self._cache_path(url)
+        validators = {"etag": headers.get("ETag"), "lastModified": headers.get("Last-Modified")}
+        if path is not None and any(validators.values()):
+            write_json(path, {"url": url, **validators, "body": body}, compact=True, publish=False)
+
+    def get_json(self, path: str, params: dict):
+        """GET ``path`` with ``params``, revalidating a cached response."""
+        url = f"{self.base_url}{path}?{urlencode(params)}"
+        cached = self._cached(url)
+        headers = {"Accept": "application/json"}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("lastModified"):
+            headers["If-Modified-Since"] = cached["lastModified"]
+
+        with self._slots, metrics.stage("bsdd.request"):
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except Exception as e:
+                metrics.incr("http.failures")
+                raise BsddError(f"GET {url}: {e}") from e
+        metrics.incr("http.requests")
+        if cached and response.status_code == 304:
+            metrics.cache("bsdd", hit=True)
+            return cached["body"]
+        if response.status_code != 200:
+            metrics.incr("http.failures")
+            raise BsddError(f"GET {url}: HTTP {response.status_code}")
+        metrics.cache("bsdd", hit=False)
+        metrics.incr("http.bytes", len(response.content))
+        try:
+            body = response.json()
+        except ValueError as e:
+            raise BsddError(f"GET {url}: invalid JSON") from e
+        self._store(url, response.headers, body)
+        return body
+
+    # -- crawling -----------------------------------------------------------
+
+    def _class_page(self, dictionary_uri: str, offset: int) -> dict:
+        return self.get_json(CLASSES_PATH, {"Uri": dictionary_uri, "Offset": offset,
+                                            "Limit": self.page_size})
+
+    def list_classes(self, dictionary_uri: str) -> list[dict]:
+        """The class summaries (uri, code, name, ...) of a dictionary."""
+        first = self._class_page(dictionary_uri, 0)
+        classes = list(first.get("classes") or [])
+        total = first.get("classesTotalCount") or len(classes)
+        # The server may cap Limit below what we asked for.
+        step = len(classes)
+        if step and total > step:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                pages = executor.map(lambda o: self._class_page(dictionary_uri, o),
+                                     range(step, total, step))
+                for page in pages:
+                    classes.extend(page.get("classes") or [])
+        metrics.incr("bsdd.classes", len(classes))
+        return classes
+
+    def class_details(self, class_uri: str) -> dict:
+        return self.get_json(CLASS_PATH, {"Uri": class_uri, "IncludeClassProperties": "true"})
+
+    def crawl_dictionary(self, dictionary_uri: str) -> list[dict]:
+        """Every class of a dictionary with its ``classProperties``, by code."""
+        with metrics.stage("bsdd.crawl"):
+            uris = sorted({c["uri"] for c in self.list_classes(dictionary_uri) if c.get("uri")})
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                details = list(executor.map(self.class_details, uris))
+        return sorted(details, key=lambda c: (c.get("code") or "", c.get("uri") or ""))
+
+
+# -- normalization ------------------------------------------------------------
+
+def class_names(cls: dict) -> list[str]:
+    """``IfcWall`` / ``IfcWall/STANDARD`` style names a bSDD class stands for.
+
+    Classes of the IFC dictionary for a predefined type have the entity as
+    their related IFC entity and the type appended to its name as their code
+    (``IfcWallSTANDARD``); other dictionaries just name related entities.
+    """
+    code = cls.get("code") or ""
+    entities = cls.get("relatedIfcEntityNames") or ([code] if code.startswith("Ifc") else [])
+    names = []
+    for entity in entities:
+        predefined = code[len(entity):] if code.startswith(entity) else ""
+        names.append(f"{entity}/{predefined}" if predefined.isupper() else entity)
+    return names
+
+
+def _bounds(prop: dict) -> dict:
+    bounds = {}
+    for key, fields in (("lower", ("minInclusive", "minExclusive")),
+                        ("upper", ("maxInclusive", "maxExclusive"))):
+        value = next((prop[f] for f in fields if prop.get(f) is not None), None)
+        if value is not None:
+            bounds[key] = value
+    return bounds
+
+
+def normalize_property(prop: dict) -> dict:
+    """A bSDD class property as a pset file property."""
+    record = {"name": prop.get("name") or prop["propertyCode"],
+              "dataType": DATA_TYPES.get(prop.get("dataType"), "IFCLABEL")}
+    allowed = [v.get("code") or v.get("value") for v in prop.get("allowedValues") or []]
+    allowed = [v for v in allowed if v]
+    if allowed:
+        # Enumerated values are labels, as in the PSD parser.
+        record.update(dataType="IFCLABEL", valueKind="enumerated",
+                      enumeration=list(dict.fromkeys(allowed)))
+        return record
+    kind = VALUE_KINDS.get(prop.get("propertyValueKind"))
+    if kind:
+        record["valueKind"] = kind
+    bounds = _bounds(prop)
+    if bounds:
+        record.update(valueKind="bounded", bounds=bounds)
+    return record
+
+
+def normalize_property_sets(classes: list[dict], version: str) -> list[dict]:
+    """Property set records (PSD parser format) from crawled classes.
+
+    Class properties are grouped by their ``propertySet``; a set applies to
+    the classes that use it. The first definition of a property wins.
+    """
+    names: dict[str, list[str]] = {}
+    properties: dict[str, dict[str, dict]] = {}
+    definitions: dict[str, dict[str, str]] = {}
+    for cls in classes:
+        cls_names = class_names(cls)
+        for prop in cls.get("classProperties") or []:
+            pset = prop.get("propertySet")
+            name = prop.get("name") or prop.get("propertyCode")
+            if not pset or not name:
+                continue
+            for cls_name in cls_names:
+                if cls_name not in names.setdefault(pset, []):
+                    names[pset].append(cls_name)
+            if name not in properties.setdefault(pset, {}):
+                properties[pset][name] = normalize_property(prop)
+            text = (prop.get("definition") or prop.get("description") or "").strip()
+            if text:
+                definitions.setdefault(pset, {}).setdefault(name, text)
+
+    psets = []
+    for pset in sorted(properties):
+        entities, predefined_types = parse_applicability(names[pset])
+        texts = definitions.get(pset)
+        psets.append({
+            "name": pset,
+            "applicableEntities": list(dict.fromkeys(entities)),
+            **({"applicablePredefinedTypes": predefined_types} if predefined_types else {}),
+            "properties": list(properties[pset].values()),
+            "ifcVersion": [version],
+            "templateType": "QTO_TYPEDRIVENOVERRIDE" if pset.startswith("Qto_")
+            else "PSET_TYPEDRIVENOVERRIDE",
+            "localizations": {DEFAULT_LOCALE: {"properties": {
+                p: {"definition": t} for p, t in texts.items()}}} if texts else {},
+        })
+    return psets
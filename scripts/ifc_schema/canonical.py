@@ -0,0 +1,46 @@
+"""
+Canonical ordering for generated records.
+
+Generated files must be byte-for-byte reproducible: the same inputs give the
+same bytes no matter in which order downloads finished or dicts were built.
+Writers pass their records through these helpers right before serialising.
+"""
+
+from . import IFC_VERSIONS
+
+PSET_KEY_ORDER = ("name", "applicableEntities", "applicablePredefinedTypes", "properties",
+                  "ifcVersion", "templateType")
+PROPERTY_KEY_ORDER = ("name", "dataType")
+
+
+def order_keys(record: dict, leading: tuple[str, ...]) -> dict:
+    """``record`` with the ``leading`` keys first and the rest sorted."""
+    ordered = {k: record[k] for k in leading if k in record}
+    ordered.update((k, record[k]) for k in sorted(record) if k not in ordered)
+    return ordered
+
+
+def version_order(versions: list[str]) -> list[str]:
+    known = [v for v in IFC_VERSIONS if v in versions]
+    return known + sorted(set(versions) - set(known))
+
+
+def canonical_property(prop: dict) -> dict:
+    return order_keys(prop, PROPERTY_KEY_ORDER)
+
+
+def canonical_property_set(pset: dict) -> dict:
+    pset = dict(pset)
+    if "applicableEntities" in pset:
+        pset["applicableEntities"] = sorted(set(pset["applicableEntities"]))
+    if "ifcVersion" in pset:
+        pset["ifcVersion"] = version_order(pset["ifcVersion"])
+    if "properties" in pset:
+        pset["properties"] = sorted((canonical_property(p) for p in pset["properties"]),
+                                    key=lambda p: p["name"])
+    return order_keys(pset, PSET_KEY_ORDER)
+
+
+def canonical_property_sets(psets: list[dict]) -> list[dict]:
+    """Property sets sorted by name, each in canonical form."""
+    return sorted((canonical_property_set(p) for p in psets), key=lambda p: p["name"])
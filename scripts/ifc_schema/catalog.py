@@ -0,0 +1,81 @@
+"""
+The curated property set catalog (``scripts/psd/curated-property-sets.json``).
+
+Hand-maintained pset records in the PSD parser's format, each listing the
+IFC versions it belongs to in ``ifcVersion``. ``load_catalog()`` buckets them
+by version in one pass and keeps that compiled form as a pickle in
+``scripts/.cache`` (not committed), keyed on the data file's size and mtime,
+so later loads skip the JSON entirely.
+
+``overlay_catalog()`` merges the catalog with PSD-derived sets instead of
+replacing them: sets the PSD doesn't have are added, existing sets gain the
+properties they lack, and nothing the PSD defines is changed (see
+ifc_schema/layers.py).
+"""
+
+import json
+import pickle
+from pathlib import Path
+
+from . import IFC_VERSIONS, REPO_ROOT, metrics
+from .layers import merge_layers
+from .output import write_bytes
+
+CATALOG_FILE = REPO_ROOT / "scripts" / "psd" / "curated-property-sets.json"
+CACHE_FILE = REPO_ROOT / "scripts" / ".cache" / "curated-property-sets.pickle"
+
+# Bump when the compiled form changes shape.
+_CACHE_FORMAT = 1
+
+
+def bucket_by_version(property_sets: list[dict]) -> dict[str, list[dict]]:
+    """``{version: [psets]}`` from the ``ifcVersion`` lists, in one pass."""
+    buckets: dict[str, list[dict]] = {v: [] for v in IFC_VERSIONS}
+    for pset in property_sets:
+        for version in pset.get("ifcVersion", []):
+            buckets.setdefault(version, []).append(pset)
+    return buckets
+
+
+def _cache_key(path: Path) -> list:
+    st = path.stat()
+    return [_CACHE_FORMAT, str(path.resolve()), st.st_size, st.st_mtime_ns]
+
+
+def load_catalog(path: Path = CATALOG_FILE,
+                 cache_file: Path | None = CACHE_FILE) -> dict[str, list[dict]]:
+    """The catalog bucketed by version, from the compiled cache when current.
+
+    Records are shared between the version lists; copy before changing them.
+    Pass ``cache_file=None`` to always read the JSON.
+    """
+    key = _cache_key(path)
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached["key"] == key:
+                metrics.cache("catalog", hit=True)
+                return cached["byVersion"]
+        except Exception:
+            # Missing, stale format or corrupt: rebuild it below.
+            pass
+    metrics.cache("catalog", hit=False)
+
+    with open(path) as f:
+        by_version = bucket_by_version(json.load(f))
+    if cache_file is not None:
+        compiled = pickle.dumps({"key": key, "byVersion": by_version},
+                                protocol=pickle.HIGHEST_PROTOCOL)
+        write_bytes(cache_file, compiled, publish=False)
+    return by_version
+
+
+def overlay_catalog(base: dict[str, list[dict]],
+                    catalog: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """``base`` (e.g. PSD-derived sets by version) with ``catalog`` merged in.
+
+    The catalog is the layer below ``base`` in ``merge_layers()``, so it only
+    adds sets and properties. Neither input is modified.
+    """
+    return merge_layers([("curated", catalog), ("psd", base)])[0]
@@ -0,0 +1,121 @@
+"""
+Prefix completion index for the editor's name pickers.
+
+``completion-{version}.json`` holds, per kind of name, everything a client
+needs to complete a typed prefix with two binary searches instead of
+filtering every name on every keystroke:
+
+    {
+      "version": "IFC4",
+      "entity": {
+        "names": ["IfcSensor", "IfcProtectiveDevice", ...],   # by rank
+        "keys": ["actionrequest", ..., "ifcwall", ..., "wall", ...],
+        "ids": [412, ..., 9, ..., 9, ...]                     # name id per key
+      },
+      "pset": {...}, "property": {...}, "datatype": {...}
+    }
+
+Names are ordered by how much the schema data uses them, so a name's id is
+its rank and the best completions are the smallest ids:
+
+- entity:   the property sets that apply to it
+- pset:     the entities it applies to
+- property: the property sets that define it
+- datatype: the properties typed with it
+
+``keys`` are the case-folded names plus, for names with one of
+``STRIPPED_PREFIXES``, the name without it (``wall`` finds ``IfcWall``,
+``wallcommon`` finds ``Pset_WallCommon``), sorted; ``ids`` maps each key
+back to its name. The keys starting with a prefix are the range between
+``bisect_left(keys, prefix)`` and ``bisect_left(keys, prefix + "\\uffff")``.
+"""
+
+from bisect import bisect_left
+from pathlib import Path
+
+from . import GENERATED_DIR
+from .output import write_json
+
+# Order of the kinds in the file.
+KINDS = ("entity", "pset", "property", "datatype")
+
+# Lower-cased name prefixes that also get a key without them.
+STRIPPED_PREFIXES = ("ifc", "pset_", "qto_")
+
+
+def completion_keys(name: str) -> list[str]:
+    key = name.lower()
+    for prefix in STRIPPED_PREFIXES:
+        if key.startswith(prefix) and len(key) > len(prefix):
+            return [key, key[len(prefix):]]
+    return [key]
+
+
+def _table(usage: dict[str, int]) -> dict:
+    names = sorted(usage, key=lambda n: (-usage[n], n.lower(), n))
+    keyed = sorted((key, i) for i, name in enumerate(names) for key in completion_keys(name))
+    return {"names": names, "keys": [k for k, _ in keyed], "ids": [i for _, i in keyed]}
+
+
+def _entity_name(applicable: str) -> str:
+    # "IfcWall/STANDARD" scopes to a predefined type of IfcWall.
+    return applicable.split("/", 1)[0].upper()
+
+
+def build_completion_index(version: str, entities: list[dict], property_sets: list[dict],
+                           simple_types: list[dict]) -> dict:
+    entity_usage = {e["name"]: 0 for e in entities}
+    by_upper = {name.upper(): name for name in entity_usage}
+    pset_usage: dict[str, int] = {}
+    property_usage: dict[str, int] = {}
+    datatype_usage = {t["name"]: 0 for t in simple_types}
+    for pset in property_sets:
+        applies_to = {_entity_name(e) for e in pset.get("applicableEntities", [])}
+        pset_usage[pset["name"]] = pset_usage.get(pset["name"], 0) + len(applies_to)
+        for upper in applies_to:
+            if upper in by_upper:
+                entity_usage[by_upper[upper]] += 1
+        for prop in pset.get("properties", []):
+            property_usage[prop["name"]] = property_usage.get(prop["name"], 0) + 1
+            if prop.get("dataType") in datatype_usage:
+                datatype_usage[prop["dataType"]] += 1
+    return {
+        "version": version,
+        "entity": _table(entity_usage),
+        "pset": _table(pset_usage),
+        "property": _table(property_usage),
+        "datatype": _table(datatype_usage),
+    }
+
+
+def write_completion_indexes(entities: dict[str, list[dict]], property_sets: dict[str, list[dict]],
+                             simple_types: dict[str, list[dict]],
+                             output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Write ``completion-{version}.json`` for every version with property sets."""
+    written = {}
+    for version, psets in property_sets.items():
+        path = output_dir / f"completion-{version.lower()}.json"
+        index = build_completion_index(version, entities.get(version, []), psets,
+                                       simple_types.get(version, []))
+        write_json(path, index, compact=True)
+        written[version] = path
+    return written
+
+
+class CompletionIndex:
+    """Read side of a completion index."""
+
+    def __init__(self, table: dict):
+        self.version = table["version"]
+        self.tables = {kind: table[kind] for kind in KINDS}
+
+    def complete(self, prefix: str, kind: str, limit: int | None = 10) -> list[str]:
+        """Names of ``kind`` with a key starting with ``prefix``, best ranked first."""
+        table = self.tables[kind]
+        key = prefix.strip().lower()
+        keys = table["keys"]
+        lo = bisect_left(keys, key)
+        hi = bisect_left(keys, key + "\uffff", lo)
+        ids = sorted(set(table["ids"][lo:hi]))
+        return [table["names"][i] for i in ids[:limit]]
+
@@ -0,0 +1,139 @@
+"""
+Precomputed IDS datatype category / compatibility tables.
+
+``lib/ifc-schema.ts`` classifies datatypes into coarse value categories
+(``getDataTypeCategory``) and compares them (``areDataTypesCompatible``) on
+every property check. This module evaluates those rules once per IFC version
+over the generated simple-types list and emits the result as a compact table:
+
+    {
+      "version": "IFC4",
+      "types": ["IFCABSORBEDDOSEMEASURE", ...],     # sorted, index = row/column
+      "categories": ["numeric", "string", ...],
+      "typeCategories": [0, 1, ...],                # index into "categories"
+      "rowBytes": 42,
+      "compatible": "<base64>"                      # N x N bitset, row-major
+    }
+
+Bit ``j`` of row ``i`` (byte ``i * rowBytes + (j >> 3)``, mask
+``1 << (j & 7)``) is set when ``types[i]`` and ``types[j]`` are compatible.
+"""
+
+import base64
+import json
+from pathlib import Path
+
+from . import GENERATED_DIR, IFC_VERSIONS
+from .output import write_json
+
+# Order is part of the file format: typeCategories index into this list.
+CATEGORIES = ["numeric", "string", "boolean", "datetime", "binary", "reference", "unknown"]
+
+# xs: restriction base -> coarse value category. Keep in sync with
+# baseTypeToCategory() in lib/ifc-schema.ts.
+BASE_TYPE_CATEGORIES = {
+    "xs:double": "numeric",
+    "xs:integer": "numeric",
+    "xs:decimal": "numeric",
+    "xs:boolean": "boolean",
+    "xs:date": "datetime",
+    "xs:dateTime": "datetime",
+    "xs:time": "datetime",
+    "xs:duration": "datetime",
+    "xs:string": "string",
+    "xs:anyURI": "string",
+    "": "binary",
+}
+
+
+def category_of(simple_type: dict) -> str:
+    """Value category of one simple-types entry (getDataTypeCategory())."""
+    if simple_type.get("category") == "reference":
+        return "reference"
+    base = (simple_type.get("baseType") or "").strip()
+    return BASE_TYPE_CATEGORIES.get(base, "unknown")
+
+
+def categories_compatible(a: str, b: str) -> bool:
+    """areDataTypesCompatible() for two *different* types, by category."""
+    if "unknown" in (a, b) or "reference" in (a, b):
+        return True
+    return a == b
+
+
+def build_datatype_matrix(version: str, simple_types: list[dict]) -> dict:
+    """Evaluate the compatibility rules for every pair of ``simple_types``."""
+    by_name = {t["name"].upper(): t for t in simple_types}
+    names = sorted(by_name)
+    type_categories = [CATEGORIES.index(category_of(by_name[n])) for n in names]
+
+    n = len(names)
+    row_bytes = (n + 7) // 8
+    bits = bytearray(n * row_bytes)
+    # Compatibility only depends on the category pair, so decide it once per
+    # pair of categories and fill rows from that.
+    members: dict[int, list[int]] = {}
+    for i, c in enumerate(type_categories):
+        members.setdefault(c, []).append(i)
+    for ca, rows in members.items():
+        for cb, cols in members.items():
+            if not categories_compatible(CATEGORIES[ca], CATEGORIES[cb]):
+                continue
+            for i in rows:
+                base = i * row_bytes
+                for j in cols:
+                    bits[base + (j >> 3)] |= 1 << (j & 7)
+    # A type is always compatible with itself (covers unknown/reference too).
+    for i in range(n):
+        bits[i * row_bytes + (i >> 3)] |= 1 << (i & 7)
+
+    return {
+        "version": version,
+        "types": names,
+        "categories": CATEGORIES,
+        "typeCategories": type_categories,
+        "rowBytes": row_bytes,
+        "compatible": base64.b64encode(bytes(bits)).decode("ascii"),
+    }
+
+
+class DatatypeMatrix:
+    """Read side of a datatype matrix: category and compatibility lookups."""
+
+    def __init__(self, table: dict):
+        self.types = table["types"]
+        self.index = {name: i for i, name in enumerate(self.types)}
+        self.categories = table["categories"]
+        self.type_categories = table["typeCategories"]
+        self.row_bytes = table["rowBytes"]
+        self.bits = base64.b64decode(table["compatible"])
+
+    def __contains__(self, data_type: str) -> bool:
+        return data_type.upper() in self.index
+
+    def category(self, data_type: str) -> str:
+        i = self.index.get(data_type.upper())
+        return "unknown" if i is None else self.categories[self.type_categories[i]]
+
+    def compatible(self, a: str, b: str) -> bool:
+        """Table lookup equivalent of areDataTypesCompatible()."""
+        i = self.index.get(a.upper())
+        j = self.index.get(b.upper())
+        if i is None or j is None:
+            # Unknown to the schema: never flag (same as the TS rules).
+            return True
+        return bool(self.bits[i * self.row_bytes + (j >> 3)] & (1 << (j & 7)))
+
+
+def write_datatype_matrices(output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Build ``datatype-matrix-{version}.json`` from the simple-types files."""
+    written = {}
+    for version in IFC_VERSIONS:
+        suffix = version.lower()
+        with open(output_dir / f"simple-types-{suffix}.json") as f:
+            simple_types = json.load(f)
+        table = build_datatype_matrix(version, simple_types)
+        path = output_dir / f"datatype-matrix-{suffix}.json"
+        write_json(path, table, compact=True)
+        written[version] = path
+    return written
@@ -0,0 +1,149 @@
+"""
+Full-text search index for the documentation in ``ids-docs/``.
+
+Every markdown page is split into one chunk per heading, stripped to plain
+text and tokenized at generation time, so the docs search (lib/docs-search.ts,
+components/docs/docs-search-utils.ts) only looks terms up:
+
+    {
+      "files": ["README.md", "attribute-facet.md", ...],
+      "chunks": [{"file": 0, "heading": "", "slug": "", "content": "..."},
+                 {"file": 0, "heading": "Features", "slug": "features", ...}, ...],
+      "terms": ["2x3", "about", ...],     # sorted
+      "postings": [[4, 17], [0], ...]     # per term: ascending chunk ids
+    }
+
+Chunks keep the order of their page. The text before a page's first
+heading becomes a chunk with an empty heading and slug. Slugs follow
+``github-slugger``, which ``rehype-slug`` uses for the rendered headings,
+including the ``-1``, ``-2`` suffixes of repeated headings.
+
+A chunk's terms are its words (runs of letters and digits, lower-cased).
+Words written in camel case also index their parts, so ``IfcWallType``
+is found by ``wall`` as well as by ``ifcwalltype``. A query word matches
+every term it is a prefix of.
+"""
+
+import re
+import unicodedata
+from pathlib import Path
+
+from . import GENERATED_DIR, REPO_ROOT
+from .output import write_json
+
+DOCS_DIR = REPO_ROOT / "ids-docs"
+INDEX_FILE = "docs-search-index.json"
+
+_FENCE = "```"
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+
+# Inline markup -> text, in order. Underscore emphasis needs a non-word
+# character on both sides (as in CommonMark), so Pset_A and Qto_B survive.
+_INLINE = [
+    (re.compile(r"`([^`]*)`"), r"\1"),
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"\[([^\]]+)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"\*\*([^*]+)\*\*"), r"\1"),
+    (re.compile(r"\*([^*]+)\*"), r"\1"),
+    (re.compile(r"(?<!\w)__([^_]+)__(?!\w)"), r"\1"),
+    (re.compile(r"(?<!\w)_([^_]+)_(?!\w)"), r"\1"),
+    (re.compile(r"<[^>]+>"), " "),
+]
+_FENCED_CODE = re.compile(r"```\w*\n?(.*?)```", re.S)
+_HEADING_MARK = re.compile(r"^#{1,6}\s+", re.M)
+_SPACE = re.compile(r"\s+")
+
+_WORD = re.compile(r"[^\W_]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def strip_inline(text: str) -> str:
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def strip_markdown(md: str) -> str:
+    """Markdown -> plain text; code blocks and spans keep their content."""
+    text = _HEADING_MARK.sub("", _FENCED_CODE.sub(r"\1", md))
+    return _SPACE.sub(" ", strip_inline(text)).strip()
+
+
+def _slug_char(char: str) -> bool:
+    return char in " -_" or unicodedata.category(char)[0] in "LMN"
+
+
+class Slugger:
+    """Python port of ``github-slugger``: one instance per page."""
+
+    def __init__(self):
+        self.occurrences: dict[str, int] = {}
+
+    def slug(self, text: str) -> str:
+        original = result = "".join(c for c in text.lower() if _slug_char(c)).replace(" ", "-")
+        while result in self.occurrences:
+            self.occurrences[original] += 1
+            result = f"{original}-{self.occurrences[original]}"
+        self.occurrences[result] = 0
+        return result
+
+
+def split_chunks(md: str) -> list[dict]:
+    """``{"heading", "slug", "content"}`` per heading of ``md``.
+
+    Lines inside fenced code are never headings.
+    """
+    slugger = Slugger()
+    chunks = [{"heading": "", "slug": "", "body": []}]
+    in_fence = False
+    for line in md.splitlines():
+        if line.startswith(_FENCE):
+            in_fence = not in_fence
+        elif not in_fence and (match := _HEADING.match(line)):
+            heading = _SPACE.sub(" ", strip_inline(match.group(2))).strip()
+            chunks.append({"heading": heading, "slug": slugger.slug(heading), "body": []})
+            continue
+        chunks[-1]["body"].append(line)
+    chunks = [{"heading": c["heading"], "slug": c["slug"],
+               "content": strip_markdown("\n".join(c["body"]))} for c in chunks]
+    return [c for c in chunks if c["heading"] or c["content"]]
+
+
+def tokenize(text: str) -> set[str]:
+    """The terms of ``text``: its words plus the parts of camel-case words."""
+    terms = set()
+    for word in _WORD.findall(text):
+        terms.add(word.lower())
+        parts = _CAMEL_PART.findall(word)
+        if len(parts) > 1:
+            terms.update(part.lower() for part in parts)
+    return terms
+
+
+def docs_files(docs_dir: Path = DOCS_DIR) -> list[Path]:
+    return sorted(docs_dir.glob("*.md"))
+
+
+def build_docs_index(docs_dir: Path = DOCS_DIR) -> dict:
+    files = docs_files(docs_dir)
+    chunks = []
+    postings: dict[str, list[int]] = {}
+    for file_id, path in enumerate(files):
+        for chunk in split_chunks(path.read_text(encoding="utf-8")):
+            for term in tokenize(f"{chunk['heading']} {chunk['content']}"):
+                postings.setdefault(term, []).append(len(chunks))
+            chunks.append({"file": file_id, **chunk})
+    terms = sorted(postings)
+    return {
+        "files": [path.name for path in files],
+        "chunks": chunks,
+        "terms": terms,
+        "postings": [postings[term] for term in terms],
+    }
+
+
+def write_docs_index(docs_dir: Path = DOCS_DIR, output_dir: Path = GENERATED_DIR) -> Path:
+    """Write ``docs-search-index.json``."""
+    path = output_dir / INDEX_FILE
+    write_json(path, build_docs_index(docs_dir), compact=True)
+    return path
@@ -0,0 +1,64 @@
+"""
+Per-property enumeration index for the standard property sets.
+
+The PSD parser keeps the items of enumerated properties
+(``"enumeration"`` on a property in ``property-sets-{version}.json``). This
+module collects them into ``enumerations-{version}.json`` so the editor can
+check the values of an IDS ``enumeration`` restriction without loading every
+property set:
+
+    {
+      "version": "IFC4",
+      "lists": {"PEnum_ElementStatus": ["NEW", "EXISTING", ...]},
+      "properties": {"PSET_WALLCOMMON": {"STATUS": "PEnum_ElementStatus"}}
+    }
+
+Enumerations are shared by name (``PEnum_ElementStatus`` is used by hundreds
+of psets), so each list is stored once. Property set and property keys are
+upper-cased, like the scoped datatype lookups in lib/ifc-schema.ts.
+
+A version whose property sets have no enumerated properties gets no file
+(and a previous one is removed): the editor then has nothing to check
+against, which is what a missing index already means to it.
+"""
+
+from pathlib import Path
+
+from . import GENERATED_DIR
+from .output import remove_output, write_json
+
+
+def build_enumeration_index(version: str, property_sets: list[dict]) -> dict:
+    lists: dict[str, list[str]] = {}
+    properties: dict[str, dict[str, str]] = {}
+    for pset in property_sets:
+        for prop in pset.get("properties", []):
+            values = prop.get("enumeration")
+            if not values:
+                continue
+            name = prop.get("enumerationName") or f"{pset['name']}.{prop['name']}"
+            if lists.get(name, values) != values:
+                # Same list name with different items: keep both apart.
+                name = f"{pset['name']}.{prop['name']}"
+            lists[name] = values
+            properties.setdefault(pset["name"].upper(), {})[prop["name"].upper()] = name
+    return {
+        "version": version,
+        "lists": dict(sorted(lists.items())),
+        "properties": {p: dict(sorted(props.items())) for p, props in sorted(properties.items())},
+    }
+
+
+def write_enumeration_indexes(by_version: dict[str, list[dict]],
+                              output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Write ``enumerations-{version}.json`` for every version with enumerations."""
+    written = {}
+    for version, psets in by_version.items():
+        path = output_dir / f"enumerations-{version.lower()}.json"
+        index = build_enumeration_index(version, psets)
+        if not index["lists"]:
+            remove_output(path)
+            continue
+        write_json(path, index)
+        written[version] = path
+    return written
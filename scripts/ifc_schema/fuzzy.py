@@ -0,0 +1,241 @@
+"""
+Fuzzy name index for "did you mean" suggestions.
+
+Entity, property set and property names of one IFC version go into a
+trigram index, ``fuzzy-{version}.json``, that the editor (lib/ifc-schema.ts)
+and the auditor (audit.py) query without scanning every name:
+
+    {
+      "version": "IFC4",
+      "kinds": ["entity", "pset", "property"],
+      "names": ["IfcActionRequest", ...],   # sorted by key, index = name id
+      "nameKinds": "1124...",               # per name: bitmask of "kinds"
+      "trigrams": {"  p": "<base64>", ...}  # trigram -> posting list
+    }
+
+A name's key is its lower-cased form padded as ``"  " + key + " "``; its
+trigrams are the distinct 3-character windows of that. A posting list holds
+the ids of the names with that trigram, ascending, as unsigned LEB128
+varints of the gaps between them, base64 encoded.
+
+``FuzzyIndex.suggest()`` counts the trigrams a query shares with each name,
+drops the names that share too few of them or differ too much in length to
+be within the edit distance limit, ranks the rest by Dice similarity, and
+keeps the best ``CANDIDATES`` whose edit distance (optimal string alignment,
+on the keys) is within the limit.
+Case-only differences have distance 0, so ``pset_wallcommon`` suggests
+``Pset_WallCommon`` first.
+"""
+
+import base64
+import json
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+
+from . import GENERATED_DIR
+from .output import write_json
+
+# Order is part of the file format: nameKinds are bitmasks over this list.
+KINDS = ["entity", "pset", "property"]
+ALL_KINDS = (1 << len(KINDS)) - 1
+
+# Names ranked by trigram similarity that get an edit distance check.
+CANDIDATES = 50
+
+# Trigrams one edit can remove from a key (a transposition touches four).
+MAX_GRAMS_PER_EDIT = 4
+
+
+def kind_mask(kinds) -> int:
+    return sum(1 << KINDS.index(kind) for kind in kinds)
+
+
+def name_key(name: str) -> str:
+    return name.lower()
+
+
+def trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # Shared ends never cost anything (pset names mostly differ mid-name).
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if not a or not b:
+        return min(max(len(a), len(b)), limit + 1)
+
+    # Only cells within ``limit`` of the diagonal can stay within it.
+    over = limit + 1
+    previous = None
+    row = [min(j, over) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            value = min(row[j] + 1, current[j - 1] + 1, row[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous[j - 2] + 1)
+            current[j] = min(value, over)
+        if min(current) > limit:
+            return over
+        previous, row = row, current
+    return row[-1]
+
+
+def default_max_distance(key: str) -> int:
+    return max(1, len(key) // 4)
+
+
+# -- building -------------------------------------------------------------------
+
+def _encode_postings(ids: list[int]) -> str:
+    out = bytearray()
+    last = 0
+    for i in ids:
+        gap = i - last
+        last = i
+        while gap >= 0x80:
+            out.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return base64.b64encode(bytes(out)).decode("ascii")
+
+
+def build_fuzzy_index(version: str, entities: list[dict], property_sets: list[dict]) -> dict:
+    kinds: dict[str, int] = {}
+    for entity in entities:
+        kinds[entity["name"]] = kinds.get(entity["name"], 0) | kind_mask(["entity"])
+    for pset in property_sets:
+        kinds[pset["name"]] = kinds.get(pset["name"], 0) | kind_mask(["pset"])
+        for prop in pset.get("properties", []):
+            kinds[prop["name"]] = kinds.get(prop["name"], 0) | kind_mask(["property"])
+
+    names = sorted(kinds, key=lambda n: (name_key(n), n))
+    postings: dict[str, list[int]] = {}
+    for i, name in enumerate(names):
+        for gram in trigrams(name_key(name)):
+            postings.setdefault(gram, []).append(i)
+    return {
+        "version": version,
+        "kinds": KINDS,
+        "names": names,
+        "nameKinds": "".join(str(kinds[n]) for n in names),
+        "trigrams": {gram: _encode_postings(ids) for gram, ids in sorted(postings.items())},
+    }
+
+
+def write_fuzzy_indexes(entities: dict[str, list[dict]], property_sets: dict[str, list[dict]],
+                        output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Write ``fuzzy-{version}.json`` for every version with property sets."""
+    written = {}
+    for version, psets in property_sets.items():
+        path = output_dir / f"fuzzy-{version.lower()}.json"
+        write_json(path, build_fuzzy_index(version, entities.get(version, []), psets),
+                   compact=True)
+        written[version] = path
+    return written
+
+
+# -- querying -------------------------------------------------------------------
+
+def _decode_postings(encoded: str) -> list[int]:
+    ids = []
+    last = shift = gap = 0
+    for byte in base64.b64decode(encoded):
+        gap |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        last += gap
+        ids.append(last)
+        gap = shift = 0
+    return ids
+
+
+class FuzzyIndex:
+    """Read side of a fuzzy index; posting lists are decoded on first use."""
+
+    def __init__(self, table: dict):
+        self.version = table["version"]
+        self.names = table["names"]
+        self.keys = [name_key(n) for n in self.names]
+        self.kinds = [int(k) for k in table["nameKinds"]]
+        self.gram_counts = [len(trigrams(k)) for k in self.keys]
+        self._encoded = table["trigrams"]
+        self._postings: dict[str, list[int]] = {}
+
+    def postings(self, gram: str) -> list[int]:
+        ids = self._postings.get(gram)
+        if ids is None:
+            encoded = self._encoded.get(gram)
+            ids = self._postings[gram] = _decode_postings(encoded) if encoded else []
+        return ids
+
+    def suggest(self, query: str, kinds=None, limit: int = 5,
+                max_distance: int | None = None) -> list[tuple[str, int]]:
+        """``(name, distance)`` of the closest names of ``kinds``, best first."""
+        key = name_key(query.strip())
+        if not key:
+            return []
+        mask = kind_mask(kinds) if kinds else ALL_KINDS
+        if max_distance is None:
+            max_distance = default_max_distance(key)
+        grams = trigrams(key)
+        shared = Counter(chain.from_iterable(self.postings(gram) for gram in grams))
+        # One edit removes at most MAX_GRAMS_PER_EDIT of the query's trigrams
+        # and changes the length by at most one.
+        need = len(grams) - MAX_GRAMS_PER_EDIT * max_distance
+        candidates = [i for i, n in shared.items()
+                      if n >= need and abs(len(self.keys[i]) - len(key)) <= max_distance
+                      and self.kinds[i] & mask]
+        candidates.sort(key=lambda i: (-2 * shared[i] / (len(grams) + self.gram_counts[i]),
+                                       self.keys[i]))
+        found = []
+        bound = max_distance
+        for i in candidates[:CANDIDATES]:
+            distance = edit_distance(key, self.keys[i], bound)
+            if distance <= bound:
+                found.append((distance, -shared[i], self.keys[i], self.names[i]))
+                if len(found) >= limit:
+                    # Nothing further than the limit-th best can make the cut.
+                    found.sort()
+                    del found[limit:]
+                    bound = found[-1][0]
+        return [(name, distance) for distance, _, _, name in sorted(found)]
+
+
+def _load_json(path: Path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_fuzzy_index(version: str, schema_dir: str = str(GENERATED_DIR)) -> FuzzyIndex:
+    """The (process-wide cached) fuzzy index of ``version``.
+
+    Built in memory from the entity and property set files when
+    ``fuzzy-{version}.json`` hasn't been generated.
+    """
+    path = Path(schema_dir)
+    suffix = version.lower()
+    table = _load_json(path / f"fuzzy-{suffix}.json")
+    if table is None:
+        table = build_fuzzy_index(version, _load_json(path / f"entities-{suffix}.json") or [],
+                                  _load_json(path / f"property-sets-{suffix}.json") or [])
+    return FuzzyIndex(table)
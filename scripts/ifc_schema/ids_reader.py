@@ -0,0 +1,179 @@
+"""
+Streaming reader that turns IDS XML files into plain specification dicts.
+
+This is the Python counterpart of ``lib/ids-xml-parser.ts`` for headless
+tooling: it keeps the facet data (applicability + requirements) and drops the
+graph/layout concerns. Namespace prefixes are ignored, so both ``ids:``
+prefixed and default-namespace files are accepted. Specifications are
+yielded one at a time as the file is read, so multi-megabyte IDS files with
+thousands of specifications are processed in constant memory.
+
+Each specification is yielded as::
+
+    {
+        "name": "Walls need a fire rating",
+        "identifier": "SPEC-1",
+        "ifcVersion": ["IFC4", "IFC4X3_ADD2"],
+        "applicability": [facet, ...],
+        "applicabilityMinOccurs": "1",
+        "applicabilityMaxOccurs": "unbounded",
+        "requirements": [facet, ...],
+    }
+
+and each facet as ``{"facet": "property", "propertySet": ..., ...}``. An
+IDS value is either a plain string (``simpleValue``) or a restriction dict
+(``{"base": "xs:string", "enumeration": [...], "pattern": ..., ...}``).
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Iterator
+
+FACET_TYPES = ("entity", "partOf", "classification", "attribute", "property", "material")
+
+# Child elements of a facet that hold an IDS value (simpleValue or restriction).
+VALUE_FIELDS = {
+    "entity": ("name", "predefinedType"),
+    "partOf": (),
+    "classification": ("value", "system"),
+    "attribute": ("name", "value"),
+    "property": ("propertySet", "baseName", "value"),
+    "material": ("value",),
+}
+
+# Facet XML attributes carried over verbatim.
+FACET_ATTRIBUTES = ("dataType", "cardinality", "uri", "instructions", "relation")
+
+
+class IdsParseError(Exception):
+    """Raised when a file is not a well-formed IDS document."""
+
+
+def local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` part of an ElementTree tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(elem: ET.Element, name: str) -> ET.Element | None:
+    for child in elem:
+        if local_name(child.tag) == name:
+            return child
+    return None
+
+
+def parse_restriction(elem: ET.Element) -> dict:
+    """Convert an ``xs:restriction`` element into a flat dict."""
+    restriction: dict = {}
+    base = elem.get("base")
+    if base:
+        restriction["base"] = base
+    for facet in elem:
+        key = local_name(facet.tag)
+        value = facet.get("value")
+        if value is None:
+            value = (facet.text or "").strip()
+        if key == "enumeration":
+            restriction.setdefault("enumeration", []).append(value)
+        else:
+            restriction[key] = value
+    return restriction
+
+
+def parse_value(elem: ET.Element | None) -> str | dict | None:
+    """Convert an IDS ``idsValue`` element into a string or restriction dict."""
+    if elem is None:
+        return None
+    simple = _child(elem, "simpleValue")
+    if simple is not None:
+        return (simple.text or "").strip()
+    restriction = _child(elem, "restriction")
+    if restriction is not None:
+        return parse_restriction(restriction)
+    text = (elem.text or "").strip()
+    return text or None
+
+
+def parse_facet(elem: ET.Element) -> dict | None:
+    """Convert a facet element (entity, property, ...) into a dict."""
+    facet_type = local_name(elem.tag)
+    if facet_type not in FACET_TYPES:
+        return None
+
+    facet: dict = {"facet": facet_type}
+    for field in VALUE_FIELDS[facet_type]:
+        value = parse_value(_child(elem, field))
+        if value is not None:
+            facet[field] = value
+    for attr in FACET_ATTRIBUTES:
+        value = elem.get(attr)
+        if value is not None:
+            facet[attr] = value
+
+    if facet_type == "partOf":
+        entity = _child(elem, "entity")
+        if entity is not None:
+            facet["entity"] = parse_facet(entity)
+    if "dataType" in facet:
+        facet["dataType"] = facet["dataType"].upper()
+    return facet
+
+
+def parse_specification(elem: ET.Element) -> dict:
+    """Convert a ``specification`` element into a spec dict."""
+    spec: dict = {
+        "name": elem.get("name", ""),
+        "ifcVersion": elem.get("ifcVersion", "").split(),
+        "applicability": [],
+        "requirements": [],
+    }
+    for attr in ("identifier", "description", "instructions"):
+        if elem.get(attr):
+            spec[attr] = elem.get(attr)
+
+    applicability = _child(elem, "applicability")
+    if applicability is not None:
+        spec["applicabilityMinOccurs"] = applicability.get("minOccurs")
+        spec["applicabilityMaxOccurs"] = applicability.get("maxOccurs")
+        spec["applicability"] = [f for f in map(parse_facet, applicability) if f]
+
+    requirements = _child(elem, "requirements")
+    if requirements is not None:
+        spec["requirements"] = [f for f in map(parse_facet, requirements) if f]
+    return spec
+
+
+def iter_specifications(source) -> Iterator[dict]:
+    """Yield the specifications of an IDS file one at a time.
+
+    ``source`` is a path or a binary file object. The document is read with
+    ``iterparse``: each ``specification`` subtree is converted as soon as its
+    end tag is seen and then detached from the tree, so peak memory is bounded
+    by the largest single specification rather than by the file size.
+    """
+    depth = 0
+    root_checked = False
+    container: ET.Element | None = None
+    try:
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if not root_checked:
+                    if local_name(elem.tag) != "ids":
+                        raise IdsParseError("missing ids root element")
+                    root_checked = True
+                elif depth == 2:
+                    container = elem
+                continue
+
+            depth -= 1
+            # Specifications live at ids/specifications/specification (depth 3).
+            if depth == 2 and local_name(elem.tag) == "specification":
+                spec = parse_specification(elem)
+                if container is not None:
+                    container.remove(elem)
+                elem.clear()
+                yield spec
+            elif depth == 1:
+                # Finished a top-level section (info, specifications): drop it.
+                elem.clear()
+    except ET.ParseError as e:
+        raise IdsParseError(str(e)) from e
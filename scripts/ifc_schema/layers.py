@@ -0,0 +1,186 @@
+"""
+Layered merging of property set sources.
+
+Property sets come from several sources: the curated catalog
+(ifc_schema/catalog.py), the PSD templates, and overlay packs such as a
+company's own psets or an export of the editor's custom schema store
+(``idsedit-custom-schema`` in localStorage). ``merge_layers()`` combines them
+by priority, lowest first:
+
+- a set only in a higher layer is added
+- for a set in both, the higher layer's properties replace same-named ones
+  and add the rest, and its other keys (``applicableEntities``,
+  ``templateType``, ...) replace the lower layer's where present
+- duplicates within one layer merge like ``merge_duplicate_psets()``: the
+  first wins and later ones only add properties
+- a property with nothing but a ``name`` only adds (as ``IFCLABEL``), it
+  never replaces a typed definition
+
+Every version is merged in a single pass over the layers, with one name
+index per version and one property index per set. Besides the merged sets,
+each layer gets a delta: the partial records that reproduce its changes on
+top of the layers below it (new sets in full, otherwise only the changed
+keys and properties). Deltas are written as ``pset-layer-{name}.json``:
+
+    {
+      "layer": "acme",
+      "priority": 1,
+      "versions": {"IFC4": [{"name": "Pset_WallCommon", "properties": [...]}]}
+    }
+
+so a pack can ship as its (small) delta instead of a forked copy of the
+merged files.
+
+Overlay packs are JSON files named after their layer in ``OVERLAY_DIR``
+(applied in file name order). Each file is a list of pset records (applying
+to the versions in their ``ifcVersion``, or to all without one),
+``{version: [records]}``, or a custom schema store export
+(``{"propertySets": [{"name": ..., "properties": ["PropName", ...]}]}``),
+whose properties are names only.
+"""
+
+import json
+from pathlib import Path
+
+from . import GENERATED_DIR, IFC_VERSIONS, REPO_ROOT, metrics
+from .canonical import canonical_property_set, version_order
+from .output import publish_target, write_json
+
+OVERLAY_DIR = REPO_ROOT / "scripts" / "psd" / "overlays"
+DELTA_PREFIX = "pset-layer-"
+
+Layer = tuple[str, dict[str, list[dict]]]
+
+
+# -- loading ------------------------------------------------------------------
+
+def _custom_store_records(data: dict) -> list[dict]:
+    return [{"name": pset["name"], "properties": [{"name": p} for p in pset["properties"]]}
+            for pset in data["propertySets"]]
+
+
+def layer_by_version(data) -> dict[str, list[dict]]:
+    """``{version: [psets]}`` from any of the overlay pack shapes."""
+    if isinstance(data, dict) and "propertySets" in data:
+        data = _custom_store_records(data)
+    if isinstance(data, dict):
+        return {v: list(psets) for v, psets in data.items()}
+    by_version: dict[str, list[dict]] = {v: [] for v in IFC_VERSIONS}
+    for pset in data:
+        for version in pset.get("ifcVersion") or IFC_VERSIONS:
+            by_version.setdefault(version, []).append(pset)
+    return by_version
+
+
+def overlay_files(overlay_dir: Path = OVERLAY_DIR) -> list[Path]:
+    return sorted(overlay_dir.glob("*.json")) if overlay_dir.is_dir() else []
+
+
+def load_overlays(overlay_dir: Path = OVERLAY_DIR) -> list[Layer]:
+    """The overlay packs of ``overlay_dir``, lowest priority first."""
+    layers = []
+    for path in overlay_files(overlay_dir):
+        with open(path) as f:
+            layers.append((path.stem, layer_by_version(json.load(f))))
+    return layers
+
+
+# -- merging ------------------------------------------------------------------
+
+def _typed(prop: dict) -> dict:
+    return prop if "dataType" in prop else {**prop, "dataType": "IFCLABEL"}
+
+
+class _MergedSet:
+    """A merged pset plus the index of its properties by name."""
+
+    __slots__ = ("record", "props")
+
+    def __init__(self, pset: dict):
+        self.record = {"applicableEntities": [], **pset,
+                       "properties": [_typed(p) for p in pset.get("properties", [])]}
+        self.props = {p["name"]: i for i, p in enumerate(self.record["properties"])}
+
+    def apply(self, pset: dict, override: bool) -> dict | None:
+        """Merge ``pset`` in; return the partial record of what changed."""
+        changed = {}
+        if override:
+            for key, value in pset.items():
+                if key not in ("name", "properties") and self.record.get(key) != value:
+                    self.record[key] = changed[key] = value
+        props = []
+        for prop in pset.get("properties", []):
+            i = self.props.get(prop["name"])
+            if i is None:
+                prop = _typed(prop)
+                self.props[prop["name"]] = len(self.record["properties"])
+                self.record["properties"].append(prop)
+                props.append(prop)
+            elif override and len(prop) > 1 and self.record["properties"][i] != prop:
+                self.record["properties"][i] = prop
+                props.append(prop)
+        if props:
+            changed["properties"] = props
+        return {"name": pset["name"], **changed} if changed else None
+
+
+def merge_layers(layers: list[Layer]) -> tuple[dict[str, list[dict]], dict[str, dict[str, list[dict]]]]:
+    """Merge ``(name, {version: [psets]})`` layers, lowest priority first.
+
+    Returns the merged sets by version and each layer's delta by version.
+    The inputs are not modified.
+    """
+    merged: dict[str, dict[str, _MergedSet]] = {}
+    deltas: dict[str, dict[str, list[dict]]] = {}
+    for name, by_version in layers:
+        layer_delta = deltas.setdefault(name, {})
+        for version, psets in by_version.items():
+            index = merged.setdefault(version, {})
+            seen = set()
+            delta = []
+            for pset in psets:
+                current = index.get(pset["name"])
+                if current is None:
+                    index[pset["name"]] = current = _MergedSet(pset)
+                    delta.append(dict(current.record, properties=list(current.record["properties"])))
+                    metrics.incr(f"layers.{name}.added")
+                else:
+                    change = current.apply(pset, override=pset["name"] not in seen)
+                    if change:
+                        delta.append(change)
+                        metrics.incr(f"layers.{name}.changed")
+                seen.add(pset["name"])
+            if delta:
+                layer_delta[version] = delta
+    return ({v: [s.record for s in index.values()] for v, index in merged.items()}, deltas)
+
+
+# -- deltas ---------------------------------------------------------------------
+
+def delta_path(layer: str, output_dir: Path = GENERATED_DIR) -> Path:
+    return output_dir / f"{DELTA_PREFIX}{layer}.json"
+
+
+def delta_files(output_dir: Path = GENERATED_DIR) -> list[Path]:
+    return sorted(output_dir.glob(f"{DELTA_PREFIX}*.json"))
+
+
+def write_layer_deltas(layers: list[Layer], deltas: dict[str, dict[str, list[dict]]],
+                       output_dir: Path = GENERATED_DIR) -> list[Path]:
+    """Write the delta of every layer but the lowest; prune deltas of layers that are gone."""
+    written = []
+    for priority, (name, _) in enumerate(layers):
+        if priority == 0:
+            continue
+        delta = deltas.get(name, {})
+        # canonical_property_set() only touches the keys a partial record has
+        versions = {v: sorted((canonical_property_set(p) for p in delta[v]), key=lambda p: p["name"])
+                    for v in version_order(list(delta))}
+        path = delta_path(name, output_dir)
+        write_json(path, {"layer": name, "priority": priority, "versions": versions})
+        written.append(path)
+    for stale in set(delta_files(output_dir)) - set(written):
+        for path in (stale, publish_target(stale)):
+            if path is not None and path.exists():
+                path.unlink()
+    return written
@@ -0,0 +1,110 @@
+"""
+Per-locale documentation packs for the standard property sets.
+
+The PSD templates carry a definition for every property set and property,
+plus localized names and definitions (``NameAliases`` / ``DefinitionAliases``
+with a ``lang``). None of that belongs in ``property-sets-{version}.json``,
+which every client downloads, so the PSD parser hands it over separately
+(``"localizations"`` on the parsed psets) and it is written to one file per
+locale, ``psd-locale-{locale}.json``:
+
+    {
+      "locale": "de-DE",
+      "propertySets": {
+        "Pset_WallCommon": {
+          "definition": "...",
+          "properties": {"Reference": {"name": "Bauteiltyp", "definition": "..."}}
+        }
+      }
+    }
+
+The untranslated ``Definition`` elements make up the ``en`` pack. Packs are
+shared by all IFC versions (pset names are the same), and the browser only
+fetches the pack of the locale it shows.
+"""
+
+import re
+from pathlib import Path
+
+from . import GENERATED_DIR, metrics
+from .output import remove_output, write_json
+
+DEFAULT_LOCALE = "en"
+LOCALE_PACK_PREFIX = "psd-locale-"
+
+# BCP 47-ish tags as used by the PSD ``lang`` attributes ("de-DE", "zh-CN").
+_LOCALE = re.compile(r"^[A-Za-z]{2,3}(-[A-Za-z0-9]{2,8})*$")
+
+
+def locale_pack_path(locale: str, output_dir: Path = GENERATED_DIR) -> Path:
+    return output_dir / f"{LOCALE_PACK_PREFIX}{locale}.json"
+
+
+def locale_of(path: Path) -> str:
+    return path.stem.removeprefix(LOCALE_PACK_PREFIX)
+
+
+def locale_pack_files(output_dir: Path = GENERATED_DIR) -> list[Path]:
+    return sorted(output_dir.glob(f"{LOCALE_PACK_PREFIX}*.json"))
+
+
+def localized_texts(elem, ns: str = "") -> dict[str, dict[str, str]]:
+    """``{locale: {"name": ..., "definition": ...}}`` of a PSD element."""
+    texts: dict[str, dict[str, str]] = {}
+    definition = (elem.findtext(f"{ns}Definition") or "").strip()
+    if definition:
+        texts[DEFAULT_LOCALE] = {"definition": definition}
+    for container, tag, key in (("NameAliases", "NameAlias", "name"),
+                                ("DefinitionAliases", "DefinitionAlias", "definition")):
+        for alias in elem.findall(f"{ns}{container}/{ns}{tag}"):
+            lang = (alias.get("lang") or "").strip()
+            text = (alias.text or "").strip()
+            if text and _LOCALE.match(lang):
+                texts.setdefault(lang, {}).setdefault(key, text)
+    return texts
+
+
+def split_localizations(property_sets: list[dict]) -> dict[str, dict]:
+    """Remove ``"localizations"`` from parsed psets and group it by locale.
+
+    A parsed pset's ``localizations`` is ``{locale: {"name"?, "definition"?,
+    "properties": {prop: {"name"?, "definition"?}}}}``.
+
+    The first pset (and property) of a name wins, like duplicate merging.
+    """
+    packs: dict[str, dict] = {}
+    for pset in property_sets:
+        for locale, texts in pset.pop("localizations", {}).items():
+            entry = packs.setdefault(locale, {}).setdefault(pset["name"], {})
+            for key in ("name", "definition"):
+                if key in texts:
+                    entry.setdefault(key, texts[key])
+            for prop, prop_texts in texts.get("properties", {}).items():
+                prop_entry = entry.setdefault("properties", {}).setdefault(prop, {})
+                for key, text in prop_texts.items():
+                    prop_entry.setdefault(key, text)
+    return packs
+
+
+def _sorted_pack(locale: str, psets: dict) -> dict:
+    property_sets = {}
+    for name in sorted(psets):
+        entry = {k: psets[name][k] for k in ("name", "definition") if k in psets[name]}
+        props = psets[name].get("properties", {})
+        if props:
+            entry["properties"] = {p: dict(sorted(props[p].items())) for p in sorted(props)}
+        property_sets[name] = entry
+    return {"locale": locale, "propertySets": property_sets}
+
+
+def write_locale_packs(packs: dict[str, dict], output_dir: Path = GENERATED_DIR) -> list[Path]:
+    """Write one pack per locale and remove packs of locales that are gone."""
+    written = []
+    for locale in sorted(packs):
+        path = locale_pack_path(locale, output_dir)
+        write_json(path, _sorted_pack(locale, packs[locale]))
+        written.append(path)
+    for stale in set(locale_pack_files(output_dir)) - set(written):
+        remove_output(stale)
+        metrics.incr("locales.pruned")
+    return written
@@ -0,0 +1,105 @@
+"""
+Content-hashed copies of the published schema files plus a manifest.
+
+Every ``public/generated/<name>.json`` gets a sibling
+``<name>.<hash>.json`` (first 10 hex digits of its SHA-256), which can be
+served with immutable cache headers because its content never changes under
+that name. ``manifest.json`` maps logical names to those URLs:
+
+    {
+      "version": 1,
+      "files": {
+        "entities-ifc4.json": "/generated/entities-ifc4.3f2a9c1b0d.json",
+        ...
+      }
+    }
+
+Only the manifest needs revalidating. It is written after all hashed files
+exist, so a client never sees a manifest entry whose file isn't there yet.
+Hashed files that neither the new nor the previous manifest references are
+removed afterwards, so clients still holding the previous manifest keep
+working.
+
+Those previous-generation copies only matter to a running server; they
+don't belong in a commit. ``prune_superseded()`` (``generate-schema.py
+--prune``) deletes every hashed file the current manifest doesn't reference,
+and ``--verify`` fails while any are left.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from . import PUBLIC_GENERATED_DIR, metrics
+from .output import publish_file, write_json
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+HASH_LENGTH = 10
+URL_PREFIX = "/generated/"
+
+_HASHED_NAME = re.compile(rf"^.+\.[0-9a-f]{{{HASH_LENGTH}}}\.json$")
+
+
+def is_hashed_name(name: str) -> bool:
+    return bool(_HASHED_NAME.match(name))
+
+
+def hashed_name(path: Path) -> str:
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def read_manifest(public_dir: Path = PUBLIC_GENERATED_DIR) -> dict:
+    try:
+        with open(public_dir / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(public_dir: Path = PUBLIC_GENERATED_DIR) -> dict:
+    """Publish hashed copies of ``public_dir/*.json``, then the manifest."""
+    previous = read_manifest(public_dir).get("files", {})
+    files = {}
+    for path in sorted(public_dir.glob("*.json")):
+        if path.name == MANIFEST_NAME or is_hashed_name(path.name):
+            continue
+        name = hashed_name(path)
+        publish_file(path, public_dir / name)
+        files[path.name] = URL_PREFIX + name
+
+    manifest = {"version": MANIFEST_VERSION, "files": files}
+    # Not published: the manifest only exists in public/generated.
+    write_json(public_dir / MANIFEST_NAME, manifest, publish=False)
+
+    _prune(public_dir, keep={*files.values(), *previous.values()})
+    return manifest
+
+
+def superseded_files(public_dir: Path = PUBLIC_GENERATED_DIR) -> list[Path]:
+    """Hashed files in ``public_dir`` the current manifest doesn't reference."""
+    keep = _names(read_manifest(public_dir).get("files", {}).values())
+    return sorted(path for path in public_dir.glob("*.json")
+                  if is_hashed_name(path.name) and path.name not in keep)
+
+
+def prune_superseded(public_dir: Path = PUBLIC_GENERATED_DIR) -> list[Path]:
+    """Delete the hashed files the current manifest doesn't reference."""
+    return _prune(public_dir, keep=read_manifest(public_dir).get("files", {}).values())
+
+
+def _names(urls) -> set[str]:
+    return {url.removeprefix(URL_PREFIX) for url in urls}
+
+
+def _prune(public_dir: Path, keep) -> list[Path]:
+    keep = _names(keep)
+    pruned = []
+    for path in sorted(public_dir.glob("*.json")):
+        if is_hashed_name(path.name) and path.name not in keep:
+            path.unlink()
+            pruned.append(path)
+            metrics.incr("manifest.pruned")
+    return pruned
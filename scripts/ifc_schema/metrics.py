@@ -0,0 +1,179 @@
+"""
+Stage timings and counters for the schema generator scripts.
+
+Every generator records into the process-wide collector through the module
+level helpers::
+
+    from ifc_schema import metrics
+
+    with metrics.stage("parse"):
+        ...
+    metrics.incr("http.bytes", len(body))
+    metrics.cache("psd_file_list", hit=True)
+    ...
+    metrics.write_report("fetch-and-parse-psd")
+
+``write_report()`` is a no-op unless ``SCHEMA_METRICS_REPORT`` names a JSON
+file. The report holds one section per script under ``"scripts"``, and
+``write_report()`` replaces only its own section, keeping what other scripts
+wrote to the same file.
+
+``npm run generate-schema`` runs every stage in one process
+(generate-schema.py). The pipeline times each stage under its stage name,
+and the helpers the stages call record into the same collector. The
+orchestrator writes a single ``generate-schema`` section once the run ends,
+including runs that fail. Scripts it loads with ``load_script()`` don't write
+a section of their own. They only do that when run directly, e.g.
+``download-psd.py`` or ``update-schema-index.py``. When
+``SCHEMA_METRICS_OPENMETRICS`` is set too, the merged report is also written
+as OpenMetrics text for scraping into build dashboards.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_ENV = "SCHEMA_METRICS_REPORT"
+OPENMETRICS_ENV = "SCHEMA_METRICS_OPENMETRICS"
+
+
+class RunMetrics:
+    """Thread-safe collector of stage timings and named counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.stages: dict[str, dict] = {}
+        self.counters: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                entry = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+                entry["seconds"] += elapsed
+                entry["calls"] += 1
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def cache(self, name: str, hit: bool):
+        self.incr(f"cache.{name}.{'hits' if hit else 'misses'}")
+
+    def cache_hit_rates(self) -> dict[str, float]:
+        rates = {}
+        names = {k.split(".")[1] for k in self.counters if k.startswith("cache.")}
+        for name in sorted(names):
+            hits = self.counters.get(f"cache.{name}.hits", 0)
+            misses = self.counters.get(f"cache.{name}.misses", 0)
+            if hits + misses:
+                rates[name] = round(hits / (hits + misses), 4)
+        return rates
+
+    def report(self) -> dict:
+        with self._lock:
+            return {
+                "startedAt": self.started_at.isoformat(timespec="seconds"),
+                "durationSeconds": round(time.perf_counter() - self._start, 6),
+                "stages": {k: {"seconds": round(v["seconds"], 6), "calls": v["calls"]}
+                           for k, v in self.stages.items()},
+                "counters": dict(sorted(self.counters.items())),
+                "cacheHitRates": self.cache_hit_rates(),
+            }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def to_openmetrics(run_report: dict) -> str:
+    """Render a merged run report (``{"scripts": {...}}``) as OpenMetrics text."""
+    scripts = run_report.get("scripts", {})
+    lines = [
+        "# TYPE schema_script_duration_seconds gauge",
+        "# HELP schema_script_duration_seconds Wall time of a generator script.",
+    ]
+    for script, section in scripts.items():
+        lines.append(f'schema_script_duration_seconds{{script="{_label(script)}"}} '
+                     f'{section["durationSeconds"]}')
+
+    lines += ["# TYPE schema_stage_duration_seconds gauge",
+              "# HELP schema_stage_duration_seconds Total time spent in a pipeline stage."]
+    for script, section in scripts.items():
+        for stage, entry in section["stages"].items():
+            lines.append(f'schema_stage_duration_seconds{{script="{_label(script)}",'
+                         f'stage="{_label(stage)}"}} {entry["seconds"]}')
+
+    lines += ["# TYPE schema_events counter",
+              "# HELP schema_events Counted pipeline events (bytes, files, retries, fallbacks)."]
+    for script, section in scripts.items():
+        for name, value in section["counters"].items():
+            lines.append(f'schema_events_total{{script="{_label(script)}",'
+                         f'name="{_label(name)}"}} {value}')
+
+    lines += ["# TYPE schema_cache_hit_ratio gauge",
+              "# HELP schema_cache_hit_ratio Hit ratio of a pipeline cache."]
+    for script, section in scripts.items():
+        for name, rate in section["cacheHitRates"].items():
+            lines.append(f'schema_cache_hit_ratio{{script="{_label(script)}",'
+                         f'cache="{_label(name)}"}} {rate}')
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+_default = RunMetrics()
+
+
+def get_metrics() -> RunMetrics:
+    return _default
+
+
+def stage(name: str):
+    return _default.stage(name)
+
+
+def incr(name: str, value: float = 1):
+    _default.incr(name, value)
+
+
+def cache(name: str, hit: bool):
+    _default.cache(name, hit)
+
+
+def write_report(script: str, path: str | Path | None = None) -> Path | None:
+    """Merge this process's metrics into the run report, if one is requested."""
+    path = path or os.environ.get(REPORT_ENV)
+    if not path:
+        return None
+    path = Path(path)
+
+    run_report = {"scripts": {}}
+    try:
+        with open(path) as f:
+            run_report = json.load(f)
+    except (OSError, ValueError):
+        pass
+    run_report.setdefault("scripts", {})[script] = _default.report()
+    run_report["updatedAt"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(run_report, f, indent=2)
+        f.write("\n")
+
+    openmetrics_path = os.environ.get(OPENMETRICS_ENV)
+    if openmetrics_path:
+        Path(openmetrics_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(openmetrics_path, "w") as f:
+            f.write(to_openmetrics(run_report))
+    return path
@@ -0,0 +1,156 @@
+"""
+Atomic, hash-aware writes for the generated schema files.
+
+A running ``next dev`` reads ``public/generated`` (and bundles
+``lib/generated``) while the generators write them, so every output goes
+through ``write_bytes()``: the content is written to a temporary file in the
+target directory and renamed over the target, so readers see either the old
+or the new file, never half of one. When the target already holds exactly
+these bytes nothing is touched, which keeps mtimes (and the dev server's
+caches) stable across no-op runs.
+
+Files written into ``lib/generated/ifc-schema`` are published to
+``public/generated`` by the same call, as a hardlink where the filesystem
+allows it and as an atomic copy otherwise.
+
+The digest and size of everything written in this process are remembered, so
+the schema index can describe the files without reading them back
+(``file_info()``).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from . import GENERATED_DIR, PUBLIC_GENERATED_DIR, metrics
+
+
+_written: dict[Path, dict] = {}
+_written_lock = threading.Lock()
+
+
+def _remember(path: Path, data: bytes):
+    info = {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
+    with _written_lock:
+        _written[path.resolve()] = info
+
+
+def file_info(path: Path) -> dict | None:
+    """SHA-256 and byte size of ``path``; from memory if written this run."""
+    path = Path(path)
+    with _written_lock:
+        info = _written.get(path.resolve())
+    if info is not None:
+        return dict(info)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
+
+
+def _same_content(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _replace_with(path: Path, data: bytes):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def publish_target(path: Path) -> Path | None:
+    """Public copy of ``path`` if it lives in ``lib/generated/ifc-schema``."""
+    path = Path(path)
+    if path.resolve().parent == GENERATED_DIR.resolve():
+        return PUBLIC_GENERATED_DIR / path.name
+    return None
+
+
+def publish_file(source: Path, target: Path) -> bool:
+    """Make ``target`` hold ``source``'s content; return whether it changed."""
+    source, target = Path(source), Path(target)
+    if target.exists():
+        try:
+            if os.path.samefile(source, target):
+                return False
+        except OSError:
+            pass
+    data = source.read_bytes()
+    if _same_content(target, data):
+        return False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.link")
+    try:
+        os.link(source, tmp)
+        os.replace(tmp, target)
+    except OSError:
+        # Cross-device, or a filesystem without hardlinks.
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        _replace_with(target, data)
+    metrics.incr("output.published")
+    return True
+
+
+def write_bytes(path: Path, data: bytes, publish: bool = True) -> bool:
+    """Atomically write ``data`` unless ``path`` already holds it.
+
+    Returns whether the file changed. With ``publish`` (the default), files
+    in ``lib/generated/ifc-schema`` are also published to ``public/generated``.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    changed = not _same_content(path, data)
+    if changed:
+        _replace_with(path, data)
+        metrics.incr("output.written")
+    else:
+        metrics.incr("output.unchanged")
+    _remember(path, data)
+
+    target = publish_target(path) if publish else None
+    if target is not None:
+        publish_file(path, target)
+    return changed
+
+
+def remove_output(path: Path) -> bool:
+    """Delete ``path`` and its published copy; return whether anything existed."""
+    removed = False
+    for target in (Path(path), publish_target(path)):
+        if target is not None and target.exists():
+            target.unlink()
+            removed = True
+    return removed
+
+
+def write_json(path: Path, data, indent: int | None = 2, compact: bool = False,
+               trailing_newline: bool = True, publish: bool = True) -> bool:
+    """Serialise ``data`` and write it with ``write_bytes()``."""
+    if compact:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=indent)
+    if trailing_newline:
+        text += "\n"
+    return write_bytes(path, text.encode("utf-8"), publish=publish)
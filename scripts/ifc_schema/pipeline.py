@@ -0,0 +1,305 @@
+"""
+Small in-process DAG runner for the schema generation stages.
+
+A ``Stage`` names its dependencies and gets their results passed in memory,
+so nothing is written to disk only to be read back by the next step. Stages
+whose dependencies are done run concurrently on a thread pool (the PSD stage
+is network bound, the entity export spends its time in IfcOpenShell).
+
+Stages that declare ``inputs`` and ``load`` are incremental: the runner
+hashes the inputs (file contents, or any JSON-serialisable value) together
+with the output digests of the stage's dependencies, and when that matches the
+previous run and the outputs are still byte-for-byte what that run wrote, the
+stage is skipped and ``load()`` restores its result from the outputs instead.
+Fingerprints live in a small state file (``STATE_FILE``) that isn't committed.
+
+While the stages run, what they print is written line by line with a
+``[stage]`` prefix, so the output of concurrent stages stays readable.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+from . import REPO_ROOT, metrics
+
+STATE_FILE = REPO_ROOT / "scripts" / ".cache" / "generate-schema-state.json"
+FINGERPRINT_FILE = REPO_ROOT / "scripts" / ".cache" / "generate-schema-fingerprint"
+
+
+class PipelineError(Exception):
+    """Raised when the stage graph is malformed or a stage fails."""
+
+
+class Stage:
+    """One node of the generation graph.
+
+    ``run(results)`` receives a dict with the results of ``deps`` and returns
+    this stage's result. ``inputs(results)`` lists what the result depends on
+    besides the dependencies: ``Path`` entries are hashed by content, anything
+    else by its JSON form. ``outputs()`` lists the files the stage writes and
+    ``load()`` rebuilds the result from them when the stage is skipped.
+    Stages without ``inputs`` always run.
+    """
+
+    def __init__(self, name: str, run: Callable[[dict], Any], deps: tuple[str, ...] = (),
+                 inputs: Callable[[dict], list] | None = None,
+                 outputs: Callable[[], list[Path]] | None = None,
+                 load: Callable[[], Any] | None = None):
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.outputs = outputs or (lambda: [])
+        self.load = load
+
+    @property
+    def incremental(self) -> bool:
+        return self.inputs is not None and self.load is not None
+
+
+class StageOutput:
+    """``sys.stdout`` stand-in that keeps concurrent output line by line.
+
+    Every thread's output is written a whole line at a time, under a lock;
+    lines printed by a stage get a ``[stage]`` prefix. (Pools a stage starts
+    itself print unprefixed.)
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        *lines, self._local.pending = (getattr(self._local, "pending", "") + text).split("\n")
+        if lines:
+            self._emit(lines)
+        return len(text)
+
+    def _emit(self, lines: list[str]):
+        name = getattr(self._local, "stage", None)
+        if name is not None:
+            lines = [f"[{name}] {line}" if line.strip() else "" for line in lines]
+        with self._lock:
+            self.target.write("".join(f"{line}\n" for line in lines))
+
+    def flush(self):
+        pending = getattr(self._local, "pending", "")
+        with self._lock:
+            if pending and getattr(self._local, "stage", None) is None:
+                # A prompt or progress text without a newline yet.
+                self.target.write(pending)
+                self._local.pending = ""
+            self.target.flush()
+
+    @contextmanager
+    def stage(self, name: str):
+        self._local.stage, self._local.pending = name, ""
+        try:
+            yield
+        finally:
+            if self._local.pending:
+                self._emit([self._local.pending])
+            self._local.stage, self._local.pending = None, ""
+
+    def __getattr__(self, attr):
+        return getattr(self.target, attr)
+
+
+def file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def fingerprint(stage: Stage, results: dict, dep_fingerprints: list[str]) -> str:
+    digest = hashlib.sha256(stage.name.encode())
+    for dep in dep_fingerprints:
+        digest.update(dep.encode())
+    for item in stage.inputs(results):
+        if isinstance(item, Path):
+            digest.update(f"file:{item.name}:{file_digest(item)}".encode())
+        else:
+            digest.update(json.dumps(item, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def tree_fingerprint(inputs: list[Path], outputs: list[Path], values: dict) -> str:
+    """Whole-run fingerprint for the fast no-op check.
+
+    Inputs are hashed by content (they're small: scripts, the PSD file list,
+    the simple types); outputs only by size and mtime, which is enough to
+    notice them being regenerated, edited or deleted without reading them.
+    """
+    digest = hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode())
+    for path in inputs:
+        digest.update(f"in:{path}:{file_digest(path)}".encode())
+    for path in outputs:
+        try:
+            st = path.stat()
+            digest.update(f"out:{path}:{st.st_size}:{st.st_mtime_ns}".encode())
+        except OSError:
+            digest.update(f"out:{path}:missing".encode())
+    return digest.hexdigest()
+
+
+def read_fingerprint(path: Path = FINGERPRINT_FILE) -> tuple[str | None, bool]:
+    """(fingerprint of the last run, whether that run failed)."""
+    try:
+        value, _, status = path.read_text().strip().partition(" ")
+    except OSError:
+        return None, False
+    return value or None, status == "failed"
+
+
+def write_fingerprint(value: str, path: Path = FINGERPRINT_FILE, failed: bool = False):
+    """Store the fingerprint of a finished run, flagged when the run failed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(value + (" failed" if failed else "") + "\n")
+
+
+def topological_order(stages: list[Stage]) -> list[Stage]:
+    by_name = {s.name: s for s in stages}
+    order, visiting, done = [], set(), set()
+
+    def visit(stage: Stage):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise PipelineError(f"Dependency cycle through stage '{stage.name}'")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise PipelineError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+            visit(by_name[dep])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+        order.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return order
+
+
+def load_state(path: Path = STATE_FILE) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: dict, path: Path = STATE_FILE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def output_digests(stage: Stage) -> dict[str, str | None]:
+    return {str(p): file_digest(p) for p in stage.outputs()}
+
+
+def _combined(digests: dict[str, str | None]) -> str:
+    return hashlib.sha256(json.dumps(digests, sort_keys=True).encode()).hexdigest()
+
+
+def _up_to_date(stage: Stage, key: str, previous: dict | None) -> bool:
+    if not previous or previous.get("fingerprint") != key:
+        return False
+    recorded = previous.get("outputs", {})
+    outputs = stage.outputs()
+    if len(recorded) != len(outputs):
+        return False
+    return all(recorded.get(str(p)) == file_digest(p) for p in outputs)
+
+
+def run_pipeline(stages: list[Stage], force: set[str] | bool = False, jobs: int = 4,
+                 state_file: Path = STATE_FILE, log: Callable[[str], None] = print) -> dict:
+    """Run ``stages`` in dependency order; return ``{name: result}``.
+
+    ``force`` re-runs every stage (``True``) or the named ones. A failing
+    stage stops its dependents; independent branches still finish, their
+    fingerprints are saved, and a ``PipelineError`` is raised at the end.
+    """
+    order = topological_order(stages)
+    state = load_state(state_file)
+    results: dict[str, Any] = {}
+    keys: dict[str, str] = {}
+    # Digest of each finished stage's outputs; dependents fingerprint these,
+    # so a re-run that reproduces identical files doesn't invalidate them.
+    produced: dict[str, str] = {}
+    failed: dict[str, BaseException] = {}
+    pending = {s.name: s for s in order}
+    blocked_names: set[str] = set()
+
+    output = StageOutput(sys.stdout)
+
+    def execute(stage: Stage, inputs: dict):
+        with output.stage(stage.name), metrics.stage(stage.name):
+            return stage.run(inputs)
+
+    def blocked(stage: Stage) -> bool:
+        return any(dep in failed or dep in blocked_names for dep in stage.deps)
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            running = {}
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    if blocked(stage):
+                        blocked_names.add(name)
+                        del pending[name]
+                        log(f"⏭️  {name}: skipped (dependency failed)")
+                        continue
+                    if not all(dep in results for dep in stage.deps):
+                        continue
+                    del pending[name]
+                    inputs = {dep: results[dep] for dep in stage.deps}
+
+                    if stage.incremental:
+                        key = fingerprint(stage, inputs, [produced.get(d, "") for d in stage.deps])
+                        keys[name] = key
+                        forced = force is True or (force and name in force)
+                        if not forced and _up_to_date(stage, key, state.get(name)):
+                            results[name] = stage.load()
+                            produced[name] = _combined(state[name]["outputs"])
+                            metrics.incr("pipeline.stages_skipped")
+                            log(f"✅ {name}: unchanged, skipped")
+                            continue
+                    log(f"▶️  {name}")
+                    running[executor.submit(execute, stage, inputs)] = stage
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        results[stage.name] = future.result()
+                    except Exception as e:
+                        failed[stage.name] = e
+                        log(f"❌ {stage.name}: {e}")
+                        continue
+                    metrics.incr("pipeline.stages_run")
+                    digests = output_digests(stage)
+                    produced[stage.name] = _combined(digests)
+                    if stage.incremental:
+                        state[stage.name] = {"fingerprint": keys[stage.name], "outputs": digests}
+                        save_state(state, state_file)
+                    log(f"✅ {stage.name}: done")
+    finally:
+        sys.stdout = output.target
+
+    if failed:
+        names = ", ".join(sorted(failed))
+        raise PipelineError(f"Stage(s) failed: {names}") from next(iter(failed.values()))
+    return results
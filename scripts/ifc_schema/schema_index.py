@@ -0,0 +1,216 @@
+"""
+Build ``schema-index.json``: the entry point clients read before any other
+schema file. Besides the per-version entity / property set counts and the
+entity category descriptions, ``files`` describes every generated file:
+
+    "files": {
+      "entities-ifc4.json": {
+        "kind": "entities", "version": "IFC4",
+        "sha256": "...", "bytes": 1432113, "records": 776
+      },
+      ...
+    }
+
+so a client can decide what to prefetch and check its cached copies with one
+small request. Outputs made of sections (the binary snapshot) add
+``"sections": {name: {"offset": ..., "bytes": ...}}``. The snapshots
+(``kind: "schema-snapshot"``) are for server-side consumers and only exist in
+``lib/generated/ifc-schema``. The per-locale documentation packs (``kind: "locale-pack"``)
+are not versioned and carry ``"locale"`` instead, and the overlay deltas
+(``kind: "pset-layer"``, ifc_schema/layers.py) carry ``"layer"``. The docs
+search index (``kind: "docs-index"``, ifc_schema/docs_index.py) is not
+versioned either; its records are the chunks.
+
+The index is built from what the caller already has in memory (the
+orchestrator passes record counts straight from its stages, and digests of
+files written this run come from ``output.file_info()``). The standalone
+scripts use ``index_from_files()``, which only parses a file when its digest
+differs from the one the previous index recorded.
+
+``lastGenerated`` only moves when the rest of the index changes, so
+regenerating identical data gives an identical file. ``SOURCE_DATE_EPOCH``
+(the reproducible-builds convention) pins it explicitly.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import GENERATED_DIR, IFC_VERSIONS
+from .docs_index import INDEX_FILE as DOCS_INDEX_FILE
+from .layers import DELTA_PREFIX, delta_files
+from .locales import locale_of, locale_pack_files
+from .output import file_info, write_json
+from .snapshot import SnapshotError, describe_snapshot, snapshot_path
+
+# Per-version generated files the index describes, in index order.
+VERSIONED_FILES = ("entities", "property-sets", "simple-types", "datatype-matrix", "enumerations",
+                   "applicability", "fuzzy", "completion")
+
+CATEGORY_DESCRIPTIONS = {
+    "Building Element": "Structural building components",
+    "Spatial Structure": "Spatial organization elements",
+    "MEP Element": "Mechanical, electrical, plumbing",
+    "Structural Element": "Structural engineering elements",
+    "Material & Property": "Materials and properties",
+    "Geometry & Representation": "Geometric representations",
+    "Process & Control": "Process control systems",
+    "Documentation": "Documentation and references",
+    "Other": "Other IFC entities",
+}
+
+
+def _iso(moment: datetime) -> str:
+    # Same shape as JavaScript's Date.toISOString().
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + \
+        f"{moment.microsecond // 1000:03d}Z"
+
+
+def _without_timestamp(index: dict) -> dict:
+    return {k: v for k, v in index.items() if k != "lastGenerated"}
+
+
+def generated_timestamp(index: dict, previous: dict | None = None) -> str:
+    """``lastGenerated`` for ``index``, given the index it replaces."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return _iso(datetime.fromtimestamp(int(epoch), timezone.utc))
+    if previous and previous.get("lastGenerated"):
+        if _without_timestamp(previous) == _without_timestamp(index):
+            return previous["lastGenerated"]
+    return _iso(datetime.now(timezone.utc))
+
+
+def read_schema_index(output_dir: Path = GENERATED_DIR) -> dict | None:
+    try:
+        with open(output_dir / "schema-index.json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def count_records(kind: str, data) -> int:
+    if kind == "locale-pack":
+        return len(data["propertySets"])
+    if kind == "fuzzy":
+        return len(data["names"])
+    if kind == "completion":
+        return sum(len(data[k]["names"]) for k in ("entity", "pset", "property", "datatype"))
+    if kind == "pset-layer":
+        return sum(len(psets) for psets in data["versions"].values())
+    if kind == "datatype-matrix":
+        return len(data["types"])
+    if kind == "enumerations":
+        return sum(len(props) for props in data["properties"].values())
+    if kind == "applicability":
+        return sum(len(types) for types in data["entities"].values())
+    if kind == "docs-index":
+        return len(data["chunks"])
+    return len(data)
+
+
+def describe_file(path: Path, kind: str, version: str | None, records: int,
+                  sections: dict | None = None) -> dict | None:
+    info = file_info(path)
+    if info is None:
+        return None
+    entry = {"kind": kind}
+    if version:
+        entry["version"] = version
+    entry.update(info, records=records)
+    if sections:
+        entry["sections"] = sections
+    return entry
+
+
+def describe_generated(output_dir: Path = GENERATED_DIR, records: dict[str, int] | None = None,
+                       previous: dict | None = None) -> dict[str, dict]:
+    """The ``files`` section for the generated files in ``output_dir``.
+
+    ``records`` maps file names to record counts the caller already knows.
+    Other files are counted by parsing them, unless ``previous`` (the index
+    being replaced) recorded the same digest, in which case its count is
+    reused.
+    """
+    records = records or {}
+    known = (previous or {}).get("files", {})
+    files = {}
+
+    def count(path: Path, kind: str, info: dict) -> int | None:
+        if path.name in records:
+            return records[path.name]
+        if known.get(path.name, {}).get("sha256") == info["sha256"]:
+            return known[path.name].get("records")
+        try:
+            with open(path) as f:
+                return count_records(kind, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    for kind in VERSIONED_FILES:
+        for version in IFC_VERSIONS:
+            path = output_dir / f"{kind}-{version.lower()}.json"
+            info = file_info(path)
+            n = count(path, kind, info) if info else None
+            if n is not None:
+                files[path.name] = describe_file(path, kind, version, n)
+    for version in IFC_VERSIONS:
+        path = snapshot_path(version, output_dir)
+        try:
+            n, sections = describe_snapshot(path)
+        except SnapshotError:
+            continue
+        files[path.name] = describe_file(path, "schema-snapshot", version, n, sections)
+    for path in locale_pack_files(output_dir):
+        info = file_info(path)
+        n = count(path, "locale-pack", info) if info else None
+        if n is not None:
+            files[path.name] = {**describe_file(path, "locale-pack", None, n),
+                                "locale": locale_of(path)}
+    for path in delta_files(output_dir):
+        info = file_info(path)
+        n = count(path, "pset-layer", info) if info else None
+        if n is not None:
+            files[path.name] = {**describe_file(path, "pset-layer", None, n),
+                                "layer": path.stem[len(DELTA_PREFIX):]}
+    path = output_dir / DOCS_INDEX_FILE
+    info = file_info(path)
+    n = count(path, "docs-index", info) if info else None
+    if n is not None:
+        files[path.name] = describe_file(path, "docs-index", None, n)
+    return files
+
+
+def build_schema_index(entity_counts: dict[str, int], pset_counts: dict[str, int],
+                       previous: dict | None = None, files: dict[str, dict] | None = None) -> dict:
+    index = {
+        "versions": list(IFC_VERSIONS),
+        "lastGenerated": None,
+        "entityCounts": {v: entity_counts[v] for v in IFC_VERSIONS if v in entity_counts},
+        "propertySetCounts": {v: pset_counts[v] for v in IFC_VERSIONS if v in pset_counts},
+        "categories": dict(CATEGORY_DESCRIPTIONS),
+    }
+    if files is not None:
+        index["files"] = files
+    index["lastGenerated"] = generated_timestamp(index, previous)
+    return index
+
+
+def _counts(files: dict[str, dict], kind: str) -> dict[str, int]:
+    return {e["version"]: e["records"] for e in files.values()
+            if e["kind"] == kind and "version" in e}
+
+
+def index_from_files(output_dir: Path = GENERATED_DIR) -> dict:
+    """Rebuild the index from the files in ``output_dir``."""
+    previous = read_schema_index(output_dir)
+    files = describe_generated(output_dir, previous=previous)
+    return build_schema_index(_counts(files, "entities"), _counts(files, "property-sets"),
+                              previous=previous, files=files)
+
+
+def write_schema_index(index: dict, output_dir: Path = GENERATED_DIR) -> Path:
+    path = output_dir / "schema-index.json"
+    write_json(path, index)
+    return path
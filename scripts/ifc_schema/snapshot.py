@@ -0,0 +1,378 @@
+"""
+Read-only binary schema snapshot for server-side consumers.
+
+``SchemaIndex`` (audit.py) parses ~4MB of JSON into dicts and sets in every
+process that uses it. A snapshot holds the same lookup tables in one
+little-endian file per IFC version, ``schema-snapshot-{version}.bin``, which
+``SchemaSnapshot`` ``mmap``s and queries in place. Worker processes share its
+pages through the page cache and start up without parsing anything.
+
+Layout::
+
+    header    magic "IFCSNAP\\0", u32 format version, u32 section count
+    sections  per section: 16-byte name, u64 offset, u64 length
+
+    meta            JSON: version, categories, source file digests
+    strings         UTF-8 blob of every distinct string
+    string_offsets  u32[n + 1]: string i is strings[off[i]:off[i + 1]]
+    entities        (u32 name, u32 first, u32 count) sorted by name
+    predefined      u32 string ids, sliced by the entity records
+    psets           (u32 name, u32 first, u32 count) sorted by name
+    props           (u32 name, u32 first, u32 count) sorted by name per pset
+    prop_types      u32 string ids, sliced by the property records
+    datatypes       (u32 name, u32 category) sorted by name
+    compatible      datatype compatibility bitset (see datatypes.py)
+
+Entity, pset and property names are stored upper-cased (lookups are
+case-insensitive); everything else is stored as generated. Records are
+fixed-width, so lookups are binary searches over the mmap.
+"""
+
+import base64
+import json
+import mmap
+import struct
+from pathlib import Path
+
+from . import GENERATED_DIR, IFC_VERSIONS
+from .audit import normalize_property_name
+from .output import file_info, write_bytes
+
+MAGIC = b"IFCSNAP\x00"
+FORMAT_VERSION = 2
+
+HEADER = struct.Struct("<8sII")
+SECTION = struct.Struct("<16sQQ")
+U32 = struct.Struct("<I")
+SLICE_RECORD = struct.Struct("<III")     # name, first, count
+DATATYPE_RECORD = struct.Struct("<II")   # name, category
+
+# Files a snapshot is built from; their digests are stored in ``meta``.
+SOURCE_KINDS = ("entities", "property-sets", "datatype-matrix")
+
+
+def snapshot_path(version: str, output_dir: Path = GENERATED_DIR) -> Path:
+    return output_dir / f"schema-snapshot-{version.lower()}.bin"
+
+
+# -- writing ------------------------------------------------------------------
+
+class _Strings:
+    def __init__(self, values):
+        self.values = sorted(set(values))
+        self.ids = {s: i for i, s in enumerate(self.values)}
+
+    def sections(self) -> tuple[bytes, bytes]:
+        blob = bytearray()
+        offsets = [0]
+        for value in self.values:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        return bytes(blob), struct.pack(f"<{len(offsets)}I", *offsets)
+
+
+def _slices(records: list[tuple[str, list[str]]], strings: _Strings) -> tuple[bytes, bytes]:
+    """Fixed-width (name, first, count) records plus the id array they slice."""
+    table, ids = bytearray(), []
+    for name, values in records:
+        table += SLICE_RECORD.pack(strings.ids[name], len(ids), len(values))
+        ids.extend(strings.ids[v] for v in values)
+    return bytes(table), struct.pack(f"<{len(ids)}I", *ids)
+
+
+def build_snapshot(version: str, entities: list[dict], property_sets: list[dict],
+                   matrix: dict, sources: dict[str, str] | None = None) -> bytes:
+    """Serialise one version's lookup tables (see the module docstring)."""
+    entity_records = {}
+    for entity in entities:
+        name = entity["name"].upper()
+        entity_records[name] = sorted(set(entity_records.get(name, [])) |
+                                      set(entity.get("predefinedTypes") or []))
+
+    pset_records: dict[str, dict[str, set[str]]] = {}
+    for pset in property_sets:
+        props = pset_records.setdefault(pset["name"].upper(), {})
+        for prop in pset.get("properties", []):
+            props.setdefault(prop["name"].upper(), set()).add(prop["dataType"])
+
+    strings = _Strings(
+        [*entity_records, *(t for ts in entity_records.values() for t in ts),
+         *pset_records, *(p for ps in pset_records.values() for p in ps),
+         *(t for ps in pset_records.values() for ts in ps.values() for t in ts),
+         *matrix["types"]])
+
+    entities_table, predefined = _slices(sorted(entity_records.items()), strings)
+
+    psets_table = bytearray()
+    prop_records = []
+    for name in sorted(pset_records):
+        props = sorted(pset_records[name].items())
+        psets_table += SLICE_RECORD.pack(strings.ids[name], len(prop_records), len(props))
+        prop_records.extend((prop, sorted(types)) for prop, types in props)
+    props_table, prop_types = _slices(prop_records, strings)
+
+    # matrix["types"] is sorted (build_datatype_matrix), so record i is
+    # row/column i of the bitset.
+    datatypes = b"".join(DATATYPE_RECORD.pack(strings.ids[t], c)
+                         for t, c in zip(matrix["types"], matrix["typeCategories"]))
+
+    blob, offsets = strings.sections()
+    meta = json.dumps({"version": version, "categories": matrix["categories"],
+                       "rowBytes": matrix["rowBytes"], "sources": sources or {}},
+                      sort_keys=True).encode()
+    sections = [
+        ("meta", meta),
+        ("strings", blob),
+        ("string_offsets", offsets),
+        ("entities", entities_table),
+        ("predefined", predefined),
+        ("psets", bytes(psets_table)),
+        ("props", props_table),
+        ("prop_types", prop_types),
+        ("datatypes", datatypes),
+        ("compatible", base64.b64decode(matrix["compatible"])),
+    ]
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+    offset = len(out) + SECTION.size * len(sections)
+    for name, data in sections:
+        out += SECTION.pack(name.encode(), offset, len(data))
+        offset += len(data)
+    for _, data in sections:
+        out += data
+    return bytes(out)
+
+
+def write_snapshot(version: str, entities: list[dict], property_sets: list[dict],
+                   matrix: dict, output_dir: Path = GENERATED_DIR) -> Path:
+    suffix = version.lower()
+    sources = {}
+    for kind in SOURCE_KINDS:
+        info = file_info(output_dir / f"{kind}-{suffix}.json")
+        if info:
+            sources[f"{kind}-{suffix}.json"] = info["sha256"]
+    path = snapshot_path(version, output_dir)
+    # Server-side only: not published to public/generated.
+    write_bytes(path, build_snapshot(version, entities, property_sets, matrix, sources),
+                publish=False)
+    return path
+
+
+def write_snapshots(output_dir: Path = GENERATED_DIR) -> dict[str, Path]:
+    """Build every version's snapshot from the generated JSON files."""
+    written = {}
+    for version in IFC_VERSIONS:
+        suffix = version.lower()
+        loaded = {}
+        for kind in SOURCE_KINDS:
+            with open(output_dir / f"{kind}-{suffix}.json") as f:
+                loaded[kind] = json.load(f)
+        written[version] = write_snapshot(version, loaded["entities"], loaded["property-sets"],
+                                          loaded["datatype-matrix"], output_dir)
+    return written
+
+
+# -- reading ------------------------------------------------------------------
+
+class SnapshotError(Exception):
+    """Raised for a missing, truncated or foreign snapshot file."""
+
+
+def read_sections(data, size: int | None = None) -> dict[str, tuple[int, int]]:
+    """Section name -> (offset, length) from a snapshot header.
+
+    ``data`` is the whole file (or just its header, with ``size`` the file's
+    length).
+    """
+    size = len(data) if size is None else size
+    if len(data) < HEADER.size:
+        raise SnapshotError("Snapshot is truncated")
+    magic, fmt, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SnapshotError("Not a schema snapshot")
+    if fmt != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot format {fmt}")
+    sections = {}
+    for i in range(count):
+        position = HEADER.size + i * SECTION.size
+        if position + SECTION.size > len(data):
+            raise SnapshotError("Snapshot is truncated")
+        name, offset, length = SECTION.unpack_from(data, position)
+        if offset + length > size:
+            raise SnapshotError("Snapshot is truncated")
+        sections[name.rstrip(b"\0").decode()] = (offset, length)
+    return sections
+
+
+RECORD_TABLES = ("entities", "psets", "props", "datatypes")
+
+
+def describe_snapshot(path: Path) -> tuple[int, dict[str, dict]]:
+    """(fixed-width record count, section table) of the snapshot at ``path``.
+
+    Only the header is read.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(HEADER.size)
+            if len(head) == HEADER.size:
+                head += f.read(SECTION.size * HEADER.unpack(head)[2])
+            size = f.seek(0, 2)
+    except OSError as e:
+        raise SnapshotError(f"Cannot read {path}: {e}") from e
+    sections = read_sections(head, size)
+    records = sum(sections[t][1] // _record_struct(t).size for t in RECORD_TABLES)
+    return records, {name: {"offset": offset, "bytes": length}
+                     for name, (offset, length) in sections.items()}
+
+
+def _record_struct(table: str) -> struct.Struct:
+    return DATATYPE_RECORD if table == "datatypes" else SLICE_RECORD
+
+
+class _NameSet:
+    """``name in snapshot.entities`` style membership over a record table."""
+
+    def __init__(self, snapshot: "SchemaSnapshot", table: str):
+        self._snapshot = snapshot
+        self._table = table
+
+    def __contains__(self, name: str) -> bool:
+        return self._snapshot._find(self._table, name.upper()) is not None
+
+    def __len__(self) -> int:
+        return self._snapshot._count(self._table)
+
+
+class SchemaSnapshot:
+    """mmap-backed reader with the lookup interface of ``audit.SchemaIndex``."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Cannot map {self.path}: {e}") from e
+        self._sections = read_sections(self._mm)
+        meta_offset, meta_length = self._sections["meta"]
+        self.meta = json.loads(self._mm[meta_offset:meta_offset + meta_length])
+        self.version = self.meta["version"]
+        self.categories = self.meta["categories"]
+        self._row_bytes = self.meta["rowBytes"]
+        self.entities = _NameSet(self, "entities")
+        self.property_sets = _NameSet(self, "psets")
+
+    def close(self):
+        self._mm.close()
+
+    # -- primitives -----------------------------------------------------------
+
+    def _count(self, table: str) -> int:
+        return self._sections[table][1] // _record_struct(table).size
+
+    def _u32(self, section: str, index: int) -> int:
+        return U32.unpack_from(self._mm, self._sections[section][0] + 4 * index)[0]
+
+    def _string_bytes(self, string_id: int) -> bytes:
+        base = self._sections["strings"][0]
+        return self._mm[base + self._u32("string_offsets", string_id):
+                        base + self._u32("string_offsets", string_id + 1)]
+
+    def _string(self, string_id: int) -> str:
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def _record(self, table: str, index: int) -> tuple[int, ...]:
+        fmt = _record_struct(table)
+        return fmt.unpack_from(self._mm, self._sections[table][0] + index * fmt.size)
+
+    def _find(self, table: str, name: str, lo: int = 0, hi: int | None = None) -> int | None:
+        """Binary search ``table`` (or records ``lo:hi``) for ``name``."""
+        key = name.encode("utf-8")
+        hi = self._count(table) if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._string_bytes(self._record(table, mid)[0])
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+    def _strings_of(self, section: str, first: int, count: int) -> set[str]:
+        return {self._string(self._u32(section, first + i)) for i in range(count)}
+
+    # -- SchemaIndex interface --------------------------------------------------
+
+    def is_valid_data_type(self, data_type: str) -> bool:
+        return self._find("datatypes", data_type.upper()) is not None
+
+    def data_type_category(self, data_type: str) -> str:
+        i = self._find("datatypes", data_type.upper())
+        return "unknown" if i is None else self.categories[self._record("datatypes", i)[1]]
+
+    def are_data_types_compatible(self, a: str, b: str) -> bool:
+        i = self._find("datatypes", a.upper())
+        j = self._find("datatypes", b.upper())
+        if i is None or j is None:
+            return True
+        byte = self._sections["compatible"][0] + i * self._row_bytes + (j >> 3)
+        return bool(self._mm[byte] & (1 << (j & 7)))
+
+    def _predefined(self, name: str) -> set[str] | None:
+        i = self._find("entities", name)
+        if i is None:
+            return None
+        _, first, count = self._record("entities", i)
+        return self._strings_of("predefined", first, count) if count else None
+
+    def predefined_types_for(self, entity: str) -> set[str]:
+        name = entity.upper()
+        found = self._predefined(name)
+        if found is not None:
+            return found
+        if not name.endswith("TYPE"):
+            return self._predefined(name + "TYPE") or set()
+        return set()
+
+    def _prop_types(self, pset_index: int, prop: str) -> set[str] | None:
+        _, first, count = self._record("psets", pset_index)
+        i = self._find("props", prop.upper(), first, first + count)
+        if i is None:
+            return None
+        _, type_first, type_count = self._record("props", i)
+        return self._strings_of("prop_types", type_first, type_count) or None
+
+    def expected_data_types(self, pset: str, prop: str) -> set[str] | None:
+        pset_index = self._find("psets", pset.upper())
+        if pset_index is None:
+            return None
+        direct = self._prop_types(pset_index, prop)
+        if direct:
+            return direct
+        normalized = normalize_property_name(prop)
+        if normalized != prop:
+            return self._prop_types(pset_index, normalized)
+        return None
+
+
+def open_snapshot(version: str, schema_dir: Path = GENERATED_DIR,
+                  expected_sources: dict[str, str] | None = None) -> SchemaSnapshot | None:
+    """Map ``version``'s snapshot, or None if it's missing or stale.
+
+    ``expected_sources`` (file name -> sha256, e.g. from the schema index)
+    is compared with the digests the snapshot was built from, so a snapshot
+    left behind by an older generation isn't used.
+    """
+    try:
+        snapshot = SchemaSnapshot(snapshot_path(version, schema_dir))
+    except SnapshotError:
+        return None
+    if expected_sources:
+        built_from = snapshot.meta.get("sources", {})
+        if any(built_from.get(name) != digest for name, digest in expected_sources.items()):
+            snapshot.close()
+            return None
+    return snapshot
@@ -2,15 +2,39 @@
 """
 Download official buildingSMART Property Set Definition (PSD) files
 for all IFC versions to get ALL property sets (300+)
+
+The bundles are kept as zips: fetch-and-parse-psd.py --archives (and the
+generate-schema.py orchestrator) parse the members straight from them.
+Pass --extract to also unpack the XML members for inspection.
+
+All downloads and bSDD crawls run concurrently over one pooled
+requests.Session, at most MAX_PER_HOST requests per host at a time, so a
+refresh takes about as long as the largest archive.
+
+bSDD dictionaries are crawled with ifc_schema/bsdd.py (paged, cached and
+revalidated) and kept in downloaded/bsdd/; the IFC dictionary's property
+sets are also normalized into the PSD parser's format. Pass
+--bsdd-dictionary URI for more dictionaries (e.g. classifications) and
+--bsdd-api URL to crawl a stand-in such as scripts/bench/local_bsdd.py.
 """
 
+import argparse
 import os
 import requests
+import threading
 import zipfile
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from urllib.parse import urljoin
-import time
+from urllib.parse import urlparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from ifc_schema import metrics  # noqa: E402
+from ifc_schema.bsdd import BSDD_API, BsddClient, BsddError, normalize_property_sets  # noqa: E402
+from ifc_schema.output import write_json  # noqa: E402
 
 # buildingSMART official PSD download URLs
 PSD_URLS = {
@@ -19,109 +43,249 @@ PSD_URLS = {
     'IFC4X3_ADD2': 'https://standards.buildingsmart.org/IFC/RELEASE/IFC4x3_ADD2/IFC4X3_ADD2_PropertySets.zip'
 }
 
-# Alternative bSDD API endpoints for property sets
-BSDD_URLS = {
-    'IFC2X3': 'https://identifier.buildingsmart.org/uri/ifc/ifc2x3/property-sets',
-    'IFC4': 'https://identifier.buildingsmart.org/uri/ifc/ifc4/property-sets', 
-    'IFC4X3_ADD2': 'https://identifier.buildingsmart.org/uri/ifc/ifc4x3_add2/property-sets'
+# Archives are streamed to disk in chunks of this size
+CHUNK_SIZE = 1024 * 1024
+
+# Concurrent requests per host (the archives and bSDD are on different hosts)
+MAX_PER_HOST = 3
+
+# bSDD dictionaries with the IFC property sets (bSDD only publishes IFC 4.3)
+BSDD_DICTIONARIES = {
+    'IFC4X3_ADD2': 'https://identifier.buildingsmart.org/uri/buildingsmart/ifc/4.3'
 }
 
-def download_psd_zip(version, url, output_dir):
-    """Download and extract PSD ZIP file"""
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+
+def make_session():
+    """A requests.Session whose connection pools fit MAX_PER_HOST."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_PER_HOST)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@contextmanager
+def host_slot(url):
+    """Hold one of the MAX_PER_HOST request slots of ``url``'s host."""
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.setdefault(host, threading.BoundedSemaphore(MAX_PER_HOST))
+    with slot:
+        yield
+
+
+def _stream_to(response, path, mode):
+    """Write a streamed response to ``path`` one chunk at a time."""
+    written = 0
+    with open(path, mode) as f:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
+            written += len(chunk)
+    metrics.incr("http.bytes", written)
+    return written
+
+
+def _validator(response):
+    """The ETag of ``response``, or its Last-Modified date; None without either."""
+    return response.headers.get("ETag") or response.headers.get("Last-Modified")
+
+
+def is_complete_zip(path):
+    """Whether ``path`` is a zip archive whose members all pass their CRC check."""
+    try:
+        with zipfile.ZipFile(path) as zip_ref:
+            return zip_ref.testzip() is None
+    except (zipfile.BadZipFile, OSError):
+        return False
+
+
+def download_archive(session, url, zip_path):
+    """Stream ``url`` to ``zip_path``, resuming an interrupted download.
+
+    Data goes to ``<name>.part`` first and is renamed when complete. The
+    response's ETag (or Last-Modified date) is kept in ``<name>.part.validator``
+    so that a ``.part`` file left from an earlier run can be resumed: only the
+    missing tail is requested, with a Range header and that validator as
+    If-Range. If the archive changed on the server in the meantime (or the
+    server ignores ranges) the whole file comes back and is written from the
+    start; without a validator the download starts over.
+
+    The result must be a zip archive that passes ``testzip()`` before it
+    replaces ``zip_path``. A resumed download that doesn't is fetched once
+    more from scratch.
+    """
+    part_path = zip_path.with_name(zip_path.name + ".part")
+    validator_path = zip_path.with_name(zip_path.name + ".part.validator")
+    validator = validator_path.read_text().strip() if validator_path.exists() else ""
+    offset = part_path.stat().st_size if part_path.exists() and validator else 0
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+
+    with metrics.stage("download"), host_slot(url):
+        with session.get(url, headers=headers, stream=True, timeout=30) as response:
+            metrics.incr("http.requests")
+            if offset and response.status_code == 416:
+                # Range not satisfiable: the partial file is complete, unless
+                # it doesn't match the size the server reports
+                if response.headers.get("Content-Range", "").rpartition("/")[2] != str(offset):
+                    part_path.unlink()
+                    return download_archive(session, url, zip_path)
+                metrics.incr("http.resumed")
+            else:
+                response.raise_for_status()
+                resumed = offset and response.status_code == 206
+                if resumed:
+                    metrics.incr("http.resumed")
+                else:
+                    offset = 0
+                    validator = _validator(response)
+                    if validator:
+                        validator_path.write_text(validator)
+                    else:
+                        validator_path.unlink(missing_ok=True)
+                offset += _stream_to(response, part_path, "ab" if resumed else "wb")
+
+    if not is_complete_zip(part_path):
+        part_path.unlink()
+        validator_path.unlink(missing_ok=True)
+        if headers:
+            return download_archive(session, url, zip_path)
+        raise zipfile.BadZipFile(f"{url} did not download as a valid zip archive")
+    os.replace(part_path, zip_path)
+    validator_path.unlink(missing_ok=True)
+    return offset
+
+
+def extract_xml_members(zip_path, extract_dir):
+    """Extract only the ``.xml`` members of ``zip_path`` into ``extract_dir``."""
+    extract_dir.mkdir(exist_ok=True)
+    root = extract_dir.resolve()
+    extracted = []
+    with metrics.stage("extract"), zipfile.ZipFile(zip_path) as zip_ref:
+        for member in zip_ref.infolist():
+            if member.is_dir() or not member.filename.lower().endswith(".xml"):
+                continue
+            target = (extract_dir / member.filename).resolve()
+            if not target.is_relative_to(root):
+                print(f"⚠️  Skipping {member.filename}: outside the extract directory")
+                continue
+            extracted.append(Path(zip_ref.extract(member, extract_dir)))
+    metrics.incr("zip.extracted", len(extracted))
+    return extracted
+
+
+def list_xml_members(zip_path):
+    """Names of the ``.xml`` members of ``zip_path``."""
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        return sorted(n for n in zip_ref.namelist() if n.lower().endswith(".xml"))
+
+
+def download_psd_zip(session, version, url, output_dir, extract=False):
+    """Download the PSD ZIP file, optionally extracting its XML members"""
     print(f"📥 Downloading PSD for {version} from {url}")
     
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
         zip_path = output_dir / f"{version}_PropertySets.zip"
-        with open(zip_path, 'wb') as f:
-            f.write(response.content)
-        
-        print(f"✅ Downloaded {len(response.content)} bytes to {zip_path}")
-        
-        # Extract ZIP
-        extract_dir = output_dir / f"{version}_extracted"
-        extract_dir.mkdir(exist_ok=True)
+        size = download_archive(session, url, zip_path)
+        print(f"✅ Downloaded {size} bytes to {zip_path}")
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        
-        print(f"✅ Extracted to {extract_dir}")
-        return extract_dir
+        extract_dir = None
+        if extract:
+            # Extract the XML members only
+            extract_dir = output_dir / f"{version}_extracted"
+            extracted = extract_xml_members(zip_path, extract_dir)
+            print(f"✅ Extracted {len(extracted)} XML files to {extract_dir}")
+        return zip_path, extract_dir
         
     except Exception as e:
+        metrics.incr("http.failures")
         print(f"❌ Failed to download PSD for {version}: {e}")
-        return None
+        return None, None
+
+def bsdd_dictionary_path(output_dir, dictionary_uri):
+    """downloaded/bsdd/<owner>-<dictionary>-<version>.json"""
+    path = dictionary_uri.split("/uri/", 1)[-1]
+    return output_dir / "bsdd" / f"{re.sub(r'[^A-Za-z0-9.]+', '-', path).strip('-')}.json"
 
-def crawl_bsdd_api(version, url):
-    """Crawl bSDD API for property sets"""
-    print(f"🔍 Crawling bSDD API for {version}: {url}")
-    
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        property_sets = data.get('propertySets', [])
-        
-        print(f"✅ Found {len(property_sets)} property sets from bSDD")
-        return property_sets
-        
-    except Exception as e:
-        print(f"❌ Failed to crawl bSDD for {version}: {e}")
-        return []
 
-def find_xml_files(extract_dir):
-    """Find all XML files in extracted directory"""
-    xml_files = []
+def crawl_bsdd_dictionary(client, dictionary_uri, output_dir):
+    """Crawl a bSDD dictionary and keep its classes locally"""
+    print(f"🔍 Crawling bSDD dictionary {dictionary_uri}")
     
-    if extract_dir and extract_dir.exists():
-        for xml_file in extract_dir.rglob("*.xml"):
-            xml_files.append(xml_file)
+    try:
+        classes = client.crawl_dictionary(dictionary_uri)
+    except BsddError as e:
+        print(f"❌ Failed to crawl bSDD dictionary {dictionary_uri}: {e}")
+        return None
     
-    print(f"📄 Found {len(xml_files)} XML files")
-    return xml_files
+    path = bsdd_dictionary_path(output_dir, dictionary_uri)
+    write_json(path, {"uri": dictionary_uri, "classes": classes}, publish=False)
+    print(f"✅ Found {len(classes)} classes in {dictionary_uri}, saved to {path}")
+    return classes
+
+def crawl_bsdd_api(client, version, dictionary_uri, output_dir):
+    """Crawl bSDD for the property sets of an IFC version"""
+    classes = crawl_bsdd_dictionary(client, dictionary_uri, output_dir)
+    property_sets = normalize_property_sets(classes or [], version)
+    print(f"✅ Found {len(property_sets)} property sets from bSDD for {version}")
+    return property_sets
 
 def main():
     """Main download function"""
+    parser = argparse.ArgumentParser(description="Download the official PSD bundles")
+    parser.add_argument("--extract", action="store_true",
+                        help="also unpack the XML members next to each zip")
+    parser.add_argument("--bsdd-dictionary", action="append", default=[], metavar="URI",
+                        help="also crawl this bSDD dictionary (repeatable)")
+    parser.add_argument("--bsdd-api", default=BSDD_API, metavar="URL",
+                        help=f"bSDD API to crawl (default: {BSDD_API})")
+    args = parser.parse_args()
+
     print("🚀 Starting PSD Download for ALL IFC Versions")
     
     # Create output directory
     output_dir = Path(__file__).parent / "downloaded"
     output_dir.mkdir(exist_ok=True)
     
+    versions = ['IFC2X3', 'IFC4', 'IFC4X3_ADD2']
     results = {}
-    
-    for version in ['IFC2X3', 'IFC4', 'IFC4X3_ADD2']:
-        print(f"\n📋 Processing {version}...")
-        
-        # Try official PSD download first
-        psd_url = PSD_URLS.get(version)
-        if psd_url:
-            extract_dir = download_psd_zip(version, psd_url, output_dir)
-            xml_files = find_xml_files(extract_dir)
-            results[version] = {
-                'source': 'official_psd',
-                'xml_files': [str(f) for f in xml_files],
-                'extract_dir': str(extract_dir) if extract_dir else None
-            }
-        else:
-            print(f"⚠️  No official PSD URL for {version}")
-            results[version] = {
-                'source': 'none',
-                'xml_files': [],
-                'extract_dir': None
-            }
-        
-        # Also try bSDD API as backup
-        bsdd_url = BSDD_URLS.get(version)
-        if bsdd_url:
-            bsdd_property_sets = crawl_bsdd_api(version, bsdd_url)
-            results[version]['bsdd_property_sets'] = bsdd_property_sets
-        
-        # Rate limiting
-        time.sleep(1)
+    workers = 2 * len(versions) + len(args.bsdd_dictionary)
+    with make_session() as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        # The bSDD client keeps to MAX_PER_HOST requests itself
+        client = BsddClient(session, args.bsdd_api, max_concurrency=MAX_PER_HOST)
+        # Official PSD downloads, with the bSDD API as backup, all at once
+        downloads = {v: executor.submit(download_psd_zip, session, v, PSD_URLS[v], output_dir,
+                                        args.extract)
+                     for v in versions if v in PSD_URLS}
+        crawls = {v: executor.submit(crawl_bsdd_api, client, v, BSDD_DICTIONARIES[v], output_dir)
+                  for v in versions if v in BSDD_DICTIONARIES}
+        dictionaries = [executor.submit(crawl_bsdd_dictionary, client, uri, output_dir)
+                        for uri in args.bsdd_dictionary]
+
+        for version in versions:
+            if version in downloads:
+                zip_path, extract_dir = downloads[version].result()
+                xml_files = list_xml_members(zip_path) if zip_path else []
+                results[version] = {
+                    'source': 'official_psd',
+                    'archive': str(zip_path) if zip_path else None,
+                    'xml_files': xml_files,
+                    'extract_dir': str(extract_dir) if extract_dir else None
+                }
+            else:
+                print(f"⚠️  No official PSD URL for {version}")
+                results[version] = {
+                    'source': 'none',
+                    'archive': None,
+                    'xml_files': [],
+                    'extract_dir': None
+                }
+            if version in crawls:
+                results[version]['bsdd_property_sets'] = crawls[version].result()
+        for future in dictionaries:
+            future.result()
     
     # Save results
     results_file = output_dir / "download_results.json"
@@ -135,6 +299,7 @@ def main():
         print(f"  {version}: {xml_count} XML files, {bsdd_count} bSDD property sets")
     
     print(f"\n✅ Download complete! Results saved to {results_file}")
+    metrics.write_report("download-psd")
     return results
 
 if __name__ == "__main__":
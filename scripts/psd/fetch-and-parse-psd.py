@@ -6,22 +6,48 @@ from the IFC4.3.x-development GitHub repository.
 This replaces the incomplete bSDD fetch with direct access to the authoritative
 PSD source: 612+ property set definitions for IFC4X3.
 
-Output: property-sets-{version}.json files in lib/generated/ifc-schema/
+Output: property-sets-{version}.json files in lib/generated/ifc-schema/, plus
+the enumerations-{version}.json index of their enumerated properties, the
+applicability-{version}.json (entity, predefined type) index and the
+psd-locale-{locale}.json definition packs.
+
+With --archives, the official per-version bundles fetched by download-psd.py
+are parsed instead (straight from the zips), so each version gets exactly its
+own property sets rather than ones derived from IFC4X3 by name prefix. With
+--tarball, the development tree is fetched as a single tar.gz and parsed as
+it streams in, instead of one request per file.
 """
 
+import argparse
 import json
 import sys
+import tarfile
 import time
 import xml.etree.ElementTree as ET
+import zipfile
+from http.client import HTTPException
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from ifc_schema import IFC_VERSIONS, metrics  # noqa: E402
+from ifc_schema.applicability import parse_applicability, write_applicability_indexes  # noqa: E402
+from ifc_schema.canonical import canonical_property_sets  # noqa: E402
+from ifc_schema.enumerations import write_enumeration_indexes  # noqa: E402
+from ifc_schema.locales import localized_texts, split_localizations, write_locale_packs  # noqa: E402
+from ifc_schema.output import write_json  # noqa: E402
+
 # Configuration
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/buildingSMART/IFC4.3.x-development/master/reference_schemas/psd"
 GITHUB_API_URL = "https://api.github.com/repos/buildingSMART/IFC4.3.x-development/contents/reference_schemas/psd"
+# GitHub only archives whole trees; the PSD files are the entries under TARBALL_PSD_DIR
+GITHUB_TARBALL_URL = "https://codeload.github.com/buildingSMART/IFC4.3.x-development/tar.gz/refs/heads/master"
+TARBALL_PSD_DIR = "reference_schemas/psd/"
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "lib" / "generated" / "ifc-schema"
+# Official per-version bundles fetched by download-psd.py
+DOWNLOAD_DIR = Path(__file__).parent / "downloaded"
 
 # Fallback list of valid IFC simple types, used only if the generated schema
 # allowlist can't be read. The authoritative source is the generated
@@ -76,6 +102,7 @@ def _load_authoritative_simple_types() -> set:
                     if entry.get("name"):
                         names.add(entry["name"].upper())
         except (OSError, ValueError):
+            metrics.incr("normalize.simple_types_unreadable")
             continue
     return names
 
@@ -139,10 +166,12 @@ def normalize_type(ifc_type: str) -> str:
 
     # Already valid
     if upper in VALID_SIMPLE_TYPES:
+        metrics.incr("normalize.valid")
         return upper
 
     # Check normalization map
     if upper in TYPE_NORMALIZATION:
+        metrics.incr("normalize.mapped")
         return TYPE_NORMALIZATION[upper]
 
     # Try removing 'Ifc' prefix and re-adding as uppercase
@@ -151,37 +180,49 @@ def normalize_type(ifc_type: str) -> str:
 
     # Default: if it looks like a measure, map to IFCREAL
     if "MEASURE" in upper:
+        metrics.incr("normalize.fallback_real")
         return "IFCREAL"
 
     # Default fallback
+    metrics.incr("normalize.fallback_label")
     return "IFCLABEL"
 
 
-def fetch_file_list() -> list[str]:
-    """Fetch list of PSD XML files from GitHub API, with local cache fallback."""
-    cache_file = Path(__file__).parent / "psd_file_list.json"
+PSD_FILE_LIST_CACHE = Path(__file__).parent / "psd_file_list.json"
+
 
+def fetch_file_list(cache_file: Path | None = PSD_FILE_LIST_CACHE) -> list[str]:
+    """Fetch list of PSD XML files from GitHub API, with local cache fallback.
+
+    Pass ``cache_file=None`` to always ask the API (and not write a cache).
+    """
     # Try cached file list first
-    if cache_file.exists():
+    if cache_file is not None and cache_file.exists():
         with open(cache_file) as f:
             cached = json.load(f)
         if cached:
+            metrics.cache("psd_file_list", hit=True)
             print(f"  Using cached file list: {len(cached)} PSD files")
             return cached
+    metrics.cache("psd_file_list", hit=False)
 
     print("Fetching PSD file list from GitHub API...")
     try:
         req = Request(GITHUB_API_URL)
         req.add_header("User-Agent", "ids-flow-schema-generator")
         with urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read())
+            body = resp.read()
+        metrics.incr("http.requests")
+        metrics.incr("http.bytes", len(body))
+        data = json.loads(body)
 
-        xml_files = [item["name"] for item in data if item["name"].endswith(".xml")]
+        xml_files = sorted(item["name"] for item in data if item["name"].endswith(".xml"))
         print(f"  Found {len(xml_files)} PSD XML files")
 
         # Cache for future runs
-        with open(cache_file, "w") as f:
-            json.dump(xml_files, f)
+        if cache_file is not None:
+            with open(cache_file, "w") as f:
+                json.dump(xml_files, f)
 
         return xml_files
     except Exception as e:
@@ -189,17 +230,57 @@ def fetch_file_list() -> list[str]:
         return []
 
 
+# Rate limiting, server errors and timeouts are transient: they're retried
+# with a short backoff before a file counts as failed. Anything else (a
+# missing file, an unresolvable host, a refused connection) won't get better
+# by retrying, so it aborts the whole fetch.
+FETCH_RETRIES = 2
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchAborted(Exception):
+    """A PSD download failed in a way that retrying won't fix."""
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether a failed request is worth retrying."""
+    if isinstance(error, HTTPError):
+        return error.code in RETRYABLE_STATUS
+    if isinstance(error, URLError):
+        return isinstance(error.reason, TimeoutError)
+    return isinstance(error, TimeoutError)
+
+
 def fetch_psd_xml(filename: str) -> str | None:
-    """Fetch a single PSD XML file from GitHub raw content."""
+    """Fetch a single PSD XML file from GitHub raw content.
+
+    Returns None when the file still fails after the retries; raises
+    ``FetchAborted`` on a failure that isn't transient.
+    """
     url = f"{GITHUB_RAW_BASE}/{filename}"
-    try:
-        req = Request(url)
-        req.add_header("User-Agent", "ids-flow-schema-generator")
-        with urlopen(req, timeout=15) as resp:
-            return resp.read().decode("utf-8")
-    except Exception as e:
-        print(f"  Warning: Failed to fetch {filename}: {e}")
-        return None
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            req = Request(url)
+            req.add_header("User-Agent", "ids-flow-schema-generator")
+            with urlopen(req, timeout=15) as resp:
+                body = resp.read()
+            metrics.incr("http.requests")
+            metrics.incr("http.bytes", len(body))
+            return body.decode("utf-8")
+        except (OSError, HTTPException) as e:
+            metrics.incr("http.failures")
+            if not is_transient(e):
+                raise FetchAborted(f"{filename}: {e}") from e
+            if attempt < FETCH_RETRIES:
+                metrics.incr("http.retries")
+                time.sleep(0.5 * (attempt + 1))
+                continue
+            print(f"  Warning: Failed to fetch {filename}: {e}")
+            return None
+        except UnicodeDecodeError as e:
+            metrics.incr("http.failures")
+            print(f"  Warning: Failed to fetch {filename}: {e}")
+            return None
 
 
 QTO_TYPE_MAP = {
@@ -212,7 +293,13 @@ QTO_TYPE_MAP = {
 }
 
 
-def parse_qto_xml(xml_content: str, filename: str) -> dict | None:
+def _add_property_texts(localizations: dict, prop_name: str, texts: dict):
+    for locale, prop_texts in texts.items():
+        props = localizations.setdefault(locale, {}).setdefault("properties", {})
+        props.setdefault(prop_name, prop_texts)
+
+
+def parse_qto_xml(xml_content: str | bytes, filename: str) -> dict | None:
     """Parse a Qto (Quantity Set) XML file into our property set format."""
     try:
         root = ET.fromstring(xml_content)
@@ -232,31 +319,30 @@ def parse_qto_xml(xml_content: str, filename: str) -> dict | None:
     qto_name = name_elem.text.strip()
 
     # Extract applicable entities
-    applicable_entities = []
+    class_names = []
     for ns in ["", "{http://www.buildingsmart-tech.org/xml/qto/QTO_IFC4.xsd}"]:
         for class_elem in root.findall(f".//{ns}ApplicableClasses/{ns}ClassName"):
             if class_elem.text:
-                entity = class_elem.text.strip().upper()
-                if "/" in entity:
-                    entity = entity.split("/")[0]
-                applicable_entities.append(entity)
-    if not applicable_entities:
+                class_names.append(class_elem.text.strip().upper())
+    if not class_names:
         for ns in ["", "{http://www.buildingsmart-tech.org/xml/qto/QTO_IFC4.xsd}"]:
             type_val = root.find(f"{ns}ApplicableTypeValue")
             if type_val is not None and type_val.text:
-                entity = type_val.text.strip().upper()
-                if "/" in entity:
-                    entity = entity.split("/")[0]
-                applicable_entities.append(entity)
+                class_names.append(type_val.text.strip().upper())
+    applicable_entities, predefined_types = parse_applicability(class_names)
 
     # Extract quantities as properties
     properties = []
+    localizations = {}
     for ns in ["", "{http://www.buildingsmart-tech.org/xml/qto/QTO_IFC4.xsd}"]:
+        for locale, texts in localized_texts(root, ns).items():
+            localizations.setdefault(locale, {}).update(texts)
         for qto_def in root.findall(f".//{ns}QtoDefs/{ns}QtoDef"):
             name_el = qto_def.find(f"{ns}Name")
             if name_el is None or not name_el.text:
                 continue
             prop_name = name_el.text.strip()
+            _add_property_texts(localizations, prop_name, localized_texts(qto_def, ns))
 
             qto_type_el = qto_def.find(f"{ns}QtoType")
             qto_type = qto_type_el.text.strip() if qto_type_el is not None and qto_type_el.text else "Q_LENGTH"
@@ -270,13 +356,111 @@ def parse_qto_xml(xml_content: str, filename: str) -> dict | None:
     return {
         "name": qto_name,
         "applicableEntities": applicable_entities,
+        **({"applicablePredefinedTypes": predefined_types} if predefined_types else {}),
         "properties": properties,
         "ifcVersion": ["IFC4X3_ADD2"],
-        "templateType": "QTO_TYPEDRIVENOVERRIDE"
+        "templateType": "QTO_TYPEDRIVENOVERRIDE",
+        "localizations": localizations,
     }
 
 
-def parse_psd_xml(xml_content: str, filename: str) -> dict | None:
+def _data_type(parent: ET.Element | None) -> str | None:
+    """Normalized ``DataType/@type`` directly under ``parent``."""
+    elem = parent.find("DataType") if parent is not None else None
+    raw_type = elem.get("type", "") if elem is not None else ""
+    return normalize_type(raw_type) if raw_type else None
+
+
+def _unit(type_elem: ET.Element) -> str | None:
+    """``IfcUnitEnum.LENGTHUNIT`` -> ``LENGTHUNIT``."""
+    unit = type_elem.find("UnitType")
+    raw = (unit.get("type") or unit.text or "").strip() if unit is not None else ""
+    return raw.rsplit(".", 1)[-1] or None
+
+
+def _bound_value(raw: str) -> int | float | str:
+    for parse in (int, float):
+        try:
+            return parse(raw)
+        except ValueError:
+            pass
+    return raw
+
+
+def _bounds(type_elem: ET.Element) -> dict:
+    bounds = {}
+    for key, tag in (("lower", "LowerBoundValue"), ("upper", "UpperBoundValue")):
+        elem = type_elem.find(f"ValueRangeDef/{tag}")
+        raw = (elem.get("value") or elem.text or "").strip() if elem is not None else ""
+        if raw:
+            bounds[key] = _bound_value(raw)
+    return bounds
+
+
+def parse_property_type(prop_def: ET.Element) -> dict:
+    """``dataType`` plus the value metadata of a PropertyDef.
+
+    ``dataType`` follows the long-standing rules (enumerated and reference
+    values are IFCLABEL, lists use the item type, tables the defining type),
+    so existing consumers see the same types. What used to be dropped is kept
+    alongside it, only when present:
+
+    - ``valueKind``: ``enumerated``, ``bounded``, ``reference``, ``list`` or
+      ``table`` (absent for single values)
+    - ``enumeration`` / ``enumerationName``: the EnumList items and its name
+    - ``bounds``: ``{"lower": ..., "upper": ...}`` from ValueRangeDef
+    - ``unit``: the IfcUnitEnum member, e.g. ``THERMODYNAMICTEMPERATUREUNIT``
+    - ``referenceType``: the entity a reference value points at
+    - ``definedDataType`` / ``expression``: a table's defined values
+    """
+    data_type = "IFCLABEL"  # default
+    meta: dict = {}
+
+    # Later kinds win, as they always have; a PropertyType holds only one.
+    single_val = prop_def.find(".//TypePropertySingleValue")
+    if single_val is not None:
+        data_type = _data_type(single_val) or data_type
+        meta = {"unit": _unit(single_val)}
+
+    bounded_val = prop_def.find(".//TypePropertyBoundedValue")
+    if bounded_val is not None:
+        data_type = _data_type(bounded_val) or data_type
+        meta = {"valueKind": "bounded", "bounds": _bounds(bounded_val), "unit": _unit(bounded_val)}
+
+    enum_val = prop_def.find(".//TypePropertyEnumeratedValue")
+    if enum_val is not None:
+        data_type = "IFCLABEL"
+        enum_list = enum_val.find("EnumList")
+        items = [] if enum_list is None else [
+            item.text.strip() for item in enum_list.findall("EnumItem") if item.text and item.text.strip()
+        ]
+        meta = {"valueKind": "enumerated",
+                "enumeration": list(dict.fromkeys(items)),
+                "enumerationName": enum_list.get("name") if enum_list is not None else None}
+
+    ref_val = prop_def.find(".//TypePropertyReferenceValue")
+    if ref_val is not None:
+        data_type = "IFCLABEL"
+        meta = {"valueKind": "reference", "referenceType": ref_val.get("reftype")}
+
+    list_val = prop_def.find(".//TypePropertyListValue")
+    if list_val is not None:
+        data_type = _data_type(list_val.find("ListValue")) or data_type
+        meta = {"valueKind": "list", "unit": _unit(list_val)}
+
+    table_val = prop_def.find(".//TypePropertyTableValue")
+    if table_val is not None:
+        data_type = _data_type(table_val.find("DefiningValue")) or data_type
+        expression = table_val.find("Expression")
+        meta = {"valueKind": "table",
+                "definedDataType": _data_type(table_val.find("DefinedValue")),
+                "expression": (expression.text or "").strip() if expression is not None else None}
+
+    metrics.incr(f"properties.{meta.get('valueKind', 'single')}")
+    return {"dataType": data_type, **{k: v for k, v in meta.items() if v}}
+
+
+def parse_psd_xml(xml_content: str | bytes, filename: str) -> dict | None:
     """Parse a PSD XML file into our property set format."""
     try:
         root = ET.fromstring(xml_content)
@@ -290,84 +474,28 @@ def parse_psd_xml(xml_content: str, filename: str) -> dict | None:
         return None
     pset_name = name_elem.text.strip()
 
-    # Extract applicable entities
-    applicable_entities = []
-    for class_elem in root.findall(".//ApplicableClasses/ClassName"):
-        if class_elem.text:
-            entity = class_elem.text.strip()
-            # Normalize: "IfcWall" -> "IFCWALL"
-            if entity.startswith("Ifc"):
-                entity = entity.upper()
-            # Handle "IfcWall/STANDARD" format
-            if "/" in entity:
-                entity = entity.split("/")[0]
-            applicable_entities.append(entity)
+    # Extract applicable entities ("IfcWall" or "IfcWall/STANDARD")
+    class_names = [c.text.strip() for c in root.findall(".//ApplicableClasses/ClassName") if c.text]
 
     # Also check ApplicableTypeValue
-    if not applicable_entities:
+    if not class_names:
         type_val = root.find("ApplicableTypeValue")
         if type_val is not None and type_val.text:
-            entity = type_val.text.strip()
-            if entity.startswith("Ifc"):
-                entity = entity.upper()
-            if "/" in entity:
-                entity = entity.split("/")[0]
-            applicable_entities.append(entity)
-
-    # Extract properties
+            class_names.append(type_val.text.strip())
+    applicable_entities, predefined_types = parse_applicability(class_names)
+
+    # Extract properties; definitions and translations go to the locale packs
     properties = []
+    localizations = localized_texts(root)
     for prop_def in root.findall(".//PropertyDefs/PropertyDef"):
         prop_name_elem = prop_def.find("Name")
         if prop_name_elem is None or not prop_name_elem.text:
             continue
 
         prop_name = prop_name_elem.text.strip()
+        _add_property_texts(localizations, prop_name, localized_texts(prop_def))
 
-        # Extract data type
-        data_type = "IFCLABEL"  # default
-
-        # TypePropertySingleValue
-        single_val = prop_def.find(".//TypePropertySingleValue/DataType")
-        if single_val is not None:
-            raw_type = single_val.get("type", "")
-            if raw_type:
-                data_type = normalize_type(raw_type)
-
-        # TypePropertyBoundedValue
-        bounded_val = prop_def.find(".//TypePropertyBoundedValue/DataType")
-        if bounded_val is not None:
-            raw_type = bounded_val.get("type", "")
-            if raw_type:
-                data_type = normalize_type(raw_type)
-
-        # TypePropertyEnumeratedValue -> IFCLABEL
-        enum_val = prop_def.find(".//TypePropertyEnumeratedValue")
-        if enum_val is not None:
-            data_type = "IFCLABEL"
-
-        # TypePropertyReferenceValue -> IFCLABEL
-        ref_val = prop_def.find(".//TypePropertyReferenceValue")
-        if ref_val is not None:
-            data_type = "IFCLABEL"
-
-        # TypePropertyListValue
-        list_val = prop_def.find(".//TypePropertyListValue/ListValue/DataType")
-        if list_val is not None:
-            raw_type = list_val.get("type", "")
-            if raw_type:
-                data_type = normalize_type(raw_type)
-
-        # TypePropertyTableValue (use defining value type)
-        table_val = prop_def.find(".//TypePropertyTableValue/DefiningValue/DataType")
-        if table_val is not None:
-            raw_type = table_val.get("type", "")
-            if raw_type:
-                data_type = normalize_type(raw_type)
-
-        properties.append({
-            "name": prop_name,
-            "dataType": data_type
-        })
+        properties.append({"name": prop_name, **parse_property_type(prop_def)})
 
     if not properties:
         return None
@@ -378,27 +506,38 @@ def parse_psd_xml(xml_content: str, filename: str) -> dict | None:
     return {
         "name": pset_name,
         "applicableEntities": applicable_entities,
+        **({"applicablePredefinedTypes": predefined_types} if predefined_types else {}),
         "properties": properties,
         "ifcVersion": ["IFC4X3_ADD2"],  # These PSD files are for IFC4X3
-        "templateType": template_type.upper() if template_type else "PSET_TYPEDRIVENOVERRIDE"
+        "templateType": template_type.upper() if template_type else "PSET_TYPEDRIVENOVERRIDE",
+        "localizations": localizations,
     }
 
 
-def main():
-    print("=" * 60)
-    print("IFC Property Set Generator - Full PSD Coverage")
-    print("=" * 60)
+# Psets whose names start with these only exist in IFC4X3 (infrastructure, etc.)
+IFC4X3_ONLY_PREFIXES = [
+    "Pset_Bridge", "Pset_Road", "Pset_Railway", "Pset_Marine",
+    "Pset_Facility", "Pset_Alignment", "Pset_Course", "Pset_Earth",
+    "Pset_Pavement", "Pset_Kerb", "Pset_Sign", "Pset_Signal",
+]
+
+# IFC2X3 has fewer psets - exclude MEP-specific ones too
+IFC4_ONLY_PREFIXES = [
+    "Pset_Sensor", "Pset_Actuator", "Pset_Controller",
+    "Pset_Alarm", "Pset_Distribution", "Pset_ElectricAppliance",
+]
 
-    # Step 1: Get file list
-    xml_files = fetch_file_list()
-    if not xml_files:
-        print("ERROR: Could not fetch PSD file list. Aborting.")
-        sys.exit(1)
 
-    # Step 2: Download and parse all PSD files
-    print(f"\nDownloading and parsing {len(xml_files)} PSD files...")
-    property_sets = []
-    failed = []
+def download_and_parse(xml_files: list[str]) -> tuple[list[dict], list[str]]:
+    """Download and parse PSD files in rate-limited batches.
+
+    Returns the parsed property sets and the names of files that failed,
+    both in ``xml_files`` order regardless of which download finished first
+    (duplicate merging keeps the first occurrence, so order matters). A
+    ``FetchAborted`` from any file cancels the downloads not yet started
+    and is raised.
+    """
+    parsed = {}
 
     # Use thread pool for parallel downloads (rate-limited)
     batch_size = 20
@@ -409,30 +548,93 @@ def main():
 
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures = {executor.submit(fetch_psd_xml, f): f for f in batch}
-            for future in as_completed(futures):
-                filename = futures[future]
-                xml_content = future.result()
-                if xml_content:
-                    # Try parsing as Pset first, then as Qto
-                    pset = parse_psd_xml(xml_content, filename)
-                    if not pset:
-                        pset = parse_qto_xml(xml_content, filename)
-                    if pset:
-                        property_sets.append(pset)
-                    else:
-                        failed.append(filename)
-                else:
-                    failed.append(filename)
+            try:
+                for future in as_completed(futures):
+                    filename = futures[future]
+                    xml_content = future.result()
+                    parsed[filename] = parse_psd_file(xml_content, filename) if xml_content else None
+            except FetchAborted:
+                executor.shutdown(cancel_futures=True)
+                raise
 
         # Rate limiting between batches
         if batch_end < len(xml_files):
-            time.sleep(0.5)
+            with metrics.stage("rate_limit_sleep"):
+                time.sleep(0.5)
 
-    print(f"\n  Successfully parsed: {len(property_sets)} property sets")
-    if failed:
-        print(f"  Failed: {len(failed)} files")
+    property_sets = [parsed[f] for f in xml_files if parsed.get(f)]
+    failed = [f for f in xml_files if not parsed.get(f)]
+    return property_sets, failed
 
-    # Step 3: Deduplicate (some psets may appear in multiple files)
+
+class _CountingReader:
+    """File object wrapper that adds what's read to the http.bytes counter."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        metrics.incr("http.bytes", len(data))
+        return data
+
+
+def tarball_psd_name(member: tarfile.TarInfo) -> str | None:
+    """``Pset_WallCommon.xml`` for ``<repo>-<ref>/reference_schemas/psd/Pset_WallCommon.xml``."""
+    path = member.name.partition("/")[2]
+    name = path.removeprefix(TARBALL_PSD_DIR)
+    if not member.isfile() or name == path or "/" in name or not name.endswith(".xml"):
+        return None
+    return name
+
+
+def download_and_parse_tarball(url: str = GITHUB_TARBALL_URL,
+                               workers: int = 8) -> tuple[list[dict], list[str]]:
+    """Fetch the corpus as one tar.gz and parse PSD entries as they arrive.
+
+    The archive is decompressed as it streams in (``tarfile`` ``r|gz`` mode,
+    nothing is written to disk) and each ``reference_schemas/psd/*.xml``
+    entry is handed to a parser thread as soon as it has been read, so
+    parsing overlaps the transfer. One request replaces the contents API
+    call plus one raw GET per file. Returns the same as
+    ``download_and_parse()``, in file name order.
+    """
+    futures = {}
+    req = Request(url)
+    req.add_header("User-Agent", "ids-flow-schema-generator")
+    try:
+        with urlopen(req, timeout=60) as resp, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            metrics.incr("http.requests")
+            with tarfile.open(fileobj=_CountingReader(resp), mode="r|gz") as archive:
+                for member in archive:
+                    filename = tarball_psd_name(member)
+                    if filename:
+                        content = archive.extractfile(member).read()
+                        futures[filename] = executor.submit(parse_psd_file, content, filename)
+    except (HTTPError, URLError, TimeoutError, tarfile.TarError, OSError) as e:
+        metrics.incr("http.failures")
+        print(f"  Error fetching {url}: {e}")
+        return [], []
+    metrics.incr("tar.members", len(futures))
+
+    xml_files = sorted(futures)
+    parsed = {f: futures[f].result() for f in xml_files}
+    return [parsed[f] for f in xml_files if parsed[f]], [f for f in xml_files if not parsed[f]]
+
+
+def parse_psd_file(xml_content: str | bytes, filename: str) -> dict | None:
+    """Parse a PSD file as a property set, falling back to a quantity set."""
+    with metrics.stage("parse"):
+        pset = parse_psd_xml(xml_content, filename)
+        if not pset:
+            pset = parse_qto_xml(xml_content, filename)
+    metrics.incr("files.parsed" if pset else "files.unparsed")
+    return pset
+
+
+def merge_duplicate_psets(property_sets: list[dict]) -> list[dict]:
+    """Deduplicate psets by name, merging properties of later duplicates."""
     seen = {}
     unique_psets = []
     for pset in property_sets:
@@ -447,78 +649,215 @@ def main():
                 if prop["name"] not in existing_props:
                     seen[name]["properties"].append(prop)
                     existing_props.add(prop["name"])
+    return unique_psets
 
-    print(f"  Unique property sets: {len(unique_psets)}")
-
-    # Count stats
-    total_props = sum(len(ps["properties"]) for ps in unique_psets)
-    unique_prop_names = set()
-    for ps in unique_psets:
-        for p in ps["properties"]:
-            unique_prop_names.add(p["name"])
-    print(f"  Total properties: {total_props}")
-    print(f"  Unique property names: {len(unique_prop_names)}")
 
-    # Step 4: Write output files
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    # For IFC4X3_ADD2: use all parsed property sets
-    ifc4x3_file = OUTPUT_DIR / "property-sets-ifc4x3_add2.json"
-    with open(ifc4x3_file, "w") as f:
-        json.dump(unique_psets, f, indent=2)
-        f.write("\n")
-    print(f"\n  Wrote {ifc4x3_file}")
-
-    # For IFC4 and IFC2X3: use a filtered subset
-    # (most IFC4X3 psets also apply to IFC4, and many to IFC2X3)
-    # Filter out IFC4X3-only psets (infrastructure, etc.)
-    ifc4x3_only_prefixes = [
-        "Pset_Bridge", "Pset_Road", "Pset_Railway", "Pset_Marine",
-        "Pset_Facility", "Pset_Alignment", "Pset_Course", "Pset_Earth",
-        "Pset_Pavement", "Pset_Kerb", "Pset_Sign", "Pset_Signal",
-    ]
+def split_by_version(unique_psets: list[dict]) -> dict[str, list[dict]]:
+    """Derive the per-version pset lists from the IFC4X3 set.
 
+    Most IFC4X3 psets also apply to IFC4, and many to IFC2X3; the
+    infrastructure and MEP-only ones are filtered out by name prefix.
+    """
     ifc4_psets = []
     ifc2x3_psets = []
     for pset in unique_psets:
-        is_4x3_only = any(pset["name"].startswith(p) for p in ifc4x3_only_prefixes)
+        is_4x3_only = any(pset["name"].startswith(p) for p in IFC4X3_ONLY_PREFIXES)
 
         if not is_4x3_only:
             ifc4_pset = {**pset, "ifcVersion": ["IFC4", "IFC4X3_ADD2"]}
             ifc4_psets.append(ifc4_pset)
 
-            # IFC2X3 has fewer psets - exclude MEP-specific ones too
-            mep_prefixes = [
-                "Pset_Sensor", "Pset_Actuator", "Pset_Controller",
-                "Pset_Alarm", "Pset_Distribution", "Pset_ElectricAppliance",
-            ]
-            is_mep_only = any(pset["name"].startswith(p) for p in mep_prefixes)
+            is_mep_only = any(pset["name"].startswith(p) for p in IFC4_ONLY_PREFIXES)
             if not is_mep_only:
                 ifc2x3_pset = {**pset, "ifcVersion": ["IFC2X3", "IFC4", "IFC4X3_ADD2"]}
                 ifc2x3_psets.append(ifc2x3_pset)
 
-    ifc4_file = OUTPUT_DIR / "property-sets-ifc4.json"
-    with open(ifc4_file, "w") as f:
-        json.dump(ifc4_psets, f, indent=2)
-        f.write("\n")
-    print(f"  Wrote {ifc4_file}")
+    return {
+        "IFC2X3": ifc2x3_psets,
+        "IFC4": ifc4_psets,
+        "IFC4X3_ADD2": unique_psets,
+    }
+
+
+def archive_path(version: str, download_dir: Path = DOWNLOAD_DIR) -> Path:
+    return download_dir / f"{version}_PropertySets.zip"
+
+
+def find_archives(download_dir: Path = DOWNLOAD_DIR) -> dict[str, Path]:
+    """The official PSD bundle of every IFC version, or {} unless all are there."""
+    archives = {v: archive_path(v, download_dir) for v in IFC_VERSIONS}
+    return archives if all(p.is_file() for p in archives.values()) else {}
+
+
+def parse_archive(zip_path: Path, workers: int = 8) -> tuple[list[dict], list[str]]:
+    """Parse the PSD/QTO members of one bundle straight from the zip.
+
+    Members are read through ``ZipFile.open()`` streams (nothing is extracted)
+    and parsed in parallel. Returns the parsed sets and the members that
+    didn't parse, both in member name order.
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        members = sorted(n for n in archive.namelist() if n.lower().endswith(".xml"))
+
+        def parse_member(name: str) -> dict | None:
+            with archive.open(name) as stream:
+                return parse_psd_file(stream.read(), name)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(parse_member, members))
+    metrics.incr("zip.members", len(members))
+    return [p for p in parsed if p], [m for m, p in zip(members, parsed) if not p]
+
+
+def parse_archives(archives: dict[str, Path]) -> tuple[dict[str, list[dict]], dict[str, dict]]:
+    """Per-version property sets and locale packs from the official bundles.
+
+    Each version gets exactly the sets its own bundle defines (no name-prefix
+    filtering), and ``ifcVersion`` lists every version whose bundle has a set
+    of that name. Texts of the newest version win in the locale packs.
+    """
+    by_version = {}
+    for version, zip_path in archives.items():
+        with metrics.stage(f"parse_archive.{version}"):
+            parsed, failed = parse_archive(zip_path)
+        print(f"  {version}: {len(parsed)} sets from {zip_path.name}"
+              + (f", {len(failed)} other members skipped" if failed else ""))
+        by_version[version] = parsed
+
+    locale_packs = split_localizations(
+        [p for v in reversed(IFC_VERSIONS) for p in by_version.get(v, [])])
+    unique = {v: merge_duplicate_psets(psets) for v, psets in by_version.items()}
+    versions_of: dict[str, list[str]] = {}
+    for version in IFC_VERSIONS:
+        for pset in unique.get(version, []):
+            versions_of.setdefault(pset["name"], []).append(version)
+    for psets in unique.values():
+        for pset in psets:
+            pset["ifcVersion"] = versions_of[pset["name"]]
+    return unique, locale_packs
+
+
+def write_property_sets(by_version: dict[str, list[dict]], output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """Write property-sets-{version}.json for every version, canonically ordered."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for version, psets in by_version.items():
+        output_file = output_dir / f"property-sets-{version.lower()}.json"
+        write_json(output_file, canonical_property_sets(psets))
+        written.append(output_file)
+    return written
+
+
+def parse_from_github(tarball_url: str | None = None) -> tuple[dict[str, list[dict]], dict[str, dict]]:
+    """Per-version psets derived from the IFC4X3 development tree.
+
+    With ``tarball_url`` the tree comes as one archive instead of one
+    request per file.
+    """
+    if tarball_url:
+        print(f"\nDownloading and parsing PSD files from {tarball_url}...")
+        with metrics.stage("download_and_parse"):
+            property_sets, failed = download_and_parse_tarball(tarball_url)
+        if not property_sets:
+            print("ERROR: No PSD files in the tarball. Aborting.")
+            metrics.write_report("fetch-and-parse-psd")
+            sys.exit(1)
+    else:
+        # Step 1: Get file list
+        with metrics.stage("file_list"):
+            xml_files = fetch_file_list()
+        if not xml_files:
+            print("ERROR: Could not fetch PSD file list. Aborting.")
+            metrics.write_report("fetch-and-parse-psd")
+            sys.exit(1)
+
+        # Step 2: Download and parse all PSD files
+        print(f"\nDownloading and parsing {len(xml_files)} PSD files...")
+        with metrics.stage("download_and_parse"):
+            try:
+                property_sets, failed = download_and_parse(xml_files)
+            except FetchAborted as e:
+                print(f"ERROR: Download failed ({e}). Aborting.")
+                metrics.write_report("fetch-and-parse-psd")
+                sys.exit(1)
+
+    print(f"\n  Successfully parsed: {len(property_sets)} property sets")
+    if failed:
+        print(f"  Failed: {len(failed)} files")
+
+    # Step 3: Deduplicate (some psets may appear in multiple files)
+    with metrics.stage("merge"):
+        locale_packs = split_localizations(property_sets)
+        unique_psets = merge_duplicate_psets(property_sets)
+    print(f"  Unique property sets: {len(unique_psets)}")
+    with metrics.stage("filter"):
+        return split_by_version(unique_psets), locale_packs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--archives", nargs="?", type=Path, const=DOWNLOAD_DIR, metavar="DIR",
+                        help="parse the official per-version bundles from download-psd.py "
+                             f"(default: {DOWNLOAD_DIR})")
+    source.add_argument("--tarball", nargs="?", const=GITHUB_TARBALL_URL, metavar="URL",
+                        help="fetch the development tree as one tar.gz instead of file by file "
+                             f"(default: {GITHUB_TARBALL_URL})")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("IFC Property Set Generator - Full PSD Coverage")
+    print("=" * 60)
+
+    if args.archives:
+        archives = find_archives(args.archives)
+        if not archives:
+            print(f"ERROR: Missing PSD bundles in {args.archives} "
+                  f"(run download-psd.py first). Aborting.")
+            sys.exit(1)
+        print(f"\nParsing PSD bundles from {args.archives}...")
+        by_version, locale_packs = parse_archives(archives)
+    else:
+        by_version, locale_packs = parse_from_github(args.tarball)
+    # Newest definition of every pset, for the stats
+    newest = {}
+    for version in reversed(IFC_VERSIONS):
+        for ps in by_version[version]:
+            newest.setdefault(ps["name"], ps)
+    unique_psets = list(newest.values())
 
-    ifc2x3_file = OUTPUT_DIR / "property-sets-ifc2x3.json"
-    with open(ifc2x3_file, "w") as f:
-        json.dump(ifc2x3_psets, f, indent=2)
-        f.write("\n")
-    print(f"  Wrote {ifc2x3_file}")
+    # Count stats
+    total_props = sum(len(ps["properties"]) for ps in unique_psets)
+    unique_prop_names = set()
+    for ps in unique_psets:
+        for p in ps["properties"]:
+            unique_prop_names.add(p["name"])
+    print(f"  Total properties: {total_props}")
+    print(f"  Unique property names: {len(unique_prop_names)}")
+
+    # Step 4: Write output files
+    print()
+    with metrics.stage("write"):
+        written = write_property_sets(by_version)
+        written += write_enumeration_indexes(by_version, OUTPUT_DIR).values()
+        written += write_applicability_indexes(by_version, OUTPUT_DIR).values()
+        written += write_locale_packs(locale_packs, OUTPUT_DIR)
+    for output_file in written:
+        print(f"  Wrote {output_file}")
+    for version, psets in by_version.items():
+        metrics.incr(f"psets.{version}", len(psets))
 
     # Step 5: Summary
     print(f"\n{'=' * 60}")
     print(f"SUMMARY")
     print(f"{'=' * 60}")
-    print(f"  IFC4X3_ADD2: {len(unique_psets)} property sets")
-    print(f"  IFC4:        {len(ifc4_psets)} property sets")
-    print(f"  IFC2X3:      {len(ifc2x3_psets)} property sets")
+    print(f"  IFC4X3_ADD2: {len(by_version['IFC4X3_ADD2'])} property sets")
+    print(f"  IFC4:        {len(by_version['IFC4'])} property sets")
+    print(f"  IFC2X3:      {len(by_version['IFC2X3'])} property sets")
     print(f"  Total unique properties: {total_props}")
     print(f"  Unique property names: {len(unique_prop_names)}")
     print(f"\nDone!")
+    metrics.write_report("fetch-and-parse-psd")
 
 
 if __name__ == "__main__":
@@ -1,38 +1,32 @@
 #!/usr/bin/env python3
 """
-Update schema index with correct property set counts
+Update schema index with correct counts, file hashes and sizes
 """
 
-import json
+import sys
 from pathlib import Path
 
-def update_schema_index():
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from ifc_schema import metrics  # noqa: E402
+from ifc_schema.schema_index import index_from_files, write_schema_index  # noqa: E402
+
+OUTPUT_DIR = Path(__file__).parent.parent.parent / "lib" / "generated" / "ifc-schema"
+
+def update_schema_index(output_dir=OUTPUT_DIR):
     """Update schema index with correct counts"""
     
-    output_dir = Path(__file__).parent.parent.parent / "lib" / "generated" / "ifc-schema"
-    
-    # Load existing index
-    index_file = output_dir / "schema-index.json"
-    with open(index_file) as f:
-        index = json.load(f)
-    
-    # Update property set counts
-    versions = ["IFC2X3", "IFC4", "IFC4X3_ADD2"]
-    
-    for version in versions:
-        psets_file = output_dir / f"property-sets-{version.lower()}.json"
-        if psets_file.exists():
-            with open(psets_file) as f:
-                psets = json.load(f)
-                index["propertySetCounts"][version] = len(psets)
-                print(f"📊 {version}: {len(psets)} property sets")
+    # Files whose digest matches the existing index aren't parsed again
+    index = index_from_files(output_dir)
+    for version, count in index["propertySetCounts"].items():
+        print(f"📊 {version}: {count} property sets")
     
     # Write updated index
-    with open(index_file, 'w') as f:
-        json.dump(index, f, indent=2)
+    index_file = write_schema_index(index, output_dir)
     
     print(f"\n✅ Schema index updated: {index_file}")
     print(f"   Property set counts: {index['propertySetCounts']}")
 
 if __name__ == "__main__":
-    update_schema_index()
+    with metrics.stage("update_index"):
+        update_schema_index()
+    metrics.write_report("update-schema-index")
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+
+# The generator scripts import ``ifc_schema`` from scripts/, the local
+# stand-in servers live in scripts/bench/.
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR / "bench"))
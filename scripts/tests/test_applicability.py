@@ -0,0 +1,85 @@
+"""Predefined-type scoping of property sets and the applicability index."""
+
+import json
+
+import pytest
+
+from ifc_schema import IFC_VERSIONS, REPO_ROOT, load_script
+from ifc_schema.applicability import (
+    build_applicability_index, count_scoped, parse_applicability, write_applicability_indexes,
+)
+from ifc_schema.pipeline import PipelineError
+
+FIXTURES_DIR = REPO_ROOT / "scripts" / "bench" / "fixtures" / "psd"
+
+
+@pytest.mark.parametrize("class_names, entities, scoped", [
+    (["IfcWall"], ["IFCWALL"], {}),
+    (["IfcWall/STANDARD", "IfcWall/partitioning "], ["IFCWALL", "IFCWALL"],
+     {"IFCWALL": ["PARTITIONING", "STANDARD"]}),
+    # Listed without a type (or with *) as well: applies to all types.
+    (["IfcWall/STANDARD", "IfcWall"], ["IFCWALL", "IFCWALL"], {}),
+    (["IfcWall/STANDARD", "IfcWall/*"], ["IFCWALL", "IFCWALL"], {}),
+    (["IfcRoadPart/CARRIAGEWAY", "IfcRoad"], ["IFCROADPART", "IFCROAD"],
+     {"IFCROADPART": ["CARRIAGEWAY"]}),
+])
+def test_parse_applicability(class_names, entities, scoped):
+    assert parse_applicability(class_names) == (entities, scoped)
+
+
+def test_parsed_fixtures_keep_the_scoping():
+    psd = load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+    psets = {p.name: psd.parse_psd_file(p.read_bytes(), p.name)
+             for p in sorted(FIXTURES_DIR.glob("*.xml"))}
+    standard = psets["Pset_WallTypeStandard.xml"]
+    assert standard["applicablePredefinedTypes"] == {"IFCWALL": ["STANDARD"],
+                                                     "IFCWALLTYPE": ["STANDARD"]}
+    assert "applicablePredefinedTypes" not in psets["Pset_WallCommon.xml"]
+
+    index = build_applicability_index("IFC4X3_ADD2", list(psets.values()))
+    assert index["entities"]["IFCWALL"] == {
+        "*": ["Pset_WallCommon", "Qto_WallBaseQuantities"],
+        "STANDARD": ["Pset_WallTypeStandard"],
+    }
+    assert count_scoped(index) == 3
+
+
+def test_index_and_count():
+    index = build_applicability_index("IFC4", [
+        {"name": "Pset_B", "applicableEntities": ["IFCWALL"]},
+        {"name": "Pset_A", "applicableEntities": ["IFCWALL", "IfcDoor"],
+         "applicablePredefinedTypes": {"IFCWALL": ["STANDARD", "MOVABLE"]}},
+    ])
+    assert index == {"version": "IFC4", "entities": {
+        "IFCDOOR": {"*": ["Pset_A"]},
+        "IFCWALL": {"*": ["Pset_B"], "MOVABLE": ["Pset_A"], "STANDARD": ["Pset_A"]},
+    }}
+    assert count_scoped(index) == 1
+    assert count_scoped({"entities": {"IFCDOOR": {"*": ["Pset_A"]}}}) == 0
+
+
+def test_versions_without_scoping_get_no_file(tmp_path):
+    stale = tmp_path / "applicability-ifc2x3.json"
+    stale.write_text("{}")
+    written = write_applicability_indexes({
+        "IFC4": [{"name": "Pset_A", "applicableEntities": ["IFCWALL"],
+                  "applicablePredefinedTypes": {"IFCWALL": ["STANDARD"]}}],
+        "IFC2X3": [{"name": "Pset_A", "applicableEntities": ["IFCWALL"]}],
+    }, tmp_path)
+    assert written == {"IFC4": tmp_path / "applicability-ifc4.json"}
+    assert json.loads(written["IFC4"].read_text())["entities"]["IFCWALL"] == {
+        "STANDARD": ["Pset_A"]}
+    assert not stale.exists()
+
+
+def test_fresh_parse_without_any_scoping_fails():
+    gs = load_script(REPO_ROOT / "scripts" / "generate-schema.py")
+    unscoped = {v: [{"name": "Pset_A", "applicableEntities": ["IFCWALL"]}] for v in IFC_VERSIONS}
+    with pytest.raises(PipelineError, match="applicablePredefinedTypes"):
+        gs._check_versions(unscoped)
+
+    unscoped["IFC4"] = [{"name": "Pset_A", "applicableEntities": ["IFCWALL"],
+                         "applicablePredefinedTypes": {"IFCWALL": ["STANDARD"]}}]
+    gs._check_versions(unscoped)
+    with pytest.raises(PipelineError, match="No property sets parsed for IFC2X3"):
+        gs._check_versions({**unscoped, "IFC2X3": []})
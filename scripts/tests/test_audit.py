@@ -0,0 +1,136 @@
+"""ids-audit.py: the editor's checks by default, the stricter ones with --strict."""
+
+import json
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script
+from ifc_schema.audit import audit_file
+
+IDS = """<?xml version="1.0" encoding="UTF-8"?>
+<ids xmlns="http://standards.buildingsmart.org/IDS">
+  <info><title>audit test</title></info>
+  <specifications>
+    <specification name="Walls" ifcVersion="IFC4">
+      <applicability minOccurs="0">{applicability}</applicability>
+      <requirements>{requirements}</requirements>
+    </specification>
+  </specifications>
+</ids>
+"""
+
+
+def entity(name, predefined=None):
+    xml = f"<entity><name><simpleValue>{name}</simpleValue></name>"
+    if predefined:
+        xml += f"<predefinedType><simpleValue>{predefined}</simpleValue></predefinedType>"
+    return xml + "</entity>"
+
+
+def prop(pset, name, data_type):
+    return (f'<property dataType="{data_type}">'
+            f"<propertySet><simpleValue>{pset}</simpleValue></propertySet>"
+            f"<baseName><simpleValue>{name}</simpleValue></baseName></property>")
+
+
+def write_ids(path, applicability="", requirements=""):
+    path.write_text(IDS.format(applicability=applicability, requirements=requirements))
+    return path
+
+
+def messages(result, category=None):
+    return [i["message"] for i in result["issues"]
+            if category is None or i["category"] == category]
+
+
+def test_clean_file(tmp_path):
+    path = write_ids(tmp_path / "ok.ids", entity("IFCWALL", "PARTITIONING"),
+                     prop("Pset_WallCommon", "IsExternal", "IFCBOOLEAN"))
+    for strict in (False, True):
+        result = audit_file(path, strict=strict)
+        assert result["specifications"] == 1
+        assert result["issues"] == []
+
+
+def test_invalid_data_type_is_an_error(tmp_path):
+    path = write_ids(tmp_path / "a.ids", entity("IFCWALL"),
+                     prop("Pset_WallCommon", "IsExternal", "IFCNOTATYPE"))
+    [issue] = audit_file(path)["issues"]
+    assert (issue["severity"], issue["category"]) == ("error", "ifc-audit")
+    assert issue["field"] == "dataType"
+    assert issue["ifcVersion"] == "IFC4"
+
+
+def test_different_kind_of_value_is_a_recommendation(tmp_path):
+    path = write_ids(tmp_path / "a.ids", entity("IFCWALL"),
+                     prop("Pset_WallCommon", "IsExternal", "IFCREAL"))
+    [issue] = audit_file(path)["issues"]
+    assert (issue["severity"], issue["category"]) == ("warning", "recommendation")
+    assert "IFCBOOLEAN" in issue["message"]
+
+
+def test_strict_only_checks(tmp_path):
+    path = write_ids(tmp_path / "a.ids", entity("IFCWALLX"),
+                     entity("IFCWALL", "FOO") + prop("Pset_Nope", "X", "IFCLABEL"))
+    # The editor accepts all three, so the default audit does too.
+    assert audit_file(path)["issues"] == []
+
+    issues = audit_file(path, strict=True)["issues"]
+    assert {(i["severity"], i["category"], i["field"]) for i in issues} == {
+        ("warning", "ifc-audit", "name"),
+        ("warning", "ifc-audit", "predefinedType"),
+        ("warning", "ifc-audit", "propertySet"),
+    }
+    unknown = next(i for i in issues if i["field"] == "name")
+    assert unknown["suggestions"][0] == "IfcWall"
+    assert unknown["message"].endswith('Did you mean "IfcWall"?')
+
+
+def test_structural_issues(tmp_path):
+    path = write_ids(tmp_path / "a.ids", prop("Pset_WallCommon", "IsExternal", "IFCBOOLEAN"))
+    assert messages(audit_file(path), "recommendation") == [
+        'Specification "Walls" applicability should include at least one entity'
+    ]
+
+    broken = tmp_path / "broken.ids"
+    broken.write_text("<ids><specifications><specification")
+    [issue] = audit_file(broken)["issues"]
+    assert issue["message"].startswith("Could not parse IDS file")
+
+    empty = tmp_path / "empty.ids"
+    empty.write_text('<ids xmlns="http://standards.buildingsmart.org/IDS"><specifications/></ids>')
+    assert messages(audit_file(empty)) == ["At least one specification is required"]
+
+
+@pytest.fixture(scope="module")
+def cli():
+    return load_script(REPO_ROOT / "scripts" / "ids-audit.py")
+
+
+def test_cli_exit_status(cli, tmp_path, capsys):
+    write_ids(tmp_path / "ok.ids", entity("IFCWALL"))
+    assert cli.main([str(tmp_path)]) == 0
+    write_ids(tmp_path / "strict.ids", entity("IFCWALLX"))
+    assert cli.main([str(tmp_path)]) == 0
+    assert cli.main([str(tmp_path), "--strict"]) == 0
+    assert cli.main([str(tmp_path), "--strict", "--fail-on", "warning"]) == 1
+    write_ids(tmp_path / "error.ids", entity("IFCWALL"),
+              prop("Pset_WallCommon", "IsExternal", "IFCNOTATYPE"))
+    assert cli.main([str(tmp_path), "--jobs", "2"]) == 1
+    assert cli.main([str(tmp_path / "missing")]) == 1
+    capsys.readouterr()
+
+
+def test_cli_json_report(cli, tmp_path, capsys):
+    write_ids(tmp_path / "a.ids", entity("IFCWALLX"))
+    (tmp_path / "sub").mkdir()
+    write_ids(tmp_path / "sub" / "b.xml", entity("IFCWALL"))
+    (tmp_path / "notes.txt").write_text("not an IDS file")
+    capsys.readouterr()
+
+    assert cli.main([str(tmp_path), "--json", "--strict", "--jobs", "1"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"] == {"files": 2, "specifications": 2, "filesWithErrors": 0,
+                                 "errors": 0, "warnings": 1}
+    assert [f["path"] for f in report["files"]] == [str(tmp_path / "a.ids"),
+                                                     str(tmp_path / "sub" / "b.xml")]
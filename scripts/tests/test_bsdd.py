@@ -0,0 +1,67 @@
+"""BsddClient against the local bSDD stand-in (scripts/bench/local_bsdd.py)."""
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from ifc_schema.bsdd import BsddClient, BsddError  # noqa: E402
+from local_bsdd import LocalBsdd  # noqa: E402
+
+
+@pytest.fixture
+def bsdd():
+    # Three classes per page, so the class list takes several pages.
+    with LocalBsdd(scale=3, max_page_size=3) as server:
+        yield server
+
+
+def crawl(bsdd, cache_dir):
+    with requests.Session() as session:
+        return BsddClient(session, bsdd.base_url, cache_dir).crawl_dictionary(bsdd.dictionary_uri)
+
+
+def test_crawl_pages_through_the_dictionary(bsdd, tmp_path):
+    classes = crawl(bsdd, tmp_path)
+
+    assert sorted(c["uri"] for c in classes) == sorted(bsdd.by_uri)
+    assert all(c == bsdd.by_uri[c["uri"]] for c in classes)
+    assert [c["code"] for c in classes] == sorted(c["code"] for c in classes)
+    pages = -(-len(bsdd.classes) // bsdd.max_page_size)
+    assert bsdd.requests == pages + len(bsdd.classes)
+    assert bsdd.not_modified == 0
+
+
+def test_cached_responses_are_revalidated(bsdd, tmp_path):
+    first = crawl(bsdd, tmp_path)
+    requests_made = bsdd.requests
+
+    assert crawl(bsdd, tmp_path) == first
+    # Every request of the second crawl came back 304 Not Modified.
+    assert bsdd.requests == 2 * requests_made
+    assert bsdd.not_modified == requests_made
+
+
+def test_changed_responses_replace_the_cache(bsdd, tmp_path):
+    crawl(bsdd, tmp_path)
+    requests_made = bsdd.requests
+    changed = bsdd.classes[0]
+    changed["name"] = "Renamed"
+
+    classes = crawl(bsdd, tmp_path)
+    assert next(c for c in classes if c["uri"] == changed["uri"])["name"] == "Renamed"
+    # Only the class and the class list page showing it came back in full.
+    assert bsdd.not_modified == requests_made - 2
+    assert crawl(bsdd, tmp_path) == classes
+
+
+def test_without_a_cache_nothing_is_revalidated(bsdd):
+    crawl(bsdd, None)
+    crawl(bsdd, None)
+    assert bsdd.not_modified == 0
+
+
+def test_errors_raise_bsdd_error(bsdd, tmp_path):
+    with requests.Session() as session:
+        client = BsddClient(session, bsdd.base_url, tmp_path)
+        with pytest.raises(BsddError, match="HTTP 404"):
+            client.class_details(bsdd.dictionary_uri + "/class/IfcNotAClass")
@@ -0,0 +1,84 @@
+"""Canonical ordering: the same records give the same bytes in any order."""
+
+import copy
+import json
+import random
+
+import pytest
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS, REPO_ROOT, load_script
+from ifc_schema.canonical import (
+    canonical_property_set, canonical_property_sets, order_keys, version_order,
+)
+
+PSET = {
+    "templateType": "PSET_TYPEDRIVENOVERRIDE",
+    "ifcVersion": ["IFC4X3_ADD2", "IFC2X3", "IFC5", "IFC4"],
+    "properties": [
+        {"dataType": "IFCLABEL", "name": "Status", "description": "..."},
+        {"name": "AcousticRating", "dataType": "IFCLABEL"},
+    ],
+    "applicableEntities": ["IFCWALLSTANDARDCASE", "IFCWALL", "IFCWALL"],
+    "name": "Pset_WallCommon",
+}
+
+
+def shuffled(psets, seed):
+    rng = random.Random(seed)
+    psets = copy.deepcopy(psets)
+    rng.shuffle(psets)
+    for pset in psets:
+        rng.shuffle(pset.get("properties", []))
+        rng.shuffle(pset.get("applicableEntities", []))
+    return psets
+
+
+def test_canonical_property_set():
+    pset = canonical_property_set(PSET)
+    assert list(pset) == ["name", "applicableEntities", "properties", "ifcVersion",
+                          "templateType"]
+    assert pset["applicableEntities"] == ["IFCWALL", "IFCWALLSTANDARDCASE"]
+    assert pset["ifcVersion"] == ["IFC2X3", "IFC4", "IFC4X3_ADD2", "IFC5"]
+    assert [p["name"] for p in pset["properties"]] == ["AcousticRating", "Status"]
+    assert list(pset["properties"][1]) == ["name", "dataType", "description"]
+    # The input is left alone.
+    assert PSET["applicableEntities"][0] == "IFCWALLSTANDARDCASE"
+
+
+def test_order_keys():
+    assert list(order_keys({"z": 1, "b": 2, "name": 3, "a": 4}, ("name", "missing"))) == [
+        "name", "a", "b", "z"]
+    assert version_order(["X", "IFC4", "A", "IFC2X3"]) == ["IFC2X3", "IFC4", "A", "X"]
+
+
+@pytest.fixture(scope="module")
+def committed():
+    with open(GENERATED_DIR / "property-sets-ifc4.json") as f:
+        return json.load(f)
+
+
+def test_order_of_the_input_does_not_matter(committed):
+    expected = json.dumps(canonical_property_sets(committed))
+    for seed in range(3):
+        assert json.dumps(canonical_property_sets(shuffled(committed, seed))) == expected
+
+
+def test_committed_property_sets_are_canonical():
+    for version in IFC_VERSIONS:
+        with open(GENERATED_DIR / f"property-sets-{version.lower()}.json") as f:
+            psets = json.load(f)
+        assert canonical_property_sets(psets) == psets
+        assert canonical_property_sets(canonical_property_sets(psets)) == psets
+
+
+def test_written_files_are_reproducible(committed, tmp_path):
+    psd = load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+    outputs = []
+    for seed in range(2):
+        out = tmp_path / str(seed)
+        out.mkdir()
+        by_version = {v: shuffled(committed, seed) for v in IFC_VERSIONS}
+        outputs.append({p.name: p.read_bytes() for p in psd.write_property_sets(by_version, out)})
+    assert outputs[0] == outputs[1]
+    assert outputs[0]["property-sets-ifc4.json"] == (
+        GENERATED_DIR / "property-sets-ifc4.json").read_bytes()
@@ -0,0 +1,84 @@
+"""The curated pset catalog: bucketing, the compiled cache and the PSD overlay."""
+
+import json
+import os
+
+import pytest
+
+from ifc_schema import IFC_VERSIONS, metrics
+from ifc_schema.catalog import CATALOG_FILE, bucket_by_version, load_catalog, overlay_catalog
+
+
+def misses():
+    return metrics.get_metrics().counters.get("cache.catalog.misses", 0)
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps([
+        {"name": "Pset_A", "ifcVersion": ["IFC2X3", "IFC4"], "properties": []},
+        {"name": "Pset_B", "ifcVersion": ["IFC4X3_ADD2"], "properties": []},
+    ]))
+    return path
+
+
+def test_bucket_by_version():
+    a = {"name": "Pset_A", "ifcVersion": ["IFC4", "IFC4X3_ADD2"]}
+    b = {"name": "Pset_B", "ifcVersion": ["IFC5"]}
+    buckets = bucket_by_version([a, b, {"name": "Pset_C"}])
+    assert buckets == {"IFC2X3": [], "IFC4": [a], "IFC4X3_ADD2": [a], "IFC5": [b]}
+    assert buckets["IFC4"][0] is buckets["IFC4X3_ADD2"][0]
+
+
+def test_committed_catalog_buckets_like_the_filter():
+    with open(CATALOG_FILE) as f:
+        records = json.load(f)
+    by_version = load_catalog(cache_file=None)
+    for version in IFC_VERSIONS:
+        expected = [p for p in records if version in p.get("ifcVersion", [])]
+        assert by_version[version] == expected and expected
+
+
+def test_compiled_cache(catalog_file, tmp_path):
+    cache_file = tmp_path / "cache" / "catalog.pickle"
+    before = misses()
+    first = load_catalog(catalog_file, cache_file)
+    assert cache_file.exists() and misses() == before + 1
+    assert [p["name"] for p in first["IFC4"]] == ["Pset_A"]
+
+    assert load_catalog(catalog_file, cache_file) == first
+    assert misses() == before + 1
+
+    # A changed data file invalidates the cache, even with the same mtime.
+    st = catalog_file.stat()
+    catalog_file.write_text(json.dumps([{"name": "Pset_C", "ifcVersion": ["IFC4"]}]))
+    os.utime(catalog_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert [p["name"] for p in load_catalog(catalog_file, cache_file)["IFC4"]] == ["Pset_C"]
+    assert misses() == before + 2
+
+
+def test_corrupt_cache_is_rebuilt(catalog_file, tmp_path):
+    cache_file = tmp_path / "catalog.pickle"
+    cache_file.write_bytes(b"not a pickle")
+    assert load_catalog(catalog_file, cache_file) == load_catalog(catalog_file, None)
+    assert load_catalog(catalog_file, cache_file)["IFC4X3_ADD2"][0]["name"] == "Pset_B"
+
+
+def test_overlay_only_adds():
+    psd = {"IFC4": [{"name": "Pset_WallCommon", "properties": [
+        {"name": "IsExternal", "dataType": "IFCBOOLEAN"}]}]}
+    catalog = {"IFC4": [
+        {"name": "Pset_WallCommon", "properties": [
+            {"name": "IsExternal", "dataType": "IFCLABEL"},
+            {"name": "FireRating", "dataType": "IFCLABEL"}]},
+        {"name": "Pset_DoorCommon", "properties": []},
+    ]}
+    snapshot = json.dumps([psd, catalog])
+
+    merged = overlay_catalog(psd, catalog)["IFC4"]
+    by_name = {p["name"]: p for p in merged}
+    assert set(by_name) == {"Pset_WallCommon", "Pset_DoorCommon"}
+    assert {p["name"]: p["dataType"] for p in by_name["Pset_WallCommon"]["properties"]} == {
+        "IsExternal": "IFCBOOLEAN", "FireRating": "IFCLABEL"}
+    assert json.dumps([psd, catalog]) == snapshot
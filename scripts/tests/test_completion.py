@@ -0,0 +1,81 @@
+"""Ranked prefix completion: the binary-searched ranges match a linear scan."""
+
+import json
+
+import pytest
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS
+from ifc_schema.completion import (
+    KINDS, CompletionIndex, build_completion_index, completion_keys,
+)
+
+ENTITIES = [{"name": "IfcWall"}, {"name": "IfcWallType"}, {"name": "IfcDoor"},
+            {"name": "IfcWindow"}]
+PROPERTY_SETS = [
+    {"name": "Pset_WallCommon", "applicableEntities": ["IfcWall", "IfcWall/STANDARD"],
+     "properties": [{"name": "IsExternal", "dataType": "IFCBOOLEAN"},
+                    {"name": "FireRating", "dataType": "IFCLABEL"}]},
+    {"name": "Pset_DoorCommon", "applicableEntities": ["IFCDOOR", "IfcWall"],
+     "properties": [{"name": "IsExternal", "dataType": "IFCBOOLEAN"}]},
+    {"name": "Qto_WallBaseQuantities", "applicableEntities": ["IfcWall", "IfcWallType"],
+     "properties": [{"name": "Width", "dataType": "IFCLENGTHMEASURE"}]},
+]
+SIMPLE_TYPES = [{"name": "IFCBOOLEAN"}, {"name": "IFCLABEL"}, {"name": "IFCREAL"}]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CompletionIndex(build_completion_index("IFC4", ENTITIES, PROPERTY_SETS,
+                                                  SIMPLE_TYPES))
+
+
+def test_completion_keys():
+    assert completion_keys("IfcWall") == ["ifcwall", "wall"]
+    assert completion_keys("Pset_WallCommon") == ["pset_wallcommon", "wallcommon"]
+    assert completion_keys("Qto_WallBaseQuantities") == ["qto_wallbasequantities",
+                                                         "wallbasequantities"]
+    assert completion_keys("Ifc") == ["ifc"]
+    assert completion_keys("Width") == ["width"]
+
+
+def test_names_are_ranked_by_usage():
+    table = build_completion_index("IFC4", ENTITIES, PROPERTY_SETS, SIMPLE_TYPES)
+    # Three sets apply to IfcWall (the predefined type counts once), one each to
+    # IfcDoor and IfcWallType; ties go by name.
+    assert table["entity"]["names"] == ["IfcWall", "IfcDoor", "IfcWallType", "IfcWindow"]
+    assert table["pset"]["names"] == ["Pset_DoorCommon", "Qto_WallBaseQuantities",
+                                      "Pset_WallCommon"]
+    assert table["property"]["names"][0] == "IsExternal"
+    assert table["datatype"]["names"] == ["IFCBOOLEAN", "IFCLABEL", "IFCREAL"]
+    assert table["entity"]["keys"] == sorted(table["entity"]["keys"])
+
+
+def test_complete(index):
+    assert index.complete("wall", "entity") == ["IfcWall", "IfcWallType"]
+    assert index.complete(" IFCW ", "entity") == ["IfcWall", "IfcWallType", "IfcWindow"]
+    assert index.complete("ifc", "entity", limit=2) == ["IfcWall", "IfcDoor"]
+    assert index.complete("wall", "pset") == ["Qto_WallBaseQuantities", "Pset_WallCommon"]
+    assert index.complete("pset_", "pset") == ["Pset_DoorCommon", "Pset_WallCommon"]
+    assert index.complete("is", "property") == ["IsExternal"]
+    assert index.complete("", "datatype", limit=None) == ["IFCBOOLEAN", "IFCLABEL", "IFCREAL"]
+    assert index.complete("roof", "entity") == []
+
+
+def scan(table, prefix):
+    """Every name with a key starting with ``prefix``, checked one by one."""
+    return [name for name in table["names"]
+            if any(k.startswith(prefix) for k in completion_keys(name))]
+
+
+@pytest.mark.parametrize("version", IFC_VERSIONS)
+def test_committed_indexes_match_a_scan(version):
+    with open(GENERATED_DIR / f"completion-{version.lower()}.json") as f:
+        table = json.load(f)
+    index = CompletionIndex(table)
+    assert index.version == version
+    for kind in KINDS:
+        names = table[kind]["names"]
+        assert names
+        prefixes = {k[:n] for k in table[kind]["keys"][::7] for n in (1, 3)} | {"", "zz~"}
+        for prefix in sorted(prefixes):
+            assert index.complete(prefix, kind, limit=None) == scan(table[kind], prefix)
@@ -0,0 +1,85 @@
+"""The datatype matrix agrees with the pairwise category rules."""
+
+import base64
+import json
+import shutil
+
+import pytest
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS
+from ifc_schema.datatypes import (
+    CATEGORIES, DatatypeMatrix, build_datatype_matrix, categories_compatible, category_of,
+    write_datatype_matrices,
+)
+
+
+def load_simple_types(version):
+    with open(GENERATED_DIR / f"simple-types-{version.lower()}.json") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("version", IFC_VERSIONS)
+def test_matrix_matches_the_rules(version):
+    simple_types = load_simple_types(version)
+    matrix = DatatypeMatrix(build_datatype_matrix(version, simple_types))
+    by_name = {t["name"].upper(): t for t in simple_types}
+    assert matrix.types == sorted(by_name)
+    for a in matrix.types:
+        assert matrix.category(a) == category_of(by_name[a])
+        for b in matrix.types:
+            expected = a == b or categories_compatible(category_of(by_name[a]),
+                                                       category_of(by_name[b]))
+            assert matrix.compatible(a, b) == expected, (a, b)
+
+
+@pytest.mark.parametrize("simple_type, category", [
+    ({"name": "IfcLengthMeasure", "baseType": "xs:double"}, "numeric"),
+    ({"name": "IfcLabel", "baseType": " xs:string "}, "string"),
+    ({"name": "IfcBoolean", "baseType": "xs:boolean"}, "boolean"),
+    ({"name": "IfcDateTime", "baseType": "xs:dateTime"}, "datetime"),
+    ({"name": "IfcBinary", "baseType": ""}, "binary"),
+    ({"name": "IfcWall", "baseType": "xs:string", "category": "reference"}, "reference"),
+    ({"name": "IfcOdd", "baseType": "xs:duration-ish"}, "unknown"),
+])
+def test_category_of(simple_type, category):
+    assert category_of(simple_type) == category
+
+
+def test_lookups():
+    matrix = DatatypeMatrix(build_datatype_matrix("IFC4", [
+        {"name": "IfcReal", "baseType": "xs:double"},
+        {"name": "IfcInteger", "baseType": "xs:integer"},
+        {"name": "IfcLabel", "baseType": "xs:string"},
+        {"name": "IfcOdd", "baseType": "?"},
+    ]))
+    assert "ifcreal" in matrix and "IfcText" not in matrix
+    assert matrix.compatible("IfcReal", "ifcinteger")
+    assert not matrix.compatible("IFCREAL", "IFCLABEL")
+    # Unknown categories and names the schema doesn't know never conflict.
+    assert matrix.compatible("IFCODD", "IFCLABEL")
+    assert matrix.compatible("IFCREAL", "IFCNOTATYPE")
+    assert matrix.category("IfcNotAType") == "unknown"
+
+
+def test_bitset_layout():
+    types = [{"name": f"T{i:02d}", "baseType": "xs:string" if i % 3 else "xs:double"}
+             for i in range(11)]
+    table = build_datatype_matrix("IFC4", types)
+    assert table["categories"] == CATEGORIES
+    assert table["rowBytes"] == 2
+    bits = base64.b64decode(table["compatible"])
+    assert len(bits) == 11 * 2
+    for i in range(11):
+        for j in range(11):
+            bit = bool(bits[i * 2 + (j >> 3)] & (1 << (j & 7)))
+            assert bit == ((i % 3 == 0) == (j % 3 == 0))
+
+
+def test_committed_matrices_are_current(tmp_path):
+    for version in IFC_VERSIONS:
+        name = f"simple-types-{version.lower()}.json"
+        shutil.copyfile(GENERATED_DIR / name, tmp_path / name)
+    written = write_datatype_matrices(tmp_path)
+    assert sorted(written) == sorted(IFC_VERSIONS)
+    for path in written.values():
+        assert path.read_bytes() == (GENERATED_DIR / path.name).read_bytes()
@@ -0,0 +1,82 @@
+"""Docs search index: github-slugger compatible slugs, chunking, terms."""
+
+import pytest
+
+from ifc_schema.docs_index import Slugger, build_docs_index, split_chunks, tokenize
+
+
+# The first cases are github-slugger's README examples. The rest apply its
+# rule: lower-case, drop everything but letters, marks, numbers, spaces, "-"
+# and "_", then turn spaces into "-".
+@pytest.mark.parametrize("text, slug", [
+    ("foo", "foo"),
+    ("Hello World", "hello-world"),
+    ("Привет non-latin 你好", "привет-non-latin-你好"),
+    ("😄 emoji", "-emoji"),
+    ("  Initial and trailing spaces  ", "--initial-and-trailing-spaces--"),
+    ("Multiple   spaces", "multiple---spaces"),
+    ("Dash-es and under_scores", "dash-es-and-under_scores"),
+    ("Punctuation: (removed), .!?", "punctuation-removed-"),
+    ("C++ & C#", "c--c"),
+    ("Ünïcödé àccents", "ünïcödé-àccents"),
+    ("Pset_WallCommon (IFC4)", "pset_wallcommon-ifc4"),
+    ("`code` in headings", "code-in-headings"),
+    ("", ""),
+])
+def test_slug(text, slug):
+    assert Slugger().slug(text) == slug
+
+
+def test_repeated_slugs_get_counters():
+    slugger = Slugger()
+    slugs = [slugger.slug(t) for t in ("foo", "foo", "bar", "foo")]
+    assert slugs == ["foo", "foo-1", "bar", "foo-2"]
+    # A heading that looks like a generated slug takes the next free one.
+    slugger = Slugger()
+    assert [slugger.slug(t) for t in ("foo-1", "foo", "foo")] == ["foo-1", "foo", "foo-2"]
+    assert [slugger.slug(t) for t in ("Foo", "FOO")] == ["foo-3", "foo-4"]
+
+
+def test_split_chunks():
+    md = "\n".join([
+        "Intro with **bold** and a [link](https://example.com).",
+        "# Title",
+        "## Set Up",
+        "Run `npm install`.",
+        "```bash",
+        "# not a heading",
+        "```",
+        "## Set Up",
+        "Again, with _emphasis_ but Pset_WallCommon intact.",
+    ])
+    chunks = split_chunks(md)
+    # The line in the code block stays in the chunk's content.
+    assert [(c["heading"], c["slug"]) for c in chunks] == [
+        ("", ""), ("Title", "title"), ("Set Up", "set-up"), ("Set Up", "set-up-1")]
+    assert chunks[0]["content"] == "Intro with bold and a link."
+    assert chunks[1]["content"] == ""
+    assert chunks[2]["content"].startswith("Run npm install.")
+    assert "not a heading" in chunks[2]["content"]
+    assert chunks[3]["content"] == "Again, with emphasis but Pset_WallCommon intact."
+
+
+def test_tokenize():
+    assert tokenize("IfcWallType and Pset_WallCommon, IFC4X3") == {
+        "ifcwalltype", "ifc", "wall", "type", "and", "pset", "wallcommon", "common",
+        "ifc4x3", "4", "x", "3",
+    }
+
+
+def test_build_docs_index(tmp_path):
+    (tmp_path / "a.md").write_text("# Walls\nIfcWall facets\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("Intro\n## Walls\nMore walls\n", encoding="utf-8")
+    index = build_docs_index(tmp_path)
+
+    assert index["files"] == ["a.md", "b.md"]
+    chunks = [(c["file"], c["slug"]) for c in index["chunks"]]
+    assert chunks == [(0, "walls"), (1, ""), (1, "walls")]
+    assert index["terms"] == sorted(index["terms"])
+    postings = dict(zip(index["terms"], index["postings"]))
+    assert postings["walls"] == [0, 2]
+    assert postings["wall"] == [0]
+    assert postings["intro"] == [1]
@@ -0,0 +1,219 @@
+"""Resumable PSD archive downloads against a local Range/If-Range server."""
+
+import io
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from ifc_schema import IFC_VERSIONS, REPO_ROOT, load_script  # noqa: E402
+
+dl = load_script(REPO_ROOT / "scripts" / "psd" / "download-psd.py")
+
+
+def make_zip(text, members=("Pset_A.xml",)):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name in members:
+            zf.writestr(name, text * 500)
+    return buf.getvalue()
+
+
+class ArchiveServer:
+    """Serves ``body`` with an ETag; honours Range unless If-Range is stale."""
+
+    def __init__(self):
+        self.body = make_zip("a")
+        self.etag = '"v1"'
+        self.honour_if_range = True
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                body, range_ = server.body, self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                server.requests.append((range_, if_range))
+                fresh = not server.honour_if_range or if_range in (None, server.etag)
+                if range_ and fresh:
+                    start = int(range_[len("bytes="):-1])
+                    if start >= len(body):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(body)}")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range",
+                                     f"bytes {start}-{len(body) - 1}/{len(body)}")
+                    body = body[start:]
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", server.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/IFC4_PropertySets.zip"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    with ArchiveServer() as server:
+        yield server
+
+
+@pytest.fixture
+def paths(tmp_path):
+    zip_path = tmp_path / "IFC4_PropertySets.zip"
+    return (zip_path, zip_path.with_name(zip_path.name + ".part"),
+            zip_path.with_name(zip_path.name + ".part.validator"))
+
+
+def download(server, zip_path):
+    with dl.make_session() as session:
+        return dl.download_archive(session, server.url, zip_path)
+
+
+def assert_downloaded(server, paths):
+    zip_path, part, validator = paths
+    assert zip_path.read_bytes() == server.body
+    assert not part.exists() and not validator.exists()
+
+
+def test_fresh_download(server, paths):
+    assert download(server, paths[0]) == len(server.body)
+    assert_downloaded(server, paths)
+    assert server.requests == [(None, None)]
+
+
+def test_resume_requests_only_the_tail(server, paths):
+    zip_path, part, validator = paths
+    part.write_bytes(server.body[:100])
+    validator.write_text(server.etag)
+    assert download(server, zip_path) == len(server.body)
+    assert_downloaded(server, paths)
+    assert server.requests == [("bytes=100-", server.etag)]
+
+
+def test_complete_part_file_is_kept(server, paths):
+    zip_path, part, validator = paths
+    part.write_bytes(server.body)
+    validator.write_text(server.etag)
+    download(server, zip_path)
+    assert_downloaded(server, paths)
+    assert len(server.requests) == 1
+
+
+def test_changed_archive_is_downloaded_again(server, paths):
+    zip_path, part, validator = paths
+    part.write_bytes(server.body[:100])
+    validator.write_text(server.etag)
+    server.body, server.etag = make_zip("b"), '"v2"'
+    download(server, zip_path)
+    assert_downloaded(server, paths)
+    assert server.requests == [("bytes=100-", '"v1"')]
+
+
+def test_part_file_without_validator_starts_over(server, paths):
+    zip_path, part, _ = paths
+    part.write_bytes(b"junk" * 10)
+    download(server, zip_path)
+    assert_downloaded(server, paths)
+    assert server.requests == [(None, None)]
+
+
+def test_stale_tail_is_retried_from_scratch(server, paths):
+    # A server that ignores If-Range splices the new tail onto the old head.
+    zip_path, part, validator = paths
+    server.honour_if_range = False
+    part.write_bytes(make_zip("c")[:100])
+    validator.write_text('"v0"')
+    download(server, zip_path)
+    assert_downloaded(server, paths)
+    assert server.requests == [("bytes=100-", '"v0"'), (None, None)]
+
+
+def test_non_zip_response_fails(server, paths):
+    server.body = b"<html>error</html>"
+    with pytest.raises(zipfile.BadZipFile):
+        download(server, paths[0])
+    assert not any(p.exists() for p in paths)
+
+
+def test_only_xml_members_are_extracted(tmp_path):
+    zip_path = tmp_path / "psd.zip"
+    zip_path.write_bytes(make_zip("x", members=(
+        "XML/Pset_WallCommon.xml", "XML/Qto_WallBaseQuantities.XML", "readme.txt",
+        "../escape.xml")))
+    assert dl.list_xml_members(zip_path) == [
+        "../escape.xml", "XML/Pset_WallCommon.xml", "XML/Qto_WallBaseQuantities.XML"]
+
+    extract_dir = tmp_path / "out"
+    extracted = dl.extract_xml_members(zip_path, extract_dir)
+    assert sorted(p.relative_to(extract_dir).as_posix() for p in extracted) == [
+        "XML/Pset_WallCommon.xml", "XML/Qto_WallBaseQuantities.XML"]
+    assert not (tmp_path / "escape.xml").exists()
+    assert dl.is_complete_zip(zip_path)
+    assert not dl.is_complete_zip(tmp_path / "out" / "XML" / "Pset_WallCommon.xml")
+
+
+def test_host_slot_caps_requests_per_host(monkeypatch):
+    monkeypatch.setattr(dl, "_host_slots", {})
+    active, peak, lock = {}, {}, threading.Lock()
+    all_slots_taken = threading.Event()
+
+    def request(url):
+        host = url.split("/")[2]
+        with dl.host_slot(url):
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+                if sum(active.values()) == 2 * dl.MAX_PER_HOST:
+                    all_slots_taken.set()
+            # Hold the slot until both hosts are full (the extra requests wait).
+            all_slots_taken.wait(timeout=2)
+            with lock:
+                active[host] -= 1
+
+    urls = [f"https://{host}/{i}" for host in ("a.example", "b.example")
+            for i in range(dl.MAX_PER_HOST + 1)]
+    threads = [threading.Thread(target=request, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all_slots_taken.is_set()
+    assert peak == {"a.example": dl.MAX_PER_HOST, "b.example": dl.MAX_PER_HOST}
+    assert set(dl._host_slots) == {"a.example", "b.example"}
+
+
+def test_bundles_download_concurrently_over_one_session(server, tmp_path):
+    with dl.make_session() as session, ThreadPoolExecutor() as executor:
+        futures = [executor.submit(dl.download_psd_zip, session, version, server.url, tmp_path)
+                   for version in IFC_VERSIONS]
+        results = [future.result() for future in futures]
+    assert results == [(tmp_path / f"{v}_PropertySets.zip", None) for v in IFC_VERSIONS]
+    assert all(path.read_bytes() == server.body for path, _ in results)
+    assert len(server.requests) == len(IFC_VERSIONS)
+
+
+def test_failed_download_returns_nothing(server, tmp_path):
+    server.body = b"<html>error</html>"
+    with dl.make_session() as session:
+        assert dl.download_psd_zip(session, "IFC4", server.url, tmp_path) == (None, None)
@@ -0,0 +1,87 @@
+"""Enumerated PSD properties and the enumeration index built from them."""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script
+from ifc_schema.enumerations import build_enumeration_index, write_enumeration_indexes
+
+FIXTURES_DIR = REPO_ROOT / "scripts" / "bench" / "fixtures" / "psd"
+
+
+@pytest.fixture(scope="module")
+def psd():
+    return load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+
+
+def parse_fixture(psd, name):
+    return psd.parse_psd_file((FIXTURES_DIR / name).read_bytes(), name)
+
+
+def test_enumerated_property(psd):
+    pset = parse_fixture(psd, "Pset_WallCommon.xml")
+    status = next(p for p in pset["properties"] if p["name"] == "Status")
+    assert status["dataType"] == "IFCLABEL"
+    assert status["valueKind"] == "enumerated"
+    assert status["enumerationName"] == "PEnum_ElementStatus"
+    assert status["enumeration"][:4] == ["NEW", "EXISTING", "DEMOLISH", "TEMPORARY"]
+    others = [p for p in pset["properties"] if p["name"] != "Status"]
+    assert not any("enumeration" in p for p in others)
+
+
+def test_enum_items_are_trimmed_and_deduplicated(psd):
+    prop = ET.fromstring("""
+        <PropertyDef><PropertyType><TypePropertyEnumeratedValue>
+          <EnumList name="PEnum_Test">
+            <EnumItem> A </EnumItem><EnumItem>B</EnumItem>
+            <EnumItem>A</EnumItem><EnumItem> </EnumItem>
+          </EnumList>
+        </TypePropertyEnumeratedValue></PropertyType></PropertyDef>""")
+    assert psd.parse_property_type(prop) == {
+        "dataType": "IFCLABEL", "valueKind": "enumerated",
+        "enumeration": ["A", "B"], "enumerationName": "PEnum_Test",
+    }
+
+
+def status(values, name="PEnum_ElementStatus"):
+    return {"name": "Status", "dataType": "IFCLABEL", "enumeration": values,
+            "enumerationName": name}
+
+
+def test_index_shares_lists_by_name():
+    index = build_enumeration_index("IFC4", [
+        {"name": "Pset_WallCommon", "properties": [status(["NEW", "EXISTING"]),
+                                                   {"name": "IsExternal"}]},
+        {"name": "Pset_DoorCommon", "properties": [status(["NEW", "EXISTING"])]},
+        # Same list name, different items: kept apart under the property.
+        {"name": "Pset_Odd", "properties": [status(["NEW"])]},
+        {"name": "Pset_Unnamed", "properties": [status(["X", "Y"], name=None)]},
+    ])
+    assert index == {
+        "version": "IFC4",
+        "lists": {
+            "PEnum_ElementStatus": ["NEW", "EXISTING"],
+            "Pset_Odd.Status": ["NEW"],
+            "Pset_Unnamed.Status": ["X", "Y"],
+        },
+        "properties": {
+            "PSET_DOORCOMMON": {"STATUS": "PEnum_ElementStatus"},
+            "PSET_ODD": {"STATUS": "Pset_Odd.Status"},
+            "PSET_UNNAMED": {"STATUS": "Pset_Unnamed.Status"},
+            "PSET_WALLCOMMON": {"STATUS": "PEnum_ElementStatus"},
+        },
+    }
+
+
+def test_versions_without_enumerations_get_no_file(tmp_path):
+    stale = tmp_path / "enumerations-ifc2x3.json"
+    stale.write_text("{}")
+    written = write_enumeration_indexes({
+        "IFC4": [{"name": "Pset_WallCommon", "properties": [status(["NEW"])]}],
+        "IFC2X3": [{"name": "Pset_WallCommon", "properties": [{"name": "Status"}]}],
+    }, tmp_path)
+    assert written == {"IFC4": tmp_path / "enumerations-ifc4.json"}
+    assert json.loads(written["IFC4"].read_text())["lists"] == {"PEnum_ElementStatus": ["NEW"]}
+    assert not stale.exists()
@@ -0,0 +1,103 @@
+"""The whole-run fingerprint behind generate-schema.py's no-op check."""
+
+import os
+from functools import partial
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script
+from ifc_schema.pipeline import (
+    PipelineError, read_fingerprint, tree_fingerprint, write_fingerprint,
+)
+
+
+def test_tree_fingerprint_notices_changes(tmp_path):
+    source, output = tmp_path / "gen.py", tmp_path / "out.json"
+    source.write_text("v = 1\n")
+    output.write_text("{}\n")
+
+    def current(values=None):
+        return tree_fingerprint([source], [output], values or {"tool": "1.0"})
+
+    first = current()
+    assert current() == first
+    assert current({"tool": "1.1"}) != first
+
+    # Inputs by content: touching them changes nothing.
+    os.utime(source, ns=(1, 1))
+    assert current() == first
+    source.write_text("v = 2\n")
+    changed = current()
+    assert changed != first
+
+    # Outputs by size and mtime, and whether they exist at all.
+    stat = output.stat()
+    os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert current() != changed
+    touched = current()
+    output.unlink()
+    assert current() != touched
+
+
+def test_fingerprint_file(tmp_path):
+    path = tmp_path / "cache" / "fingerprint"
+    assert read_fingerprint(path) == (None, False)
+    write_fingerprint("abc", path)
+    assert read_fingerprint(path) == ("abc", False)
+    write_fingerprint("def", path, failed=True)
+    assert path.read_text() == "def failed\n"
+    assert read_fingerprint(path) == ("def", True)
+    path.write_text("")
+    assert read_fingerprint(path) == (None, False)
+
+
+@pytest.fixture
+def generate(monkeypatch, tmp_path):
+    """generate-schema.py's main() with a fake pipeline and fingerprint."""
+    gs = load_script(REPO_ROOT / "scripts" / "generate-schema.py")
+    path = tmp_path / "fingerprint"
+    state = {"fingerprint": "inputs-1", "fail": False, "runs": 0}
+
+    def run_pipeline(stages, force=False, jobs=4):
+        state["runs"] += 1
+        if state["fail"]:
+            raise PipelineError("PSD download failed")
+        return {}
+
+    monkeypatch.setattr(gs, "read_fingerprint", partial(read_fingerprint, path))
+    monkeypatch.setattr(gs, "write_fingerprint", partial(write_fingerprint, path=path))
+    monkeypatch.setattr(gs, "run_fingerprint", lambda: state["fingerprint"])
+    monkeypatch.setattr(gs, "run_pipeline", run_pipeline)
+    monkeypatch.setattr(gs.metrics, "write_report", lambda script: None)
+    return gs.main, state
+
+
+def test_successful_runs_are_not_repeated(generate, capsys):
+    main, state = generate
+    assert main([]) == 0
+    assert main([]) == 0
+    assert state["runs"] == 1
+    assert "nothing to generate" in capsys.readouterr().out
+    assert main(["--force"]) == 0
+    assert state["runs"] == 2
+
+
+def test_failed_runs_are_remembered(generate, capsys):
+    main, state = generate
+    state["fail"] = True
+    assert main([]) == 1
+    # Same inputs: keep the committed data instead of fetching again.
+    assert main([]) == 0
+    assert state["runs"] == 1
+    assert "The last run with these inputs failed" in capsys.readouterr().out
+
+    # Changed inputs or --force try again.
+    state["fingerprint"] = "inputs-2"
+    assert main([]) == 1
+    assert main(["--force"]) == 1
+    assert state["runs"] == 3
+
+    state["fail"] = False
+    assert main(["--force"]) == 0
+    assert main([]) == 0
+    assert state["runs"] == 4
@@ -0,0 +1,72 @@
+"""Fuzzy suggestions recover names from single-edit typos."""
+
+import random
+
+import pytest
+
+from ifc_schema import GENERATED_DIR
+from ifc_schema.fuzzy import edit_distance, get_fuzzy_index
+
+VERSION = "IFC4X3_ADD2"
+
+
+@pytest.fixture(scope="module")
+def index():
+    return get_fuzzy_index(VERSION, str(GENERATED_DIR))
+
+
+def typos(name: str, rng: random.Random) -> dict[str, str]:
+    """One typo of each kind, placed inside ``name``."""
+    i = rng.randrange(1, len(name) - 2)
+    other = "q" if name[i].lower() != "q" else "z"
+    return {
+        "deletion": name[:i] + name[i + 1:],
+        "insertion": name[:i] + other + name[i:],
+        "substitution": name[:i] + other + name[i + 1:],
+        "transposition": name[:i] + name[i + 1] + name[i] + name[i + 2:],
+    }
+
+
+@pytest.mark.parametrize("kind", ["deletion", "insertion", "substitution", "transposition"])
+def test_single_edit_typos_suggest_the_name(index, kind):
+    rng = random.Random(kind)
+    names = [n for n in index.names if len(n) >= 6]
+    for name in rng.sample(names, 200):
+        typo = typos(name, rng)[kind]
+        if typo.lower() == name.lower():
+            continue  # e.g. swapping two equal letters
+        suggested = dict(index.suggest(typo, limit=10))
+        assert suggested.get(name) == 1, (typo, name, suggested)
+
+
+def test_case_only_difference_ranks_first(index):
+    assert index.suggest("pset_wallcommon", ["pset"])[0] == ("Pset_WallCommon", 0)
+    assert index.suggest("IFCWALL", ["entity"])[0] == ("IfcWall", 0)
+
+
+def test_kinds_filter(index):
+    assert all(name.startswith("Pset_") or name.startswith("Qto_")
+               for name, _ in index.suggest("Pset_WalCommon", ["pset"]))
+    assert "IfcWall" not in dict(index.suggest("IfcWal", ["pset"]))
+    assert "IfcWall" in dict(index.suggest("IfcWal", ["entity"]))
+
+
+def test_unrelated_names_suggest_nothing(index):
+    assert index.suggest("Xyzzy_Plugh_Frobnicate") == []
+    assert index.suggest("   ") == []
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("wall", "wall", 0),
+    ("wall", "wal", 1),
+    ("wall", "walls", 1),
+    ("wall", "wsll", 1),
+    ("wall", "wlal", 1),
+    ("pset_wallcommon", "pset_walcomon", 2),
+    ("abc", "xyz", 3),
+])
+def test_edit_distance(a, b, distance):
+    assert edit_distance(a, b, 3) == distance
+    assert edit_distance(b, a, 3) == distance
+    # Past the limit the distance is cut off at limit + 1.
+    assert edit_distance(a, b, 0) == min(distance, 1)
@@ -0,0 +1,110 @@
+"""iter_specifications(): IDS XML to spec dicts, one specification at a time."""
+
+import io
+
+import pytest
+
+from ifc_schema.ids_reader import IdsParseError, iter_specifications
+
+SPEC = """
+    <ids:specification name="Spec {n}" ifcVersion="IFC4 IFC4X3_ADD2" identifier="S{n}">
+      <ids:applicability minOccurs="1" maxOccurs="unbounded">
+        <ids:entity>
+          <ids:name><ids:simpleValue>IFCWALL</ids:simpleValue></ids:name>
+          <ids:predefinedType>
+            <xs:restriction base="xs:string">
+              <xs:enumeration value="SOLIDWALL"/>
+              <xs:enumeration value="PARTITIONING"/>
+            </xs:restriction>
+          </ids:predefinedType>
+        </ids:entity>
+      </ids:applicability>
+      <ids:requirements>
+        <ids:property dataType="IfcBoolean" cardinality="required">
+          <ids:propertySet><ids:simpleValue>Pset_WallCommon</ids:simpleValue></ids:propertySet>
+          <ids:baseName><ids:simpleValue> IsExternal </ids:simpleValue></ids:baseName>
+        </ids:property>
+        <ids:partOf relation="IFCRELAGGREGATES">
+          <ids:entity>
+            <ids:name><ids:simpleValue>IFCBUILDINGSTOREY</ids:simpleValue></ids:name>
+          </ids:entity>
+        </ids:partOf>
+        <ids:attribute>
+          <ids:name><ids:simpleValue>Name</ids:simpleValue></ids:name>
+          <ids:value>
+            <xs:restriction base="xs:string"><xs:pattern value="W-.*"/></xs:restriction>
+          </ids:value>
+        </ids:attribute>
+      </ids:requirements>
+    </ids:specification>"""
+
+HEAD = """<?xml version="1.0" encoding="UTF-8"?>
+<ids:ids xmlns:ids="http://standards.buildingsmart.org/IDS"
+         xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <ids:info><ids:title>reader test</ids:title></ids:info>
+  <ids:specifications>"""
+
+TAIL = """
+  </ids:specifications>
+</ids:ids>
+"""
+
+
+def document(count: int) -> bytes:
+    return (HEAD + "".join(SPEC.format(n=n) for n in range(count)) + TAIL).encode()
+
+
+def test_specification_dict():
+    [spec] = list(iter_specifications(io.BytesIO(document(1))))
+    assert spec == {
+        "name": "Spec 0",
+        "identifier": "S0",
+        "ifcVersion": ["IFC4", "IFC4X3_ADD2"],
+        "applicabilityMinOccurs": "1",
+        "applicabilityMaxOccurs": "unbounded",
+        "applicability": [{
+            "facet": "entity",
+            "name": "IFCWALL",
+            "predefinedType": {"base": "xs:string", "enumeration": ["SOLIDWALL", "PARTITIONING"]},
+        }],
+        "requirements": [
+            {"facet": "property", "propertySet": "Pset_WallCommon", "baseName": "IsExternal",
+             "dataType": "IFCBOOLEAN", "cardinality": "required"},
+            {"facet": "partOf", "relation": "IFCRELAGGREGATES",
+             "entity": {"facet": "entity", "name": "IFCBUILDINGSTOREY"}},
+            {"facet": "attribute", "name": "Name",
+             "value": {"base": "xs:string", "pattern": "W-.*"}},
+        ],
+    }
+
+
+def test_default_namespace_is_accepted(tmp_path):
+    path = tmp_path / "plain.ids"
+    path.write_bytes(document(2).replace(b"ids:", b"").replace(b"xmlns:ids=", b"xmlns="))
+    assert [s["name"] for s in iter_specifications(path)] == ["Spec 0", "Spec 1"]
+
+
+def test_specifications_are_yielded_while_reading():
+    # A truncated file still yields every complete specification before the
+    # parse error, so nothing waits for the end of the document.
+    data = document(3)
+    specs = iter_specifications(io.BytesIO(data[:data.index(b'name="Spec 2"') + 40]))
+    assert next(specs)["name"] == "Spec 0"
+    assert next(specs)["name"] == "Spec 1"
+    with pytest.raises(IdsParseError):
+        next(specs)
+
+
+def test_many_specifications():
+    names = [s["identifier"] for s in iter_specifications(io.BytesIO(document(500)))]
+    assert names == [f"S{n}" for n in range(500)]
+
+
+@pytest.mark.parametrize("data", [
+    b"<schema><specifications/></schema>",
+    b"not xml at all",
+    b"",
+])
+def test_not_an_ids_document(data):
+    with pytest.raises(IdsParseError):
+        list(iter_specifications(io.BytesIO(data)))
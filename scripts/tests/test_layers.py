@@ -0,0 +1,113 @@
+"""merge_layers(): re-applying the deltas reproduces the merged sets."""
+
+import copy
+import json
+
+from ifc_schema.layers import merge_layers, write_layer_deltas
+
+BASE = {
+    "IFC4": [
+        {"name": "Pset_WallCommon", "applicableEntities": ["IFCWALL"],
+         "templateType": "PSET_TYPEDRIVENOVERRIDE",
+         "properties": [{"name": "IsExternal", "dataType": "IFCBOOLEAN"},
+                        {"name": "Status", "dataType": "IFCLABEL"}]},
+        {"name": "Pset_DoorCommon", "applicableEntities": ["IFCDOOR"],
+         "properties": [{"name": "FireRating", "dataType": "IFCLABEL"}]},
+    ],
+    "IFC2X3": [
+        {"name": "Pset_WallCommon", "applicableEntities": ["IFCWALL"],
+         "properties": [{"name": "IsExternal", "dataType": "IFCBOOLEAN"}]},
+    ],
+}
+
+CURATED = {
+    "IFC4": [
+        # Replaces one property, adds another and changes a key.
+        {"name": "Pset_WallCommon", "templateType": "PSET_OCCURRENCEDRIVEN",
+         "properties": [{"name": "Status", "dataType": "IFCIDENTIFIER"},
+                        {"name": "AcousticRating", "dataType": "IFCLABEL"}]},
+        # Identical to the base: no delta.
+        {"name": "Pset_DoorCommon", "properties": [{"name": "FireRating", "dataType": "IFCLABEL"}]},
+        {"name": "Pset_AcmeWall", "applicableEntities": ["IFCWALL"],
+         "properties": [{"name": "Batch", "dataType": "IFCINTEGER"}]},
+        # A duplicate in the same layer only adds properties.
+        {"name": "Pset_AcmeWall", "properties": [{"name": "Batch", "dataType": "IFCLABEL"},
+                                                 {"name": "Supplier", "dataType": "IFCLABEL"}]},
+    ],
+}
+
+CUSTOM = {
+    "IFC4": [
+        # Name-only properties never replace a typed one.
+        {"name": "Pset_AcmeWall", "properties": [{"name": "Batch"}, {"name": "Colour"}]},
+        {"name": "Pset_Custom", "properties": [{"name": "Note"}]},
+    ],
+    "IFC2X3": [
+        {"name": "Pset_WallCommon", "properties": [{"name": "IsExternal", "dataType": "IFCLABEL"}]},
+    ],
+}
+
+LAYERS = [("psd", BASE), ("curated", CURATED), ("custom", CUSTOM)]
+
+
+def by_name(psets):
+    return {p["name"]: p for p in psets}
+
+
+def test_merge():
+    merged, _ = merge_layers(LAYERS)
+    ifc4 = by_name(merged["IFC4"])
+
+    wall = ifc4["Pset_WallCommon"]
+    assert wall["templateType"] == "PSET_OCCURRENCEDRIVEN"
+    assert wall["applicableEntities"] == ["IFCWALL"]
+    assert wall["properties"] == [{"name": "IsExternal", "dataType": "IFCBOOLEAN"},
+                                  {"name": "Status", "dataType": "IFCIDENTIFIER"},
+                                  {"name": "AcousticRating", "dataType": "IFCLABEL"}]
+    assert ifc4["Pset_AcmeWall"]["properties"] == [{"name": "Batch", "dataType": "IFCINTEGER"},
+                                                   {"name": "Supplier", "dataType": "IFCLABEL"},
+                                                   {"name": "Colour", "dataType": "IFCLABEL"}]
+    assert ifc4["Pset_Custom"] == {"name": "Pset_Custom", "applicableEntities": [],
+                                   "properties": [{"name": "Note", "dataType": "IFCLABEL"}]}
+    assert by_name(merged["IFC2X3"])["Pset_WallCommon"]["properties"] == [
+        {"name": "IsExternal", "dataType": "IFCLABEL"}]
+
+
+def test_inputs_are_not_modified():
+    layers = copy.deepcopy(LAYERS)
+    merge_layers(layers)
+    assert layers == LAYERS
+
+
+def test_deltas_only_hold_changes():
+    _, deltas = merge_layers(LAYERS)
+    curated = by_name(deltas["curated"]["IFC4"])
+    assert "Pset_DoorCommon" not in curated
+    assert curated["Pset_WallCommon"] == {
+        "name": "Pset_WallCommon", "templateType": "PSET_OCCURRENCEDRIVEN",
+        "properties": [{"name": "Status", "dataType": "IFCIDENTIFIER"},
+                       {"name": "AcousticRating", "dataType": "IFCLABEL"}]}
+    assert "IFC2X3" not in deltas["curated"]
+
+
+def test_deltas_reproduce_the_merge():
+    merged, deltas = merge_layers(LAYERS)
+    replayed, _ = merge_layers([("psd", BASE), *((name, deltas[name]) for name, _ in LAYERS[1:])])
+    assert replayed == merged
+
+
+def test_written_deltas_reproduce_the_merge(tmp_path):
+    merged, deltas = merge_layers(LAYERS)
+    paths = write_layer_deltas(LAYERS, deltas, tmp_path)
+    assert [p.name for p in paths] == ["pset-layer-curated.json", "pset-layer-custom.json"]
+
+    written = []
+    for path in paths:
+        data = json.loads(path.read_text())
+        written.append((data["layer"], data["versions"]))
+    replayed, _ = merge_layers([("psd", BASE), *written])
+    # Written deltas are sorted by name, so compare the sets, not their order.
+    def sets(by_version):
+        return {version: by_name(psets) for version, psets in by_version.items()}
+
+    assert sets(replayed) == sets(merged)
@@ -0,0 +1,89 @@
+"""Localized PSD texts are split out of the psets into per-locale packs."""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script
+from ifc_schema.locales import (
+    locale_of, locale_pack_files, localized_texts, split_localizations, write_locale_packs,
+)
+
+FIXTURES_DIR = REPO_ROOT / "scripts" / "bench" / "fixtures" / "psd"
+
+
+@pytest.fixture(scope="module")
+def psd():
+    return load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+
+
+def test_localized_texts():
+    elem = ET.fromstring("""
+        <PropertyDef>
+          <Definition> Reference ID. </Definition>
+          <NameAliases>
+            <NameAlias lang="de-DE">Bauteiltyp</NameAlias>
+            <NameAlias lang="de-DE">Zweiter Name</NameAlias>
+            <NameAlias lang="not a locale!">Nope</NameAlias>
+            <NameAlias lang="fr-FR">  </NameAlias>
+          </NameAliases>
+          <DefinitionAliases><DefinitionAlias lang="de-DE">Bezeichnung</DefinitionAlias>
+          </DefinitionAliases>
+        </PropertyDef>""")
+    assert localized_texts(elem) == {
+        "en": {"definition": "Reference ID."},
+        "de-DE": {"name": "Bauteiltyp", "definition": "Bezeichnung"},
+    }
+
+
+def test_parsed_psets_carry_their_translations(psd):
+    pset = psd.parse_psd_file((FIXTURES_DIR / "Pset_WallCommon.xml").read_bytes(),
+                              "Pset_WallCommon.xml")
+    texts = pset["localizations"]
+    assert set(texts) == {"en", "en-GB", "de-DE", "fr-FR"}
+    assert texts["de-DE"]["properties"]["Reference"]["name"] == "Bauteiltyp"
+    assert texts["fr-FR"]["properties"]["Reference"]["name"] == "Référence"
+    assert "definition" in texts["en"]["properties"]["Status"]
+    # None of it stays on the properties every client downloads.
+    assert not any("definition" in p or "localizations" in p for p in pset["properties"])
+
+
+def test_split_localizations_first_wins():
+    psets = [
+        {"name": "Pset_A", "localizations": {
+            "de-DE": {"name": "A", "properties": {"P": {"name": "P1"}}},
+            "en": {"definition": "first"}}},
+        {"name": "Pset_A", "localizations": {
+            "de-DE": {"name": "A2", "definition": "added",
+                      "properties": {"P": {"name": "P2", "definition": "d"}}},
+            "en": {"definition": "second"}}},
+        {"name": "Pset_B"},
+    ]
+    packs = split_localizations(psets)
+    assert packs == {
+        "de-DE": {"Pset_A": {"name": "A", "definition": "added",
+                             "properties": {"P": {"name": "P1", "definition": "d"}}}},
+        "en": {"Pset_A": {"definition": "first"}},
+    }
+    assert all("localizations" not in p for p in psets)
+
+
+def test_packs_are_written_sorted_and_pruned(tmp_path):
+    (tmp_path / "psd-locale-it-IT.json").write_text("{}")
+    written = write_locale_packs({
+        "de-DE": {"Pset_B": {"name": "B"},
+                  "Pset_A": {"properties": {"Z": {"name": "z"}, "Y": {"definition": "y"}}}},
+        "en": {"Pset_A": {"definition": "A"}},
+    }, tmp_path)
+    assert written == [tmp_path / "psd-locale-de-DE.json", tmp_path / "psd-locale-en.json"]
+    assert locale_pack_files(tmp_path) == written
+    assert [locale_of(p) for p in written] == ["de-DE", "en"]
+
+    pack = json.loads((tmp_path / "psd-locale-de-DE.json").read_text())
+    assert pack["locale"] == "de-DE"
+    assert list(pack["propertySets"]) == ["Pset_A", "Pset_B"]
+    assert list(pack["propertySets"]["Pset_A"]["properties"]) == ["Y", "Z"]
+
+    write_locale_packs({"en": {"Pset_A": {"definition": "A"}}}, tmp_path)
+    assert [p.name for p in locale_pack_files(tmp_path)] == ["psd-locale-en.json"]
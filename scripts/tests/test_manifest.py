@@ -0,0 +1,80 @@
+"""Content-hashed copies, the manifest, and pruning old generations."""
+
+import hashlib
+import json
+
+from ifc_schema import PUBLIC_GENERATED_DIR
+from ifc_schema.manifest import (
+    MANIFEST_NAME, URL_PREFIX, hashed_name, is_hashed_name, prune_superseded, read_manifest,
+    superseded_files, write_manifest,
+)
+
+
+def hashed(path):
+    return f"{path.stem}.{hashlib.sha256(path.read_bytes()).hexdigest()[:10]}.json"
+
+
+def publish(public, **files):
+    for name, data in files.items():
+        (public / f"{name}.json").write_text(json.dumps(data))
+    return write_manifest(public)
+
+
+def test_hashed_names(tmp_path):
+    path = tmp_path / "entities-ifc4.json"
+    path.write_text("[]")
+    assert hashed_name(path) == hashed(path)
+    assert is_hashed_name(hashed_name(path))
+    assert not is_hashed_name("entities-ifc4.json")
+    assert not is_hashed_name("schema-index.12345.json")
+
+
+def test_manifest_maps_every_file(tmp_path):
+    manifest = publish(tmp_path, entities=[1], fuzzy={"names": []})
+    assert manifest == read_manifest(tmp_path)
+    assert manifest["files"] == {
+        "entities.json": URL_PREFIX + hashed(tmp_path / "entities.json"),
+        "fuzzy.json": URL_PREFIX + hashed(tmp_path / "fuzzy.json"),
+    }
+    for name, url in manifest["files"].items():
+        copy = tmp_path / url.removeprefix(URL_PREFIX)
+        assert copy.read_bytes() == (tmp_path / name).read_bytes()
+    # Neither the manifest nor the hashed copies get hashed copies of their own.
+    assert len(list(tmp_path.glob("*.json"))) == 5
+
+
+def test_previous_generation_is_kept_until_pruned(tmp_path):
+    first = publish(tmp_path, entities=[1])["files"]["entities.json"]
+    second = publish(tmp_path, entities=[2])["files"]["entities.json"]
+    third = publish(tmp_path, entities=[3])["files"]["entities.json"]
+    names = {p.name for p in tmp_path.glob("entities.*.json")}
+    # Clients holding the previous manifest still find their files.
+    assert names == {second.removeprefix(URL_PREFIX), third.removeprefix(URL_PREFIX)}
+    assert first.removeprefix(URL_PREFIX) not in names
+
+    assert superseded_files(tmp_path) == [tmp_path / second.removeprefix(URL_PREFIX)]
+    assert prune_superseded(tmp_path) == [tmp_path / second.removeprefix(URL_PREFIX)]
+    assert superseded_files(tmp_path) == []
+    assert {p.name for p in tmp_path.glob("entities.*.json")} == {third.removeprefix(URL_PREFIX)}
+
+
+def test_unchanged_content_keeps_its_url(tmp_path):
+    first = publish(tmp_path, entities=[1])
+    assert publish(tmp_path)["files"] == first["files"]
+    assert superseded_files(tmp_path) == []
+
+
+def test_missing_or_broken_manifest(tmp_path):
+    assert read_manifest(tmp_path) == {}
+    (tmp_path / MANIFEST_NAME).write_text("{not json")
+    assert read_manifest(tmp_path) == {}
+    (tmp_path / "stray.0123456789.json").write_text("{}")
+    assert superseded_files(tmp_path) == [tmp_path / "stray.0123456789.json"]
+
+
+def test_committed_manifest_is_complete():
+    manifest = read_manifest(PUBLIC_GENERATED_DIR)
+    for name, url in manifest["files"].items():
+        assert url == URL_PREFIX + hashed(PUBLIC_GENERATED_DIR / name)
+        assert (PUBLIC_GENERATED_DIR / url.removeprefix(URL_PREFIX)).exists()
+    assert superseded_files(PUBLIC_GENERATED_DIR) == []
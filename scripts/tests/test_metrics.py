@@ -0,0 +1,173 @@
+"""Run metrics, and the PSD fetch retries they count."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script, metrics
+from ifc_schema.metrics import RunMetrics, to_openmetrics
+
+
+def test_stages_and_counters():
+    run = RunMetrics()
+    for _ in range(3):
+        with run.stage("parse"):
+            pass
+    with pytest.raises(ValueError):
+        with run.stage("write"):
+            raise ValueError
+    run.incr("http.bytes", 100)
+    run.incr("http.bytes", 28)
+    for hit in (True, True, True, False):
+        run.cache("psd_file_list", hit)
+    run.cache("never_hit", False)
+
+    report = run.report()
+    assert report["stages"]["parse"]["calls"] == 3
+    # A failing stage is timed too.
+    assert report["stages"]["write"]["calls"] == 1
+    assert report["counters"]["http.bytes"] == 128
+    assert report["cacheHitRates"] == {"never_hit": 0.0, "psd_file_list": 0.75}
+    assert list(report["counters"]) == sorted(report["counters"])
+
+
+def test_counters_are_thread_safe():
+    run = RunMetrics()
+
+    def work():
+        for _ in range(1000):
+            run.incr("n")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert run.counters["n"] == 8000
+
+
+def test_write_report_merges_sections(tmp_path, monkeypatch):
+    path = tmp_path / "reports" / "run.json"
+    monkeypatch.delenv(metrics.REPORT_ENV, raising=False)
+    monkeypatch.delenv(metrics.OPENMETRICS_ENV, raising=False)
+    assert metrics.write_report("nothing") is None
+
+    path.parent.mkdir()
+    other = RunMetrics().report()
+    path.write_text(json.dumps({"scripts": {"download-psd": other}}))
+    monkeypatch.setenv(metrics.REPORT_ENV, str(path))
+    monkeypatch.setenv(metrics.OPENMETRICS_ENV, str(tmp_path / "run.prom"))
+    assert metrics.write_report("generate-schema") == path
+
+    report = json.loads(path.read_text())
+    assert report["scripts"]["download-psd"] == other
+    assert set(report["scripts"]["generate-schema"]) == {
+        "startedAt", "durationSeconds", "stages", "counters", "cacheHitRates"}
+    prom = (tmp_path / "run.prom").read_text()
+    assert 'schema_script_duration_seconds{script="download-psd"}' in prom
+    assert 'schema_script_duration_seconds{script="generate-schema"}' in prom
+
+
+def test_openmetrics():
+    text = to_openmetrics({"scripts": {'gen"x': {
+        "durationSeconds": 1.5,
+        "stages": {"parse": {"seconds": 0.25, "calls": 2}},
+        "counters": {"http.retries": 3},
+        "cacheHitRates": {"psd_file_list": 0.5},
+    }}})
+    assert 'schema_script_duration_seconds{script="gen\\"x"} 1.5' in text
+    assert 'schema_stage_duration_seconds{script="gen\\"x",stage="parse"} 0.25' in text
+    assert 'schema_events_total{script="gen\\"x",name="http.retries"} 3' in text
+    assert 'schema_cache_hit_ratio{script="gen\\"x",cache="psd_file_list"} 0.5' in text
+    assert text.endswith("# EOF\n")
+
+
+@pytest.fixture(scope="module")
+def psd():
+    return load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+
+
+class ScriptedServer:
+    """Answers ``/<name>`` with the next status from ``responses[name]``."""
+
+    def __init__(self, responses: dict[str, list[int]]):
+        self.responses = responses
+        self.requests: list[str] = []
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                name = self.path.lstrip("/")
+                outer.requests.append(name)
+                queue = outer.responses.get(name) or [404]
+                status = queue.pop(0) if len(queue) > 1 else queue[0]
+                body = b"<PropertySetDef/>" if status == 200 else b"nope"
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def server(psd, monkeypatch):
+    servers = []
+
+    def start(responses):
+        servers.append(ScriptedServer(responses))
+        monkeypatch.setattr(psd, "GITHUB_RAW_BASE", servers[-1].url)
+        return servers[-1]
+
+    monkeypatch.setattr(psd.time, "sleep", lambda seconds: None)
+    yield start
+    for s in servers:
+        s.close()
+
+
+def counter(name):
+    return metrics.get_metrics().counters.get(name, 0)
+
+
+def test_transient_errors_are_retried(psd, server):
+    s = server({"a.xml": [503, 429, 200], "b.xml": [500]})
+    retries = counter("http.retries")
+    assert psd.fetch_psd_xml("a.xml") == "<PropertySetDef/>"
+    assert s.requests == ["a.xml"] * 3
+    assert counter("http.retries") == retries + 2
+
+    # Still failing after the retries: skipped, not fatal.
+    assert psd.fetch_psd_xml("b.xml") is None
+    assert s.requests.count("b.xml") == psd.FETCH_RETRIES + 1
+
+
+def test_permanent_errors_abort(psd, server):
+    s = server({"gone.xml": [404]})
+    with pytest.raises(psd.FetchAborted, match="gone.xml"):
+        psd.fetch_psd_xml("gone.xml")
+    assert s.requests == ["gone.xml"]
+
+
+def test_is_transient(psd):
+    def http(code):
+        return HTTPError("http://x", code, "", {}, None)
+
+    assert psd.is_transient(http(503))
+    assert psd.is_transient(http(429))
+    assert not psd.is_transient(http(404))
+    assert not psd.is_transient(http(403))
+    assert psd.is_transient(TimeoutError())
+    assert psd.is_transient(URLError(TimeoutError()))
+    assert not psd.is_transient(URLError(ConnectionRefusedError()))
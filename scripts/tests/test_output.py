@@ -0,0 +1,128 @@
+"""Atomic, hash-aware writes and publishing to public/generated."""
+
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+from ifc_schema import output
+from ifc_schema.output import (
+    file_info, publish_file, publish_target, remove_output, write_bytes, write_json,
+)
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """Point lib/generated and public/generated at scratch directories."""
+    generated, public = tmp_path / "lib", tmp_path / "public"
+    generated.mkdir()
+    monkeypatch.setattr(output, "GENERATED_DIR", generated)
+    monkeypatch.setattr(output, "PUBLIC_GENERATED_DIR", public)
+    return generated, public
+
+
+def test_write_bytes_skips_identical_content(tmp_path):
+    path = tmp_path / "sub" / "a.json"
+    assert write_bytes(path, b"one") is True
+    mtime = path.stat().st_mtime_ns
+    os.utime(path, ns=(mtime - 10**9, mtime - 10**9))
+    assert write_bytes(path, b"one") is False
+    assert path.stat().st_mtime_ns == mtime - 10**9
+    assert write_bytes(path, b"two!") is True
+    assert path.read_bytes() == b"two!"
+    assert not [p for p in path.parent.iterdir() if p.name != "a.json"]
+
+
+def test_write_replaces_instead_of_truncating(tmp_path):
+    # A reader holding the old file keeps reading the old content.
+    path = tmp_path / "a.json"
+    write_bytes(path, b"old content")
+    with open(path, "rb") as reader:
+        write_bytes(path, b"new")
+        assert reader.read() == b"old content"
+    assert path.read_bytes() == b"new"
+
+
+def test_failed_write_leaves_the_target(tmp_path, monkeypatch):
+    path = tmp_path / "a.json"
+    write_bytes(path, b"committed")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(output.os, "replace", fail)
+    with pytest.raises(OSError):
+        write_bytes(path, b"half")
+    assert path.read_bytes() == b"committed"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.json"]
+
+
+def test_concurrent_readers_never_see_partial_files(tmp_path):
+    path = tmp_path / "a.json"
+    versions = [json.dumps({"n": n, "pad": "x" * 50_000 * (n % 3)}).encode() for n in range(30)]
+    write_bytes(path, versions[0])
+    seen, done = set(), threading.Event()
+
+    def read():
+        while not done.is_set():
+            seen.add(path.read_bytes())
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for data in versions:
+        write_bytes(path, data)
+    done.set()
+    reader.join()
+    assert seen <= set(versions)
+
+
+@pytest.mark.parametrize("kwargs, text", [
+    ({}, '{\n  "b": [\n    1,\n    2\n  ],\n  "a": "\\u00e9"\n}\n'),
+    ({"compact": True}, '{"b":[1,2],"a":"\\u00e9"}\n'),
+    ({"indent": None, "trailing_newline": False}, '{"b": [1, 2], "a": "\\u00e9"}'),
+])
+def test_write_json_formats(tmp_path, kwargs, text):
+    path = tmp_path / "a.json"
+    write_json(path, {"b": [1, 2], "a": "é"}, **kwargs)
+    assert path.read_text() == text
+
+
+def test_file_info(tmp_path):
+    path = tmp_path / "a.json"
+    write_bytes(path, b"abc")
+    expected = {"sha256": hashlib.sha256(b"abc").hexdigest(), "bytes": 3}
+    assert file_info(path) == expected
+    # Remembered from the write: not read back.
+    path.write_bytes(b"changed behind our back")
+    assert file_info(path) == expected
+    assert file_info(tmp_path / "missing.json") is None
+    other = tmp_path / "other.json"
+    other.write_bytes(b"xyz")
+    assert file_info(other)["bytes"] == 3
+
+
+def test_publishing(dirs):
+    generated, public = dirs
+    path = generated / "entities-ifc4.json"
+    assert publish_target(path) == public / "entities-ifc4.json"
+    assert publish_target(generated.parent / "elsewhere.json") is None
+
+    write_json(path, [1])
+    assert (public / path.name).read_bytes() == path.read_bytes()
+    write_json(path, [1, 2])
+    assert json.loads((public / path.name).read_text()) == [1, 2]
+    write_json(generated / "private.json", [3], publish=False)
+    assert not (public / "private.json").exists()
+
+    # Nothing to do when the target already matches.
+    assert publish_file(path, public / path.name) is False
+    (public / path.name).unlink()
+    (public / path.name).write_bytes(b"drifted")
+    assert publish_file(path, public / path.name) is True
+    assert (public / path.name).read_bytes() == path.read_bytes()
+
+    assert remove_output(path) is True
+    assert not path.exists() and not (public / path.name).exists()
+    assert remove_output(path) is False
@@ -0,0 +1,159 @@
+"""run_pipeline(): dependency order, failure propagation and incremental skips."""
+
+import io
+import threading
+
+import pytest
+
+from ifc_schema.pipeline import PipelineError, Stage, StageOutput, run_pipeline, topological_order
+
+
+def run(stages, tmp_path, **kwargs):
+    log = []
+    results = run_pipeline(stages, state_file=tmp_path / "state.json", log=log.append, **kwargs)
+    return results, log
+
+
+def test_results_flow_along_dependencies(tmp_path):
+    stages = [
+        Stage("total", lambda r: r["a"] + r["b"], deps=("a", "b")),
+        Stage("a", lambda r: 1),
+        Stage("b", lambda r: r["a"] * 10, deps=("a",)),
+    ]
+    results, _ = run(stages, tmp_path)
+    assert results == {"a": 1, "b": 10, "total": 11}
+
+
+def test_independent_stages_run_concurrently(tmp_path):
+    # Each stage waits for the other; only concurrent execution finishes.
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [Stage(name, lambda r: barrier.wait() is not None) for name in ("x", "y")]
+    results, _ = run(stages, tmp_path, jobs=2)
+    assert results == {"x": True, "y": True}
+
+
+def test_failure_skips_dependents_only(tmp_path):
+    ran = []
+
+    def fail(_):
+        raise RuntimeError("offline")
+
+    stages = [
+        Stage("fetch", fail),
+        Stage("parse", lambda r: ran.append("parse"), deps=("fetch",)),
+        Stage("index", lambda r: ran.append("index"), deps=("parse", "other")),
+        Stage("other", lambda r: ran.append("other")),
+        Stage("after_other", lambda r: ran.append("after_other"), deps=("other",)),
+    ]
+    log = []
+    with pytest.raises(PipelineError, match="Stage\\(s\\) failed: fetch") as excinfo:
+        run_pipeline(stages, state_file=tmp_path / "state.json", log=log.append)
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+    assert sorted(ran) == ["after_other", "other"]
+    assert "❌ fetch: offline" in log
+    assert "⏭️  parse: skipped (dependency failed)" in log
+    assert "⏭️  index: skipped (dependency failed)" in log
+
+
+@pytest.mark.parametrize("stages, message", [
+    ([Stage("a", None, deps=("b",)), Stage("b", None, deps=("a",))], "cycle"),
+    ([Stage("a", None, deps=("missing",))], "unknown stage 'missing'"),
+])
+def test_malformed_graphs(stages, message):
+    with pytest.raises(PipelineError, match=message):
+        topological_order(stages)
+
+
+class FileStage:
+    """An incremental stage writing ``<name>.txt`` from its inputs."""
+
+    def __init__(self, tmp_path, name, deps=(), value=lambda r: "v1"):
+        self.path = tmp_path / f"{name}.txt"
+        self.value = value
+        self.runs = 0
+        self.stage = Stage(name, self.write, deps=deps, inputs=lambda r: [self.value(r)],
+                           outputs=lambda: [self.path], load=self.path.read_text)
+
+    def write(self, results):
+        self.runs += 1
+        text = self.value(results)
+        self.path.write_text(text)
+        return text
+
+
+def test_unchanged_stages_are_skipped(tmp_path):
+    source = FileStage(tmp_path, "source")
+    derived = FileStage(tmp_path, "derived", deps=("source",), value=lambda r: r["source"] + "!")
+    stages = [source.stage, derived.stage]
+
+    results, _ = run(stages, tmp_path)
+    results, log = run(stages, tmp_path)
+    assert results == {"source": "v1", "derived": "v1!"}
+    assert (source.runs, derived.runs) == (1, 1)
+    assert "✅ derived: unchanged, skipped" in log
+
+    # An output edited by hand makes its stage run again...
+    source.path.write_text("edited")
+    run(stages, tmp_path)
+    assert (source.runs, derived.runs) == (2, 1)
+    # ...and so does a changed input, which then also reaches the dependents.
+    source.value = lambda r: "v2"
+    results, _ = run(stages, tmp_path)
+    assert results["derived"] == "v2!"
+    assert (source.runs, derived.runs) == (3, 2)
+
+
+def test_force(tmp_path):
+    a, b = FileStage(tmp_path, "a"), FileStage(tmp_path, "b")
+    run([a.stage, b.stage], tmp_path)
+    run([a.stage, b.stage], tmp_path, force={"b"})
+    assert (a.runs, b.runs) == (1, 2)
+    run([a.stage, b.stage], tmp_path, force=True)
+    assert (a.runs, b.runs) == (2, 3)
+
+
+def test_identical_rerun_keeps_dependents(tmp_path):
+    # A forced re-run that reproduces the same bytes doesn't invalidate
+    # the stages that depend on it.
+    source = FileStage(tmp_path, "source")
+    derived = FileStage(tmp_path, "derived", deps=("source",), value=lambda r: r["source"])
+    run([source.stage, derived.stage], tmp_path)
+    run([source.stage, derived.stage], tmp_path, force={"source"})
+    assert (source.runs, derived.runs) == (2, 1)
+
+
+def test_stage_output_prefixes_whole_lines():
+    target = io.StringIO()
+    out = StageOutput(target)
+    with out.stage("parse"):
+        out.write("first ")
+        out.write("line\nsecond")
+        out.write("\n\n")
+        out.write("unterminated")
+    out.write("plain\n")
+    out.write("prompt> ")
+    out.flush()
+    assert target.getvalue() == ("[parse] first line\n[parse] second\n\n"
+                                 "[parse] unterminated\nplain\nprompt> ")
+
+
+def test_stage_output_keeps_threads_apart():
+    target = io.StringIO()
+    out = StageOutput(target)
+
+    def stage(name):
+        with out.stage(name):
+            for i in range(200):
+                out.write(f"{name} ")
+                out.write(f"{i}\n")
+
+    threads = [threading.Thread(target=stage, args=(n,)) for n in ("a", "b", "c")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lines = target.getvalue().splitlines()
+    assert len(lines) == 600
+    for line in lines:
+        prefix, name, number = line.split()
+        assert prefix == f"[{name}]" and number.isdigit()
@@ -0,0 +1,72 @@
+"""Parsing the official PSD bundles straight from their zip archives."""
+
+import zipfile
+
+import pytest
+
+from ifc_schema import IFC_VERSIONS, REPO_ROOT, load_script
+
+FIXTURES_DIR = REPO_ROOT / "scripts" / "bench" / "fixtures" / "psd"
+
+WALL = ["Pset_WallCommon.xml", "Qto_WallBaseQuantities.xml"]
+
+
+@pytest.fixture(scope="module")
+def psd():
+    return load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+
+
+def write_bundle(path, names, extra=None):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            zf.write(FIXTURES_DIR / name, f"XML/{name}")
+        for name, data in (extra or {}).items():
+            zf.writestr(name, data)
+    return path
+
+
+def test_parse_archive(psd, tmp_path):
+    zip_path = write_bundle(tmp_path / "IFC4_PropertySets.zip", reversed(WALL), {
+        "XML/readme.txt": "not a PSD",
+        "XML/Broken.xml": "<PropertySetDef>",
+    })
+    parsed, failed = psd.parse_archive(zip_path, workers=2)
+    assert [p["name"] for p in parsed] == ["Pset_WallCommon", "Qto_WallBaseQuantities"]
+    assert failed == ["XML/Broken.xml"]
+    assert parsed[0] == psd.parse_psd_file((FIXTURES_DIR / WALL[0]).read_bytes(),
+                                           f"XML/{WALL[0]}")
+
+
+def test_find_archives_needs_every_bundle(psd, tmp_path):
+    for version in IFC_VERSIONS[:-1]:
+        write_bundle(psd.archive_path(version, tmp_path), WALL)
+    assert psd.find_archives(tmp_path) == {}
+
+    write_bundle(psd.archive_path(IFC_VERSIONS[-1], tmp_path), WALL)
+    assert psd.find_archives(tmp_path) == {
+        v: tmp_path / f"{v}_PropertySets.zip" for v in IFC_VERSIONS}
+
+
+def test_each_version_gets_its_own_bundle(psd, tmp_path):
+    archives = {
+        "IFC2X3": write_bundle(tmp_path / "IFC2X3.zip", WALL),
+        "IFC4": write_bundle(tmp_path / "IFC4.zip", WALL + ["Pset_PumpTypeCommon.xml"]),
+        "IFC4X3_ADD2": write_bundle(tmp_path / "IFC4X3_ADD2.zip",
+                                    WALL + ["Pset_RoadDesignCriteriaCommon.xml"]),
+    }
+    by_version, locale_packs = psd.parse_archives(archives)
+
+    names = {v: sorted(p["name"] for p in psets) for v, psets in by_version.items()}
+    assert names == {
+        "IFC2X3": ["Pset_WallCommon", "Qto_WallBaseQuantities"],
+        "IFC4": ["Pset_PumpTypeCommon", "Pset_WallCommon", "Qto_WallBaseQuantities"],
+        "IFC4X3_ADD2": ["Pset_RoadDesignCriteriaCommon", "Pset_WallCommon",
+                        "Qto_WallBaseQuantities"],
+    }
+    versions = {p["name"]: p["ifcVersion"] for psets in by_version.values() for p in psets}
+    assert versions["Pset_WallCommon"] == ["IFC2X3", "IFC4", "IFC4X3_ADD2"]
+    assert versions["Pset_PumpTypeCommon"] == ["IFC4"]
+    assert versions["Pset_RoadDesignCriteriaCommon"] == ["IFC4X3_ADD2"]
+
+    assert "Pset_WallCommon" in locale_packs["de-DE"]
+    assert not any("localizations" in p for psets in by_version.values() for p in psets)
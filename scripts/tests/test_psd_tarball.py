@@ -0,0 +1,61 @@
+"""Fetching the PSD corpus as one streamed tarball (scripts/bench/local_github.py)."""
+
+import tarfile
+
+import pytest
+
+from ifc_schema import REPO_ROOT, load_script
+from local_github import LocalGitHub
+
+
+@pytest.fixture(scope="module")
+def psd():
+    return load_script(REPO_ROOT / "scripts" / "psd" / "fetch-and-parse-psd.py")
+
+
+@pytest.fixture
+def github():
+    with LocalGitHub(scale=3) as server:
+        yield server
+
+
+def member(name, type_=tarfile.REGTYPE):
+    info = tarfile.TarInfo(name)
+    info.type = type_
+    return info
+
+
+@pytest.mark.parametrize("name, type_, expected", [
+    ("repo-master/reference_schemas/psd/Pset_WallCommon.xml", tarfile.REGTYPE,
+     "Pset_WallCommon.xml"),
+    ("repo-abc123/reference_schemas/psd/Qto_WallBaseQuantities.xml", tarfile.REGTYPE,
+     "Qto_WallBaseQuantities.xml"),
+    ("repo-master/reference_schemas/psd/README.md", tarfile.REGTYPE, None),
+    ("repo-master/reference_schemas/psd/old/Pset_WallCommon.xml", tarfile.REGTYPE, None),
+    ("repo-master/reference_schemas/qto/Pset_WallCommon.xml", tarfile.REGTYPE, None),
+    ("reference_schemas/psd/Pset_WallCommon.xml", tarfile.REGTYPE, None),
+    ("repo-master/reference_schemas/psd/Pset_Link.xml", tarfile.SYMTYPE, None),
+    ("repo-master/reference_schemas/psd", tarfile.DIRTYPE, None),
+])
+def test_tarball_psd_name(psd, name, type_, expected):
+    assert psd.tarball_psd_name(member(name, type_)) == expected
+
+
+def test_tarball_matches_per_file_download(psd, github, monkeypatch):
+    monkeypatch.setattr(psd, "GITHUB_API_URL", github.api_url)
+    monkeypatch.setattr(psd, "GITHUB_RAW_BASE", github.raw_base)
+    monkeypatch.setattr(psd.time, "sleep", lambda seconds: None)
+    files = psd.fetch_file_list(cache_file=None)
+    per_file = psd.download_and_parse(files)
+
+    github.requests = 0
+    parsed, failed = psd.download_and_parse_tarball(github.tarball_url, workers=2)
+    assert github.requests == 1
+    assert failed == per_file[1]
+    assert sorted(parsed, key=lambda p: p["name"]) == \
+        sorted(per_file[0], key=lambda p: p["name"])
+    assert len(parsed) == len(github.file_names())
+
+
+def test_failed_tarball_download(psd, github):
+    assert psd.download_and_parse_tarball(github.base_url + "/missing") == ([], [])
@@ -0,0 +1,90 @@
+"""schema-index.json describes every generated file and only moves on change."""
+
+import json
+import shutil
+
+import pytest
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS
+from ifc_schema.docs_index import INDEX_FILE as DOCS_INDEX_FILE
+from ifc_schema.schema_index import (
+    build_schema_index, describe_generated, generated_timestamp, index_from_files,
+    read_schema_index,
+)
+from ifc_schema.snapshot import write_snapshots
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    for path in GENERATED_DIR.glob("*.json"):
+        shutil.copyfile(path, tmp_path / path.name)
+    return tmp_path
+
+
+def test_committed_index_is_current():
+    committed = read_schema_index(GENERATED_DIR)
+    assert index_from_files(GENERATED_DIR) == committed
+    assert set(committed["versions"]) == set(IFC_VERSIONS)
+
+
+def test_every_file_is_described(schema_dir):
+    (schema_dir / "psd-locale-de-DE.json").write_text(json.dumps(
+        {"locale": "de-DE", "propertySets": {"Pset_WallCommon": {}, "Pset_DoorCommon": {}}}))
+    (schema_dir / "pset-layer-acme.json").write_text(json.dumps(
+        {"layer": "acme", "versions": {"IFC4": {"Pset_AcmeWall": {}}}}))
+    write_snapshots(schema_dir)
+
+    files = describe_generated(schema_dir)
+    expected = {p.name for p in schema_dir.glob("*.json")} - {"schema-index.json"}
+    assert set(files) == expected | {f"schema-snapshot-{v.lower()}.bin" for v in IFC_VERSIONS}
+
+    entities = files["entities-ifc4.json"]
+    assert entities["kind"] == "entities" and entities["version"] == "IFC4"
+    with open(schema_dir / "entities-ifc4.json") as f:
+        assert entities["records"] == len(json.load(f))
+    assert entities["bytes"] == (schema_dir / "entities-ifc4.json").stat().st_size
+
+    assert files["psd-locale-de-DE.json"]["locale"] == "de-DE"
+    assert files["psd-locale-de-DE.json"]["records"] == 2
+    assert files["pset-layer-acme.json"]["layer"] == "acme"
+    assert files["pset-layer-acme.json"]["records"] == 1
+    with open(schema_dir / DOCS_INDEX_FILE) as f:
+        chunks = len(json.load(f)["chunks"])
+    docs = files[DOCS_INDEX_FILE]
+    assert (docs["kind"], docs["records"]) == ("docs-index", chunks)
+    assert "version" not in docs
+    snapshot = files["schema-snapshot-ifc4.bin"]
+    assert snapshot["kind"] == "schema-snapshot" and snapshot["sections"]
+
+
+def test_missing_files_are_left_out(schema_dir):
+    (schema_dir / "fuzzy-ifc4.json").unlink()
+    (schema_dir / DOCS_INDEX_FILE).unlink()
+    files = describe_generated(schema_dir)
+    assert "fuzzy-ifc4.json" not in files and DOCS_INDEX_FILE not in files
+    assert "fuzzy-ifc2x3.json" in files
+
+
+def test_known_counts_are_reused(schema_dir):
+    previous = {"files": describe_generated(schema_dir)}
+    previous["files"]["entities-ifc4.json"]["records"] = 12345
+    files = describe_generated(schema_dir, records={"entities-ifc2x3.json": 7},
+                               previous=previous)
+    # Same digest as the previous index: its count is trusted, not recounted.
+    assert files["entities-ifc4.json"]["records"] == 12345
+    assert files["entities-ifc2x3.json"]["records"] == 7
+    (schema_dir / "entities-ifc4.json").write_text("[1, 2]")
+    assert describe_generated(schema_dir, previous=previous)["entities-ifc4.json"]["records"] == 2
+
+
+def test_timestamp_only_moves_on_change(monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    first = build_schema_index({"IFC4": 1}, {"IFC4": 2})
+    first["lastGenerated"] = "2020-01-01T00:00:00.000Z"
+    assert build_schema_index({"IFC4": 1}, {"IFC4": 2}, previous=first)["lastGenerated"] == \
+        "2020-01-01T00:00:00.000Z"
+    assert build_schema_index({"IFC4": 1}, {"IFC4": 3}, previous=first)["lastGenerated"] != \
+        "2020-01-01T00:00:00.000Z"
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert generated_timestamp(first, first) == "2023-11-14T22:13:20.000Z"
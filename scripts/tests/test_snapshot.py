@@ -0,0 +1,79 @@
+"""The binary snapshot answers every lookup the same as ``SchemaIndex``."""
+
+import shutil
+
+import pytest
+
+from ifc_schema import GENERATED_DIR, IFC_VERSIONS
+from ifc_schema.audit import SchemaIndex
+from ifc_schema.output import file_info
+from ifc_schema.snapshot import SOURCE_KINDS, open_snapshot, write_snapshots
+
+
+@pytest.fixture(scope="module")
+def schema_dir(tmp_path_factory):
+    """The committed JSON sources with snapshots freshly built from them."""
+    path = tmp_path_factory.mktemp("schema")
+    for version in IFC_VERSIONS:
+        for kind in SOURCE_KINDS:
+            name = f"{kind}-{version.lower()}.json"
+            shutil.copyfile(GENERATED_DIR / name, path / name)
+    write_snapshots(path)
+    return path
+
+
+@pytest.fixture(scope="module", params=IFC_VERSIONS)
+def indexes(request, schema_dir):
+    snapshot = open_snapshot(request.param, schema_dir)
+    assert snapshot is not None
+    yield SchemaIndex(request.param, schema_dir), snapshot
+    snapshot.close()
+
+
+def test_entities(indexes):
+    index, snapshot = indexes
+    assert len(snapshot.entities) == len(index.entities)
+    for name in index.entities:
+        assert name in snapshot.entities
+        assert name.title() in snapshot.entities
+        # Occurrence names fall back to their ...TYPE entity.
+        for entity in (name, name.removesuffix("TYPE")):
+            assert snapshot.predefined_types_for(entity) == index.predefined_types_for(entity)
+    assert "IFCNOTANENTITY" not in snapshot.entities
+    assert snapshot.predefined_types_for("IfcNotAnEntity") == set()
+
+
+def test_property_sets(indexes):
+    index, snapshot = indexes
+    assert len(snapshot.property_sets) == len(index.property_sets)
+    for pset, prop in index.scoped_data_types:
+        assert pset in snapshot.property_sets
+        for name in (prop, prop.lower(), f"Some Label [{prop}]", prop + "X"):
+            assert snapshot.expected_data_types(pset, name) == index.expected_data_types(pset, name)
+    assert snapshot.expected_data_types("Pset_NotAPropertySet", "Status") is None
+
+
+def test_datatypes(indexes):
+    index, snapshot = indexes
+    types = index.datatypes.types
+    for a in types:
+        assert snapshot.is_valid_data_type(a)
+        assert snapshot.is_valid_data_type(a.lower())
+        assert snapshot.data_type_category(a) == index.datatypes.category(a)
+    # Every row of the bitset against a third of the columns.
+    for a in types:
+        for b in types[::3]:
+            assert snapshot.are_data_types_compatible(a, b) == index.are_data_types_compatible(a, b)
+    assert not snapshot.is_valid_data_type("IFCNOTATYPE")
+    assert snapshot.are_data_types_compatible("IFCNOTATYPE", types[0])
+
+
+def test_stale_snapshot_is_not_used(schema_dir):
+    version = IFC_VERSIONS[0]
+    names = [f"{kind}-{version.lower()}.json" for kind in SOURCE_KINDS]
+    sources = {name: file_info(schema_dir / name)["sha256"] for name in names}
+    current = open_snapshot(version, schema_dir, sources)
+    assert current is not None
+    current.close()
+    stale = dict(sources, **{f"property-sets-{version.lower()}.json": "0" * 64})
+    assert open_snapshot(version, schema_dir, stale) is None